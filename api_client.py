@@ -6,9 +6,31 @@ Provides a unified interface to switch between providers easily
 
 import os
 import json
-from typing import Optional, Dict, Any, List
+import mimetypes
+import threading
+import importlib.util
+from typing import Optional, Dict, Any, List, BinaryIO
+import httpx
 from openai import OpenAI
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def create_http_client() -> httpx.Client:
+    """
+    Create a pooled HTTP client so every request reuses open connections
+    instead of paying a new TLS handshake.
+    
+    One client can be shared by several API clients (pass it as http_client)
+    so that pipeline stages calling the same host reuse the same connections.
+    """
+    return httpx.Client(
+        http2=HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_keepalive_connections=16, max_connections=16),
+        timeout=httpx.Timeout(600.0, connect=10.0)
+    )
+
 
 class APIConfig:
     """Configuration for API providers"""
@@ -76,7 +98,8 @@ class UnifiedAPIClient:
         provider: Optional[str] = None,
         model: Optional[str] = None,
         api_key: Optional[str] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        http_client: Optional[httpx.Client] = None
     ):
         """
         Initialize the unified API client
@@ -86,10 +109,14 @@ class UnifiedAPIClient:
             model: Model name (defaults to APIConfig.DEFAULT_TRANSCRIPTION_MODEL)
             api_key: API key for the provider
             verbose: Enable verbose logging
+            http_client: Shared connection pool for OpenAI-compatible requests;
+                owned by the caller and not closed by close() (a private pool
+                is created if None)
         """
         self.provider = provider or APIConfig.DEFAULT_PROVIDER
         self.model = model or APIConfig.DEFAULT_TRANSCRIPTION_MODEL
         self.verbose = verbose
+        self._shared_http_client = http_client
         
         # Validate provider
         if self.provider not in APIConfig.PROVIDERS:
@@ -113,13 +140,18 @@ class UnifiedAPIClient:
         if not self.api_key:
             raise ValueError(f"API key required for {self.provider}. Set {self.provider.upper()}_API_KEY environment variable")
         
+        # Long-lived clients (one connection pool each), created lazily and reused
+        self._clients_lock = threading.Lock()
+        self._gemini_clients: Dict[str, Any] = {}
+        self._transcription_client: Optional[OpenAI] = None
+        
         # Initialize client based on provider
         if self.provider == "gemini":
             # For Gemini, we'll initialize the client when needed in the transcription method
             self.client = None
         else:
             # Initialize OpenAI client with provider-specific configuration for OpenAI/OpenRouter
-            client_kwargs = {"api_key": self.api_key}
+            client_kwargs = {"api_key": self.api_key, "http_client": self._http_client()}
             
             if self.provider_config["base_url"]:
                 client_kwargs["base_url"] = self.provider_config["base_url"]
@@ -130,6 +162,50 @@ class UnifiedAPIClient:
             print(f"🔑 Initialized {self.provider} API client")
             print(f"🤖 Using model: {self.model}")
     
+    def _get_gemini_client(self, api_key: str) -> Any:
+        """
+        Return the cached Gemini client for api_key, creating it on first use
+        """
+        from google import genai
+        
+        with self._clients_lock:
+            gemini_client = self._gemini_clients.get(api_key)
+            if gemini_client is None:
+                gemini_client = genai.Client(api_key=api_key)
+                self._gemini_clients[api_key] = gemini_client
+        return gemini_client
+    
+    def _http_client(self) -> httpx.Client:
+        """
+        Return the shared HTTP client, or a new private pool
+        """
+        return self._shared_http_client or create_http_client()
+    
+    def _get_transcription_client(self, api_key: str) -> OpenAI:
+        """
+        Return the cached OpenAI client used for transcription fallback
+        """
+        with self._clients_lock:
+            if self._transcription_client is None:
+                self._transcription_client = OpenAI(
+                    api_key=api_key,
+                    http_client=self._http_client()
+                )
+        return self._transcription_client
+    
+    def close(self):
+        """
+        Close pooled HTTP connections held by this client
+        """
+        with self._clients_lock:
+            # A shared HTTP client stays open for the other API clients using it
+            if self._shared_http_client is None:
+                for openai_client in (self.client, self._transcription_client):
+                    if openai_client is not None:
+                        openai_client.close()
+            self._transcription_client = None
+            self._gemini_clients.clear()
+    
     def _get_provider_model(self, model: Optional[str] = None) -> str:
         """
         Convert model name to provider-specific format
@@ -207,7 +283,7 @@ class UnifiedAPIClient:
             except ImportError:
                 raise ValueError("google-genai package required for Gemini. Install with: pip install google-genai")
             
-            gemini_client = genai.Client(api_key=self.api_key)
+            gemini_client = self._get_gemini_client(self.api_key)
             
             # Convert messages to Gemini format
             contents = []
@@ -262,26 +338,29 @@ class UnifiedAPIClient:
         language: Optional[str] = None,
         prompt: Optional[str] = None,
         response_format: str = "json",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        file_obj: Optional[BinaryIO] = None
     ) -> Any:
         """
         Create audio transcription - supports OpenAI and Gemini
+        
+        If file_obj is given, its contents are uploaded instead of reading
+        file_path from disk; file_path then only names the upload.
         """
         # For Gemini, use chat completions instead of audio transcriptions
         if self.provider == "gemini":
             return self._gemini_audio_transcription(
-                file_path, model, language, prompt, response_format, temperature
+                file_path, model, language, prompt, response_format, temperature, file_obj
             )
         
         # For non-OpenAI providers, fall back to OpenAI for transcription
         if self.provider != "openai":
-            # Create temporary OpenAI client for transcription
+            # Reuse a dedicated OpenAI client for transcription
             openai_key = os.getenv("OPENAI_API_KEY")
             if not openai_key:
                 raise ValueError("OpenAI API key required for transcription. Set OPENAI_API_KEY environment variable")
             
-            temp_client = OpenAI(api_key=openai_key)
-            client_to_use = temp_client
+            client_to_use = self._get_transcription_client(openai_key)
             # Use OpenAI model for transcription when falling back
             model_to_use = model or "gpt-4o-transcribe"
         else:
@@ -291,7 +370,6 @@ class UnifiedAPIClient:
         # Prepare parameters
         params = {
             "model": model_to_use,
-            "file": open(file_path, "rb"),
             "response_format": response_format,
             "temperature": temperature,
         }
@@ -305,15 +383,16 @@ class UnifiedAPIClient:
         if self.verbose:
             print(f"📞 Making transcription API call with model {model_to_use}")
         
-        try:
+        # Pass an open file object (not a path or bytes, which the SDK reads into
+        # memory) so httpx streams the multipart body from disk in small blocks
+        file_name = os.path.basename(file_path)
+        mime_type = mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        if file_obj is not None:
+            params["file"] = (file_name, file_obj, mime_type)
+            return client_to_use.audio.transcriptions.create(**params)
+        with open(file_path, "rb") as audio_file:
+            params["file"] = (file_name, audio_file, mime_type)
             return client_to_use.audio.transcriptions.create(**params)
-        finally:
-            # Ensure file is closed
-            if 'file' in params:
-                try:
-                    params['file'].close()
-                except:
-                    pass
     
     def _gemini_audio_transcription(
         self,
@@ -322,7 +401,8 @@ class UnifiedAPIClient:
         language: Optional[str] = None,
         prompt: Optional[str] = None,
         response_format: str = "json",
-        temperature: float = 0.0
+        temperature: float = 0.0,
+        file_obj: Optional[BinaryIO] = None
     ) -> Any:
         """
         Handle audio transcription using Gemini's native SDK approach
@@ -344,10 +424,15 @@ class UnifiedAPIClient:
             raise ValueError("GEMINI_API_KEY environment variable required")
         
         try:
-            gemini_client = genai.Client(api_key=api_key)
+            gemini_client = self._get_gemini_client(api_key)
             
             # Upload the audio file to Gemini
-            uploaded_file = gemini_client.files.upload(file=file_path)
+            if file_obj is not None:
+                # Streams have no file name to infer the type from
+                mime_type = mimetypes.guess_type(file_path)[0] or "audio/mpeg"
+                uploaded_file = gemini_client.files.upload(file=file_obj, config={"mime_type": mime_type})
+            else:
+                uploaded_file = gemini_client.files.upload(file=file_path)
             
             # Create detailed transcription prompt for consistency
             base_prompt = """Generate an accurate, word-for-word transcript of the speech. Follow these strict formatting rules:
@@ -390,14 +475,15 @@ class UnifiedAPIClient:
         except Exception as e:
             if self.verbose:
                 print(f"❌ Gemini transcription failed: {e}")
-            raise ValueError(f"Gemini audio transcription failed: {e}")
+            raise ValueError(f"Gemini audio transcription failed: {e}") from e
 
 
 def create_api_client(
     provider: Optional[str] = None,
     model: Optional[str] = None,
     api_key: Optional[str] = None,
-    verbose: bool = False
+    verbose: bool = False,
+    http_client: Optional[httpx.Client] = None
 ) -> UnifiedAPIClient:
     """
     Factory function to create a unified API client
@@ -406,7 +492,8 @@ def create_api_client(
         provider=provider,
         model=model,
         api_key=api_key,
-        verbose=verbose
+        verbose=verbose,
+        http_client=http_client
     )
 
 
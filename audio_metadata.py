@@ -10,10 +10,30 @@ import uuid
 import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Union
 import re
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# "M:SS" or "H:MM:SS" duration strings written by the downloader
+DURATION_PATTERN = re.compile(r'^(?:(\d+):)?(\d+):(\d+)$')
+
+
+def parse_duration(duration: Optional[str]) -> int:
+    """Convert an "M:SS" / "H:MM:SS" duration string to seconds (0 if unknown)."""
+    match = DURATION_PATTERN.match(duration or "")
+    if not match:
+        return 0
+    hours, minutes, seconds = match.groups()
+    return int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+
 
 @dataclass
 class AudioMetadata:
@@ -32,6 +52,17 @@ class AudioMetadata:
     download_date: str
     audio_format: str
     audio_quality: str
+    duration_seconds: int = 0
+    
+    @cached_property
+    def formatted_upload_date(self) -> Optional[str]:
+        """Upload date as e.g. "January 02, 2024" (raw value if not YYYYMMDD, None if unknown)."""
+        if not self.upload_date:
+            return None
+        try:
+            return datetime.strptime(self.upload_date, '%Y%m%d').strftime('%B %d, %Y')
+        except ValueError:
+            return self.upload_date
     
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -40,6 +71,9 @@ class AudioMetadata:
     @classmethod
     def from_dict(cls, data: dict) -> 'AudioMetadata':
         """Create from dictionary (JSON deserialization)."""
+        if "duration_seconds" not in data:
+            # Entries written before duration_seconds existed
+            data = {**data, "duration_seconds": parse_duration(data.get("duration"))}
         return cls(**data)
 
 
@@ -104,7 +138,8 @@ class AudioMetadataManager:
         audio_quality: str = "best",
         upload_date: Optional[str] = None,
         view_count: Optional[int] = None,
-        audio_id: Optional[str] = None
+        audio_id: Optional[str] = None,
+        duration_seconds: int = 0
     ) -> str:
         """
         Add metadata for new audio file.
@@ -121,6 +156,7 @@ class AudioMetadataManager:
             upload_date: Video upload date
             view_count: Video view count
             audio_id: Optional custom ID (generates if None)
+            duration_seconds: Audio duration in seconds (0 if unknown)
             
         Returns:
             Generated or provided audio ID
@@ -140,7 +176,8 @@ class AudioMetadataManager:
             file_size=file_size,
             download_date=datetime.now().isoformat(),
             audio_format=audio_format,
-            audio_quality=audio_quality
+            audio_quality=audio_quality,
+            duration_seconds=duration_seconds
         )
         
         self.metadata[audio_id] = metadata
@@ -296,8 +333,12 @@ class AudioMetadataManager:
                 for audio_id, metadata in self.metadata.items()
             }
             
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                with open(self.metadata_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.metadata_file, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
         except Exception as e:
             print(f"Warning: Failed to save metadata to {self.metadata_file}: {e}")
     
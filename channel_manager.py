@@ -20,10 +20,15 @@ from typing import Dict, List, Optional, Tuple
 
 import yt_dlp
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from downloader import YouTubeDownloader
 from transcriber import create_transcription_service, TranscriptionError
 from audio_metadata import create_metadata_manager
-from datetime import datetime
 
 
 CHANNEL_URL_PATTERNS = [
@@ -221,8 +226,13 @@ class ChannelManager:
     def _save_state(self, state: ChannelState, path: Path) -> None:
         path.parent.mkdir(parents=True, exist_ok=True)
         state.updated_at = _now_iso()
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
+        # Saved after every video, so large channels benefit from the C serializer
+        if ORJSON_AVAILABLE:
+            with open(path, "wb") as f:
+                f.write(orjson.dumps(state.to_dict(), option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
 
     def process(self, url: str, max_videos: Optional[int] = None, verbose: bool = False, translate_languages: Optional[List[str]] = None) -> None:
         state, channel_key, state_path = self.load_or_create_state(url)
@@ -306,7 +316,7 @@ class ChannelManager:
                         # Calculate statistics
                         word_count = len(trans_result.full_transcript.split())
                         char_count = len(trans_result.full_transcript)
-                        char_count_no_spaces = len(trans_result.full_transcript.replace(' ', ''))
+                        char_count_no_spaces = char_count - trans_result.full_transcript.count(' ')
 
                         with open(transcript_path, 'w', encoding='utf-8') as f:
                             f.write("="*80 + "\n")
@@ -320,12 +330,8 @@ class ChannelManager:
                                 f.write(f"URL: {video_metadata.original_url}\n")
                                 f.write(f"Uploader: {video_metadata.uploader}\n")
                                 f.write(f"Duration: {video_metadata.duration}\n")
-                                if video_metadata.upload_date:
-                                    try:
-                                        upload_date = datetime.strptime(video_metadata.upload_date, '%Y%m%d').strftime('%B %d, %Y')
-                                        f.write(f"Upload Date: {upload_date}\n")
-                                    except:
-                                        f.write(f"Upload Date: {video_metadata.upload_date}\n")
+                                if video_metadata.formatted_upload_date:
+                                    f.write(f"Upload Date: {video_metadata.formatted_upload_date}\n")
                                 if video_metadata.view_count:
                                     f.write(f"Views: {video_metadata.view_count:,}\n")
                                 f.write(f"Audio Format: {video_metadata.audio_format.upper()}\n")
@@ -355,20 +361,9 @@ class ChannelManager:
                             f.write(f"Total Words: {word_count:,}\n")
                             f.write(f"Total Characters: {char_count:,}\n")
                             f.write(f"Characters (no spaces): {char_count_no_spaces:,}\n")
-                            if video_metadata and video_metadata.duration:
-                                try:
-                                    duration_parts = video_metadata.duration.split(':')
-                                    if len(duration_parts) == 2:
-                                        total_minutes = int(duration_parts[0]) + int(duration_parts[1]) / 60
-                                    elif len(duration_parts) == 3:
-                                        total_minutes = int(duration_parts[0]) * 60 + int(duration_parts[1]) + int(duration_parts[2]) / 60
-                                    else:
-                                        total_minutes = 0
-                                    if total_minutes > 0:
-                                        words_per_minute = word_count / total_minutes
-                                        f.write(f"Words per Minute: {words_per_minute:.1f}\n")
-                                except:
-                                    pass
+                            if video_metadata and video_metadata.duration_seconds:
+                                words_per_minute = word_count / (video_metadata.duration_seconds / 60.0)
+                                f.write(f"Words per Minute: {words_per_minute:.1f}\n")
                             f.write("\n")
 
                             f.write("="*80 + "\n")
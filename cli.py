@@ -9,8 +9,7 @@ This module implements the main CLI using Click framework.
 import os
 import sys
 import time
-import json
-from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -21,7 +20,7 @@ from downloader import YouTubeDownloader, DownloadResult, DownloadError
 from audio_metadata import create_metadata_manager
 from transcriber import create_transcription_service, TranscriptionError
 from entity_detector import create_entity_detector, EntityDetectionError
-from entity_reviewer import create_entity_reviewer
+from entity_reviewer import create_entity_reviewer, extract_transcript_body, save_entities_file
 from translator_normalizer import create_translator_normalizer
 from api_client import DEFAULT_TRANSCRIPTION_MODEL, DEFAULT_TEXT_MODEL, VALID_TRANSCRIPTION_MODELS
 from channel_manager import ChannelManager, is_channel_url
@@ -30,10 +29,13 @@ from channel_manager import ChannelManager, is_channel_url
 load_dotenv('.env.local')
 
 
+@lru_cache(maxsize=1)
 def ensure_output_directory() -> Path:
     """
     Ensure the output directory exists and return its path.
     
+    Memoized: the directory is created once per process.
+    
     Returns:
         Path object for the output directory
     """
@@ -471,6 +473,12 @@ def info(audio_id: str) -> None:
     is_flag=True,
     help="Skip translation step (used with --translate to use original text)"
 )
+@click.option(
+    "--parallel-chunks",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of chunks transcribed in parallel for long audio (default: TRANSCRIPTION_CONCURRENCY or 4)"
+)
 def transcribe(
     audio_input: str,
     model: str,
@@ -482,7 +490,8 @@ def transcribe(
     detect_entities: bool,
     review_entities: bool,
     translate: bool,
-    skip_translation: bool
+    skip_translation: bool,
+    parallel_chunks: Optional[int]
 ) -> None:
     """
     Transcribe audio using OpenAI's gpt-4o-transcribe models.
@@ -492,10 +501,11 @@ def transcribe(
     - A file path (e.g., audio.mp3)
     
     The system automatically optimizes file size and chunking strategy:
-    1. Videos >12 minutes: Auto-download in medium quality 
-    2. Files ≤25MB AND ≤12 minutes: Direct transcription (fastest)
-    3. Files >25MB: Audio compression 
-    4. Still >25MB OR >12 minutes: Intelligent chunking with minimal overlap
+    1. Files ≤25MB AND ≤12 minutes: Direct transcription (fastest)
+    2. Files >25MB: Audio compression 
+    3. Still >25MB OR >12 minutes: Intelligent chunking with minimal overlap
+       (compressed and split in one FFmpeg pass, each chunk transcribed as
+       soon as it is written)
     
     Optional processing pipeline:
     - --detect-entities: Detect named entities (people, places, etc.)
@@ -535,7 +545,8 @@ def transcribe(
         transcription_service = create_transcription_service(
             api_key=api_key_to_use,
             model=model,
-            verbose=verbose
+            verbose=verbose,
+            max_concurrency=parallel_chunks
         )
         
         # Perform transcription
@@ -549,32 +560,29 @@ def transcribe(
         )
         
         if result.success:
-            # Display success information
-            click.echo(click.style("✅ Transcription completed successfully!", fg="green"))
-            click.echo(f"🆔 Audio ID: {result.audio_id}")
-            click.echo(f"🤖 Model: {result.model_used}")
-            click.echo(f"⏱️  Processing time: {result.processing_time:.2f} seconds")
-            click.echo(f"📊 File size: {result.file_size_mb:.2f} MB")
+            # Display success information and the transcript in one write
+            summary = [
+                click.style("✅ Transcription completed successfully!", fg="green"),
+                f"🆔 Audio ID: {result.audio_id}",
+                f"🤖 Model: {result.model_used}",
+                f"⏱️  Processing time: {result.processing_time:.2f} seconds",
+                f"📊 File size: {result.file_size_mb:.2f} MB",
+            ]
             
             if result.optimization_applied:
-                click.echo(f"⚡ Optimization: {result.optimization_applied}")
+                summary.append(f"⚡ Optimization: {result.optimization_applied}")
             
             if result.total_chunks > 1:
-                click.echo(f"🧩 Chunks processed: {result.total_chunks}")
+                summary.append(f"🧩 Chunks processed: {result.total_chunks}")
                 if result.failed_chunks > 0:
-                    click.echo(
-                        click.style(f"⚠️  Failed chunks: {result.failed_chunks}", fg="yellow")
-                    )
+                    summary.append(click.style(f"⚠️  Failed chunks: {result.failed_chunks}", fg="yellow"))
             
             if result.language:
-                click.echo(f"🌐 Detected language: {result.language}")
+                summary.append(f"🌐 Detected language: {result.language}")
             
             # Display transcript
-            click.echo("\n" + "="*50)
-            click.echo("📝 TRANSCRIPT:")
-            click.echo("="*50)
-            click.echo(result.full_transcript)
-            click.echo("="*50)
+            summary += ["\n" + "="*50, "📝 TRANSCRIPT:", "="*50, result.full_transcript, "="*50]
+            click.echo("\n".join(summary))
             
             # Save to file in output directory
             if output:
@@ -582,6 +590,10 @@ def transcribe(
             else:
                 output_path = get_output_path(f"{result.audio_id}_transcript.txt")
             
+            # Text handed to the translator; None means read it back from output_path
+            transcript_text = result.full_transcript
+            transcript_word_count = None
+            
             try:
                 # Get video metadata for rich header information
                 metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
@@ -589,8 +601,9 @@ def transcribe(
                 
                 # Calculate word and character statistics
                 word_count = len(result.full_transcript.split())
+                transcript_word_count = word_count
                 char_count = len(result.full_transcript)
-                char_count_no_spaces = len(result.full_transcript.replace(' ', ''))
+                char_count_no_spaces = char_count - result.full_transcript.count(' ')
                 
                 with open(output_path, 'w', encoding='utf-8') as f:
                     f.write("="*80 + "\n")
@@ -605,13 +618,8 @@ def transcribe(
                         f.write(f"URL: {video_metadata.original_url}\n")
                         f.write(f"Uploader: {video_metadata.uploader}\n")
                         f.write(f"Duration: {video_metadata.duration}\n")
-                        if video_metadata.upload_date:
-                            # Format upload date nicely
-                            try:
-                                upload_date = datetime.strptime(video_metadata.upload_date, '%Y%m%d').strftime('%B %d, %Y')
-                                f.write(f"Upload Date: {upload_date}\n")
-                            except:
-                                f.write(f"Upload Date: {video_metadata.upload_date}\n")
+                        if video_metadata.formatted_upload_date:
+                            f.write(f"Upload Date: {video_metadata.formatted_upload_date}\n")
                         if video_metadata.view_count:
                             f.write(f"Views: {video_metadata.view_count:,}\n")
                         f.write(f"Audio Format: {video_metadata.audio_format.upper()}\n")
@@ -643,23 +651,10 @@ def transcribe(
                     f.write(f"Total Words: {word_count:,}\n")
                     f.write(f"Total Characters: {char_count:,}\n")
                     f.write(f"Characters (no spaces): {char_count_no_spaces:,}\n")
-                    if video_metadata and video_metadata.duration:
+                    if video_metadata and video_metadata.duration_seconds:
                         # Calculate words per minute if duration is available
-                        try:
-                            # Parse duration string (e.g., "33:29" or "1:23:45")
-                            duration_parts = video_metadata.duration.split(':')
-                            if len(duration_parts) == 2:  # MM:SS
-                                total_minutes = int(duration_parts[0]) + int(duration_parts[1]) / 60
-                            elif len(duration_parts) == 3:  # HH:MM:SS
-                                total_minutes = int(duration_parts[0]) * 60 + int(duration_parts[1]) + int(duration_parts[2]) / 60
-                            else:
-                                total_minutes = 0
-                            
-                            if total_minutes > 0:
-                                words_per_minute = word_count / total_minutes
-                                f.write(f"Words per Minute: {words_per_minute:.1f}\n")
-                        except:
-                            pass
+                        words_per_minute = word_count / (video_metadata.duration_seconds / 60.0)
+                        f.write(f"Words per Minute: {words_per_minute:.1f}\n")
                     f.write("\n")
                     
                     # Transcript Content
@@ -676,9 +671,13 @@ def transcribe(
                 
                 # Show segment information if verbose and multiple segments
                 if verbose and len(result.segments) > 1:
-                    click.echo(f"\n🧩 Segment details:")
-                    for i, segment in enumerate(result.segments):
-                        click.echo(f"  {i+1}. {segment.start_time:.1f}s-{segment.end_time:.1f}s: {segment.text[:50]}...")
+                    click.echo("\n".join([
+                        "\n🧩 Segment details:",
+                        *(
+                            f"  {i+1}. {segment.start_time:.1f}s-{segment.end_time:.1f}s: {segment.text[:50]}..."
+                            for i, segment in enumerate(result.segments)
+                        )
+                    ]))
                 
                 # Entity detection if requested (either explicit or via review)
                 if detect_entities or review_entities:
@@ -717,8 +716,7 @@ def transcribe(
                                 }
                             }
                             
-                            with open(entities_path, 'w', encoding='utf-8') as f:
-                                json.dump(entities_data, f, indent=2, ensure_ascii=False)
+                            save_entities_file(entities_path, entities_data)
                             
                             click.echo(f"💾 Entities saved to: {entities_path}")
                             
@@ -735,6 +733,9 @@ def transcribe(
                                     
                                     if review_result.success:
                                         if review_result.transcript_updated:
+                                            # The reviewed file now holds the corrected text
+                                            transcript_text = None
+                                            transcript_word_count = None
                                             click.echo(f"🔄 Transcript updated with {review_result.replacements_made} entity replacements")
                                         else:
                                             click.echo("📝 Entity review completed, no changes made")
@@ -785,7 +786,9 @@ def transcribe(
                     # Perform translation
                     translation_result = translator.translate_transcript(
                         transcript_file=output_path,
-                        skip_translation=skip_translation
+                        skip_translation=skip_translation,
+                        transcript_text=transcript_text,
+                        word_count=transcript_word_count
                     )
                     
                     if translation_result.success:
@@ -909,7 +912,7 @@ def entities(
         
         input_path = Path(input_file)
         
-        if input_path.exists() and input_path.is_file():
+        if input_path.is_file():
             # Input is a file path
             click.echo(f"📄 Reading transcript from: {input_path}")
             with open(input_path, 'r', encoding='utf-8') as f:
@@ -918,26 +921,16 @@ def entities(
         else:
             # Assume it's an audio ID, look for existing transcript
             possible_transcript = Path(f"{input_file}_transcript.txt")
-            if possible_transcript.exists():
-                click.echo(f"📄 Found transcript file: {possible_transcript}")
+            try:
                 with open(possible_transcript, 'r', encoding='utf-8') as f:
                     content = f.read()
-                    # Extract just the transcript content (after the last === line)
-                    lines = content.split('\n')
-                    transcript_start = -1
-                    for i, line in enumerate(lines):
-                        if '📝 TRANSCRIPT CONTENT:' in line:
-                            transcript_start = i + 2  # Skip the === line after
-                            break
-                    
-                    if transcript_start > 0:
-                        transcript_content = '\n'.join(lines[transcript_start:])
-                        # Remove ending markers
-                        if 'End of Transcript' in transcript_content:
-                            transcript_content = transcript_content.split('End of Transcript')[0]
-                        transcript_content = transcript_content.strip()
-                    else:
-                        transcript_content = content
+            except FileNotFoundError:
+                content = None
+            
+            if content is not None:
+                click.echo(f"📄 Found transcript file: {possible_transcript}")
+                # Extract just the transcript content (after the last === line)
+                transcript_content = extract_transcript_body(content)
                 audio_id = input_file
             else:
                 click.echo(
@@ -1001,8 +994,7 @@ def entities(
                 }
             }
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(entities_data, f, indent=2, ensure_ascii=False)
+            save_entities_file(output_path, entities_data)
             
             click.echo(f"\n💾 Entities saved to: {output_path}")
             
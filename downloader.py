@@ -36,6 +36,7 @@ class VideoInfo:
     view_count: Optional[int] = None
     description: Optional[str] = None
     video_id: str = ""
+    duration_seconds: int = 0
 
 
 @dataclass
@@ -62,14 +63,17 @@ class YouTubeDownloader:
     
     # YouTube URL patterns for validation
     YOUTUBE_REGEX_PATTERNS = [
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})',
+        r'(?:https?://)?(?:www\.|m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]{11})',
+        r'(?:https?://)?(?:www\.|m\.)?youtube\.com/embed/([a-zA-Z0-9_-]{11})',
+        r'(?:https?://)?(?:www\.|m\.)?youtube\.com/v/([a-zA-Z0-9_-]{11})',
         r'(?:https?://)?youtu\.be/([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})',
-        r'(?:https?://)?(?:www\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})',
+        r'(?:https?://)?(?:www\.|m\.)?youtube\.com/watch\?.*v=([a-zA-Z0-9_-]{11})',
+        r'(?:https?://)?(?:www\.|m\.)?youtube\.com/shorts/([a-zA-Z0-9_-]{11})',
     ]
     
+    # All patterns compiled into one alternation, matched once per URL
+    YOUTUBE_URL_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in YOUTUBE_REGEX_PATTERNS))
+    
     def __init__(
         self,
         output_directory: Optional[Union[str, Path]] = None,
@@ -170,12 +174,8 @@ class YouTubeDownloader:
         if not url or not isinstance(url, str):
             return False
         
-        # Check against all YouTube URL patterns
-        for pattern in self.YOUTUBE_REGEX_PATTERNS:
-            if re.match(pattern, url.strip()):
-                return True
-        
-        return False
+        # Check against all YouTube URL patterns (local check, no network)
+        return self.YOUTUBE_URL_RE.match(url.strip()) is not None
     
     def extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -187,11 +187,11 @@ class YouTubeDownloader:
         Returns:
             Video ID string or None if not found
         """
-        for pattern in self.YOUTUBE_REGEX_PATTERNS:
-            match = re.match(pattern, url.strip())
-            if match:
-                return match.group(1)
-        return None
+        match = self.YOUTUBE_URL_RE.match(url.strip())
+        if not match:
+            return None
+        # Exactly one alternative matched; its group holds the ID
+        return match.group(match.lastindex)
     
     def get_video_info(self, url: str) -> Optional[VideoInfo]:
         """
@@ -234,7 +234,8 @@ class YouTubeDownloader:
                     upload_date=info.get('upload_date'),
                     view_count=info.get('view_count'),
                     description=info.get('description', ''),
-                    video_id=info.get('id', '')
+                    video_id=info.get('id', ''),
+                    duration_seconds=int(info.get('duration') or 0)
                 )
                 
         except YtDlpDownloadError as e:
@@ -244,13 +245,15 @@ class YouTubeDownloader:
     
     def download_audio(
         self, 
-        url: str
+        url: str,
+        video_info: Optional[VideoInfo] = None
     ) -> DownloadResult:
         """
         Download audio from a YouTube video.
         
         Args:
             url: YouTube video URL
+            video_info: Info already fetched with get_video_info (fetched if None)
             
         Returns:
             DownloadResult object containing download results
@@ -265,8 +268,9 @@ class YouTubeDownloader:
             )
         
         try:
-            # Get video info first
-            video_info = self.get_video_info(url)
+            # Get video info first (unless the caller already has it)
+            if video_info is None:
+                video_info = self.get_video_info(url)
             
             # Generate unique audio ID
             audio_id = self.metadata_manager.generate_audio_id()
@@ -299,7 +303,8 @@ class YouTubeDownloader:
                     file_path=str(output_file),
                     file_size=file_size,
                     audio_format=self.audio_format,
-                    audio_quality=self.audio_quality
+                    audio_quality=self.audio_quality,
+                    duration_seconds=video_info.duration_seconds if video_info else 0
                 )
                 
                 return DownloadResult(
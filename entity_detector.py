@@ -8,11 +8,13 @@ OpenAI's GPT-4.1 with Structured Outputs to ensure reliable JSON parsing.
 import json
 import re
 import time
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from typing import List, Optional, Dict
 
+import httpx
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 from api_client import create_api_client, DEFAULT_TEXT_MODEL
+from result_cache import SemanticCache, SEMANTIC_WINDOW_CHARS
 
 
 class EntityDetectionError(Exception):
@@ -45,20 +47,24 @@ class EntityDetector:
         model: str = DEFAULT_TEXT_MODEL,
         max_retries: int = 3,
         verbose: bool = False,
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        http_client: Optional[httpx.Client] = None
     ):
         self.api_key = api_key
         self.model = model
         self.max_retries = max_retries
         self.verbose = verbose
         self.provider = provider
+        self.semantic_cache = semantic_cache
         
         # Create unified API client
         self.client = create_api_client(
             provider=provider,
             model=model,
             api_key=api_key,
-            verbose=verbose
+            verbose=verbose,
+            http_client=http_client
         )
 
     def detect_entities(self, transcript: str) -> EntityDetectionResult:
@@ -76,17 +82,30 @@ class EntityDetector:
             )
 
         try:
-            chunks = self._create_text_chunks(transcript)
+            all_entities_from_chunks = []
+            windows: List[str] = []
+            if self.semantic_cache is not None:
+                # Reuse entities of passages already seen and
+                # only send the remaining windows to the API
+                pending_text, windows = self._apply_semantic_cache(transcript, all_entities_from_chunks)
+            else:
+                pending_text = transcript
+
+            chunks = self._create_text_chunks(pending_text) if pending_text else []
             if self.verbose:
                 print(f"🧩 Divided transcript into {len(chunks)} chunks for entity detection.")
 
-            all_entities_from_chunks = []
+            detected_entities = []
             for i, chunk in enumerate(chunks):
                 if self.verbose:
                     print(f"🔄 Processing chunk {i+1}/{len(chunks)} ({len(chunk)} chars)...")
                 
                 chunk_entities = self._extract_entities_from_chunk(chunk)
-                all_entities_from_chunks.extend(chunk_entities)
+                detected_entities.extend(chunk_entities)
+
+            if windows:
+                self._store_window_entities(windows, detected_entities)
+            all_entities_from_chunks.extend(detected_entities)
 
             unique_entities = self._merge_and_deduplicate_entities(all_entities_from_chunks)
 
@@ -104,6 +123,42 @@ class EntityDetector:
                 error_message=str(e)
             )
 
+    def _semantic_namespace(self) -> str:
+        return f"entities:{self.model}"
+
+    def _apply_semantic_cache(self, transcript: str, cached_entities: List[Entity]) -> tuple[str, List[str]]:
+        """
+        Look up each transcript window in the semantic cache.
+
+        Entities of cached windows are appended to cached_entities. Returns the
+        text of the uncached windows joined together, and those windows.
+        
+        A near-duplicate window can name different people, so windows are only
+        reused when their text is identical.
+        """
+        windows = self._create_text_chunks(transcript, max_chars=SEMANTIC_WINDOW_CHARS)
+        pending_windows = []
+        for window in windows:
+            cached = self.semantic_cache.get(self._semantic_namespace(), window, semantic=False)
+            if cached is not None:
+                cached_entities.extend(Entity(**entity) for entity in cached)
+            else:
+                pending_windows.append(window)
+
+        if self.verbose:
+            print(f"💾 Semantic cache: {len(windows) - len(pending_windows)}/{len(windows)} windows reused")
+        return " ".join(pending_windows), pending_windows
+
+    def _store_window_entities(self, windows: List[str], entities: List[Entity]) -> None:
+        """Cache, for each window, the detected entities whose name occurs in it."""
+        for window in windows:
+            window_lower = window.lower()
+            window_entities = [
+                asdict(entity) for entity in entities
+                if entity.name.strip().lower() in window_lower
+            ]
+            self.semantic_cache.put(self._semantic_namespace(), window, window_entities, semantic=False)
+
     def _create_text_chunks(self, text: str, max_chars: int = 8000) -> List[str]:
         """Splits text into chunks, respecting sentence boundaries."""
         sentences = re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s', text)
@@ -219,7 +274,9 @@ def create_entity_detector(
     model: str = DEFAULT_TEXT_MODEL,
     max_retries: int = 3,
     verbose: bool = False,
-    provider: Optional[str] = None
+    provider: Optional[str] = None,
+    semantic_cache: Optional[SemanticCache] = None,
+    http_client: Optional[httpx.Client] = None
 ) -> EntityDetector:
     """Factory function to create an EntityDetector instance."""
     return EntityDetector(
@@ -227,5 +284,7 @@ def create_entity_detector(
         model=model, 
         max_retries=max_retries, 
         verbose=verbose,
-        provider=provider
+        provider=provider,
+        semantic_cache=semantic_cache,
+        http_client=http_client
     ) 
\ No newline at end of file
@@ -5,17 +5,98 @@ This module provides an interactive CLI interface for reviewing and editing
 detected entities with find/replace functionality in transcript files.
 """
 
+import importlib.util
 import json
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 
+# inquirer is only needed for interactive prompts: check for it here and
+# import it where it is used, so non-interactive runs skip its import cost
+INQUIRER_AVAILABLE = importlib.util.find_spec("inquirer") is not None
+
 try:
-    import inquirer
-    INQUIRER_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    INQUIRER_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Write buffer for the json fallback, which emits many small fragments
+ENTITIES_BUFFER_SIZE = 1024 * 1024
+
+# Raw markers delimiting the transcript body in saved transcript files
+TRANSCRIPT_CONTENT_MARKER = '📝 TRANSCRIPT CONTENT:'.encode('utf-8')
+END_OF_TRANSCRIPT_MARKER = b'End of Transcript'
+
+# A single regex word character (the class \b is defined by)
+_WORD_CHAR_PATTERN = re.compile(r'\w')
+
+
+def save_entities_file(entities_file: Union[str, Path], data: Dict) -> None:
+    """
+    Write an entities JSON file (2-space indent, UTF-8), using orjson when installed.
+    
+    The data goes to a temporary file that is atomically renamed into place.
+    """
+    entities_file = Path(entities_file)
+    tmp_file = entities_file.with_name(entities_file.name + '.tmp')
+    try:
+        if ORJSON_AVAILABLE:
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(tmp_file, 'w', encoding='utf-8', buffering=ENTITIES_BUFFER_SIZE) as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_file, entities_file)
+    except BaseException:
+        tmp_file.unlink(missing_ok=True)
+        raise
+
+
+def extract_transcript_body(content: str) -> str:
+    """
+    Return the transcript text from a saved transcript file's content.
+    
+    The body starts after the === line that follows the TRANSCRIPT CONTENT
+    marker and ends at 'End of Transcript'. Content without the marker is
+    returned unchanged.
+    """
+    marker = content.find('📝 TRANSCRIPT CONTENT:')
+    if marker < 0:
+        return content
+    
+    # Skip the marker line and the === line after it
+    line_end = content.find('\n', marker)
+    if line_end >= 0:
+        line_end = content.find('\n', line_end + 1)
+    if line_end < 0:
+        return ''
+    start = line_end + 1
+    
+    end = content.find('End of Transcript', start)
+    return content[start:end if end >= 0 else len(content)].strip()
+
+
+def _find_whole_word(content: str, needle: str) -> bool:
+    """Return True if needle occurs in content delimited by word boundaries."""
+    if not needle:
+        return False
+    is_word_char = _WORD_CHAR_PATTERN.match
+    # Boundaries only constrain the edges of needle that are word characters
+    check_left = is_word_char(needle[0]) is not None
+    check_right = is_word_char(needle[-1]) is not None
+    pos = content.find(needle)
+    while pos >= 0:
+        end = pos + len(needle)
+        left_ok = not check_left or pos == 0 or not is_word_char(content, pos - 1)
+        right_ok = not check_right or end >= len(content) or not is_word_char(content, end)
+        if left_ok and right_ok:
+            return True
+        pos = content.find(needle, pos + 1)
+    return False
 
 
 @dataclass
@@ -35,6 +116,15 @@ class ReviewResult:
     replacements_made: int
     transcript_updated: bool
     error_message: Optional[str] = None
+    updated_transcript: Optional[str] = None
+
+
+@dataclass
+class LoadedTranscript:
+    """Data class for a transcript body and the raw file bytes around it."""
+    content: str
+    header_bytes: bytes = b''
+    footer_bytes: bytes = b''
 
 
 class EntityReviewer:
@@ -58,12 +148,15 @@ class EntityReviewer:
             )
         
         self.verbose = verbose
+        # Compiled alternation patterns keyed by (originals, flags), reused across sessions
+        self._pattern_cache: Dict[Tuple[Tuple[str, ...], int], re.Pattern] = {}
     
     def review_entities(
         self, 
         entities_file: Path, 
         transcript_file: Path,
-        skip_review: bool = False
+        skip_review: bool = False,
+        transcript_text: Optional[str] = None
     ) -> ReviewResult:
         """
         Start interactive entity review session.
@@ -72,6 +165,9 @@ class EntityReviewer:
             entities_file: Path to entities JSON file
             transcript_file: Path to transcript file to modify
             skip_review: If True, skip interactive review
+            transcript_text: Transcript already in memory; when given the file
+                is neither read nor written and the reviewed text is returned
+                in updated_transcript instead
             
         Returns:
             ReviewResult with session details
@@ -89,8 +185,11 @@ class EntityReviewer:
                 )
             
             # Load transcript
-            transcript_content = self._load_transcript(transcript_file)
-            if not transcript_content:
+            if transcript_text is not None:
+                loaded_transcript = LoadedTranscript(content=transcript_text.strip())
+            else:
+                loaded_transcript = self._load_transcript(transcript_file)
+            if not loaded_transcript.content:
                 return ReviewResult(
                     success=False,
                     reviews=[],
@@ -101,7 +200,13 @@ class EntityReviewer:
             
             print(f"\n🎯 Entity Review Session")
             print(f"📄 Transcript: {transcript_file.name}")
-            print(f"🔍 Entities found: {sum(len(entities) for entities in entities_data.values())}")
+            # Repeated names are reviewed once, so count unique names (as iterated)
+            total_entities = len({
+                entity['text'].lower()
+                for entities in entities_data.values()
+                for entity in entities
+            })
+            print(f"🔍 Entities found: {total_entities}")
             
             if skip_review:
                 print("⏭️  Skipping review - using original entities")
@@ -113,17 +218,18 @@ class EntityReviewer:
                 )
             
             # Interactive review
-            reviews = self._interactive_review_session(entities_data)
+            reviews = self._interactive_review_session(entities_data, total_entities)
             
             # Apply replacements
             updated_content, replacements_made = self._apply_replacements(
-                transcript_content, reviews
+                loaded_transcript.content, reviews
             )
             
             # Save updated transcript if changes were made
             transcript_updated = False
             if replacements_made > 0:
-                self._save_transcript(transcript_file, updated_content)
+                if transcript_text is None:
+                    self._save_transcript(transcript_file, loaded_transcript, updated_content)
                 transcript_updated = True
                 print(f"\n✅ Transcript updated with {replacements_made} replacements")
             else:
@@ -133,7 +239,8 @@ class EntityReviewer:
                 success=True,
                 reviews=reviews,
                 replacements_made=replacements_made,
-                transcript_updated=transcript_updated
+                transcript_updated=transcript_updated,
+                updated_transcript=updated_content if transcript_updated and transcript_text is not None else None
             )
             
         except Exception as e:
@@ -148,8 +255,9 @@ class EntityReviewer:
     def _load_entities(self, entities_file: Path) -> Dict[str, List[Dict]]:
         """Load entities from JSON file."""
         try:
-            with open(entities_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(entities_file, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
             
             return data.get('entities_by_type', {})
         except Exception as e:
@@ -157,47 +265,62 @@ class EntityReviewer:
                 print(f"Error loading entities: {e}")
             return {}
     
-    def _load_transcript(self, transcript_file: Path) -> str:
-        """Load transcript content from file."""
+    def _load_transcript(self, transcript_file: Path) -> LoadedTranscript:
+        """Load transcript content from file, keeping the surrounding header/footer bytes."""
         try:
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-            
-            # Extract just the transcript content (after TRANSCRIPT CONTENT marker)
-            lines = content.split('\n')
-            transcript_start = -1
-            
-            for i, line in enumerate(lines):
-                if '📝 TRANSCRIPT CONTENT:' in line:
-                    transcript_start = i + 2  # Skip the === line
-                    break
-            
-            if transcript_start > 0:
-                transcript_content = '\n'.join(lines[transcript_start:])
-                # Remove ending markers
-                if 'End of Transcript' in transcript_content:
-                    transcript_content = transcript_content.split('End of Transcript')[0]
-                return transcript_content.strip()
-            
-            # Fallback: return entire content if markers not found
-            return content
+            with open(transcript_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+                return self._slice_transcript(raw)
             
         except Exception as e:
             if self.verbose:
                 print(f"Error loading transcript: {e}")
-            return ""
+            return LoadedTranscript(content="")
     
-    def _interactive_review_session(self, entities_data: Dict[str, List[Dict]]) -> List[EntityReview]:
+    def _slice_transcript(self, raw: mmap.mmap) -> LoadedTranscript:
+        """Split a memory-mapped transcript file into header, body and footer."""
+        # Locate the TRANSCRIPT CONTENT marker and slice around it directly
+        marker = raw.find(TRANSCRIPT_CONTENT_MARKER)
+        if marker < 0:
+            # Fallback: return entire content if markers not found
+            return LoadedTranscript(content=raw[:].decode('utf-8'))
+        
+        # Body starts after the === line that follows the marker
+        start = raw.find(b'\n', marker) + 1
+        if start:
+            start = raw.find(b'\n', start) + 1
+        if not start:
+            start = len(raw)
+        
+        # Remove ending markers, keeping them as footer
+        end = raw.find(END_OF_TRANSCRIPT_MARKER, start)
+        if end >= 0:
+            line_start = raw.rfind(b'\n', start, end) + 1 or start
+            footer_bytes = b'\n\n' + raw[line_start:]
+        else:
+            end = len(raw)
+            footer_bytes = b'\n\n' + b'='*80 + b'\nEnd of Transcript\n' + b'='*80
+        
+        return LoadedTranscript(
+            content=raw[start:end].decode('utf-8').strip(),
+            header_bytes=raw[:start],
+            footer_bytes=footer_bytes
+        )
+    
+    def _interactive_review_session(
+        self,
+        entities_data: Dict[str, List[Dict]],
+        total_entities: int
+    ) -> List[EntityReview]:
         """Run interactive review session with navigation."""
+        import inquirer
+        
         reviews = []
         
-        # Flatten entities for easy navigation
-        all_entities = []
-        for entity_type, entities in entities_data.items():
-            for entity in entities:
-                all_entities.append((entity_type, entity['text']))
+        # Flatten entities lazily so quitting early skips the rest
+        all_entities = self._iter_unique_entities(entities_data)
         
-        if not all_entities:
+        if not total_entities:
             print("📝 No entities to review")
             return reviews
         
@@ -231,7 +354,7 @@ class EntityReviewer:
         
         # Review each entity
         for i, (entity_type, entity_text) in enumerate(all_entities):
-            print(f"\n📍 Entity {i+1}/{len(all_entities)}")
+            print(f"\n📍 Entity {i+1}/{total_entities}")
             print(f"🏷️  Type: {entity_type}")
             print(f"📝 Current: '{entity_text}'")
             
@@ -285,72 +408,107 @@ class EntityReviewer:
         
         return reviews
     
+    def _iter_unique_entities(
+        self,
+        entities_data: Dict[str, List[Dict]]
+    ) -> Iterator[Tuple[str, str]]:
+        """Yield (entity_type, text) pairs, skipping repeated names."""
+        seen = set()
+        for entity_type, entities in entities_data.items():
+            for entity in entities:
+                key = entity['text'].lower()
+                if key in seen:
+                    continue
+                seen.add(key)
+                yield entity_type, entity['text']
+    
     def _apply_replacements(
         self, 
         transcript_content: str, 
         reviews: List[EntityReview]
     ) -> Tuple[str, int]:
         """Apply entity replacements to transcript content."""
-        updated_content = transcript_content
-        replacements_made = 0
+        # One review per original (last non-identity review wins)
+        mapping = {
+            review.original.lower(): review
+            for review in reviews
+            if review.replacement != review.original
+        }
+        if not mapping:
+            # Every entity was kept as-is; skip lowercasing and matching entirely
+            return transcript_content, 0
         
-        for review in reviews:
-            if review.replacement != review.original:
-                # Use word boundary replacement to avoid partial matches
-                pattern = r'\b' + re.escape(review.original) + r'\b'
-                
-                # Count how many replacements will be made
-                matches = len(re.findall(pattern, updated_content, re.IGNORECASE))
-                
-                if matches > 0:
-                    # Case-preserving replacement
-                    updated_content = re.sub(
-                        pattern, 
-                        review.replacement, 
-                        updated_content, 
-                        flags=re.IGNORECASE
-                    )
-                    replacements_made += matches
-                    
-                    if self.verbose:
-                        print(f"Replaced '{review.original}' → '{review.replacement}' ({matches} times)")
+        # Plain substring search (C-level) drops originals that never occur
+        # as whole words, so the regex engine only runs for names present
+        lowered_content = transcript_content.lower()
+        mapping = {
+            key: review for key, review in mapping.items()
+            if _find_whole_word(lowered_content, key)
+        }
+        if not mapping:
+            return transcript_content, 0
+        
+        # Longest originals first so overlapping names prefer the longest match
+        keys = tuple(sorted(mapping, key=len, reverse=True))
+        counts: Dict[str, int] = {}
+        
+        def _replace(match: re.Match) -> str:
+            key = match.group(1).lower()
+            counts[key] = counts.get(key, 0) + 1
+            return mapping[key].replacement
+        
+        if len(lowered_content) != len(transcript_content):
+            # Lowercasing changed offsets; fall back to case-insensitive matching
+            pattern = self._get_pattern(keys, re.IGNORECASE)
+            updated_content, replacements_made = pattern.subn(_replace, transcript_content)
+        else:
+            # Match once against the lowercased copy and emit original-cased spans
+            pattern = self._get_pattern(keys)
+            parts = []
+            last = 0
+            for match in pattern.finditer(lowered_content):
+                parts.append(transcript_content[last:match.start()])
+                parts.append(_replace(match))
+                last = match.end()
+            parts.append(transcript_content[last:])
+            updated_content = ''.join(parts)
+            replacements_made = len(parts) // 2
+        
+        if self.verbose:
+            for key, matches in counts.items():
+                review = mapping[key]
+                print(f"Replaced '{review.original}' → '{review.replacement}' ({matches} times)")
         
         return updated_content, replacements_made
     
-    def _save_transcript(self, transcript_file: Path, updated_content: str):
-        """Save updated transcript back to file."""
+    def _get_pattern(self, keys: Tuple[str, ...], flags: int = 0) -> re.Pattern:
+        """Return the cached word-boundary alternation for keys, compiling on first use."""
+        cache_key = (keys, flags)
+        pattern = self._pattern_cache.get(cache_key)
+        if pattern is None:
+            pattern = re.compile(
+                r'\b(' + '|'.join(re.escape(key) for key in keys) + r')\b',
+                flags
+            )
+            self._pattern_cache[cache_key] = pattern
+        return pattern
+    
+    def _save_transcript(
+        self,
+        transcript_file: Path,
+        loaded_transcript: LoadedTranscript,
+        updated_content: str
+    ):
+        """Save updated transcript back to file, reusing the header/footer from load."""
         try:
-            # Read original file to preserve structure
-            with open(transcript_file, 'r', encoding='utf-8') as f:
-                original_content = f.read()
-            
-            # Replace only the transcript content section
-            lines = original_content.split('\n')
-            transcript_start = -1
-            transcript_end = -1
-            
-            for i, line in enumerate(lines):
-                if '📝 TRANSCRIPT CONTENT:' in line:
-                    transcript_start = i + 2
-                elif transcript_start > 0 and 'End of Transcript' in line:
-                    transcript_end = i
-                    break
-            
-            if transcript_start > 0:
-                # Rebuild file with updated content
-                new_lines = (
-                    lines[:transcript_start] + 
-                    updated_content.split('\n') +
-                    ([''] if transcript_end > 0 else []) +
-                    (lines[transcript_end:] if transcript_end > 0 else ['', '='*80, 'End of Transcript', '='*80])
-                )
-                
-                with open(transcript_file, 'w', encoding='utf-8') as f:
-                    f.write('\n'.join(new_lines))
-            else:
-                # Fallback: replace entire file content
-                with open(transcript_file, 'w', encoding='utf-8') as f:
-                    f.write(updated_content)
+            # Replace only the transcript content section, swapping the file in atomically
+            tmp_file = transcript_file.with_suffix(transcript_file.suffix + '.tmp')
+            tmp_file.write_bytes(
+                loaded_transcript.header_bytes +
+                updated_content.encode('utf-8') +
+                loaded_transcript.footer_bytes
+            )
+            os.replace(tmp_file, transcript_file)
                     
         except Exception as e:
             if self.verbose:
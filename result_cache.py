@@ -0,0 +1,232 @@
+"""
+Result Cache Module
+
+Content-addressed cache for expensive pipeline results (transcriptions, entity
+detection, translations). Entries are JSON files named by a hash of their input,
+so re-running the pipeline on the same audio or transcript skips the API calls.
+
+SemanticCache extends this to passages: results for 1-2 KB transcript windows
+are stored with a sentence embedding, so a near-duplicate passage in another
+video (intros, sponsor reads, boilerplate) reuses the earlier result.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+# sentence-transformers pulls in torch, which takes seconds to import: only
+# check for it here and import it when the first embedding is computed
+SEMANTIC_SEARCH_AVAILABLE = all(
+    importlib.util.find_spec(name) is not None for name in ("numpy", "sentence_transformers")
+)
+
+# Cache entries live under the output directory, one subdirectory per kind
+CACHE_DIR = Path("output/.cache")
+
+# Block size for hashing large audio files without loading them into memory
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Passage-level cache: SQLite file, window size and match settings
+SEMANTIC_CACHE_FILE = CACHE_DIR / "semantic.sqlite3"
+SEMANTIC_WINDOW_CHARS = 2000
+SEMANTIC_SIMILARITY_THRESHOLD = 0.95
+SEMANTIC_CACHE_TTL_DAYS = 30
+SEMANTIC_MODEL_NAME = "all-MiniLM-L6-v2"
+
+
+def sha256_file(file_path: Union[str, Path]) -> str:
+    """Return the SHA-256 hex digest of a file, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def sha256_text(text: str) -> str:
+    """Return the SHA-256 hex digest of a UTF-8 string."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    JSON result store keyed by content hash.
+
+    Reads never raise: a missing or unreadable entry is a cache miss. Writes go
+    to a temporary file that is atomically renamed into place, so an interrupted
+    run never leaves a truncated entry behind.
+    """
+
+    def __init__(self, namespace: str, cache_dir: Union[str, Path] = CACHE_DIR):
+        """
+        Initialize the cache.
+
+        Args:
+            namespace: Subdirectory for this kind of result (e.g. 'transcripts')
+            cache_dir: Root cache directory
+        """
+        self.directory = Path(cache_dir) / namespace
+
+    def _entry_path(self, key: str) -> Path:
+        return self.directory / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result for key, or None on a miss."""
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, data: Dict[str, Any]) -> None:
+        """Store a result for key, replacing any previous entry atomically."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+
+def create_result_cache(namespace: str, cache_dir: Union[str, Path] = CACHE_DIR) -> ResultCache:
+    """Factory function to create a ResultCache instance."""
+    return ResultCache(namespace, cache_dir)
+
+
+class SemanticCache:
+    """
+    Passage-level result cache with optional near-duplicate matching.
+
+    Lookups first try the exact passage (by hash). When sentence-transformers is
+    installed and the caller allows it, they then compare the passage embedding
+    with every stored one in the namespace (cosine similarity, brute force like
+    a FAISS flat index) and accept the best match above the threshold. Entries
+    older than the TTL are ignored and purged.
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path] = SEMANTIC_CACHE_FILE,
+        threshold: float = SEMANTIC_SIMILARITY_THRESHOLD,
+        ttl_days: float = SEMANTIC_CACHE_TTL_DAYS,
+        model_name: str = SEMANTIC_MODEL_NAME
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: SQLite file holding the entries
+            threshold: Minimum cosine similarity for a near-duplicate hit
+            ttl_days: Age after which entries expire
+            model_name: sentence-transformers model used for embeddings
+        """
+        self.db_path = Path(db_path)
+        self.threshold = threshold
+        self.ttl_seconds = ttl_days * 86400
+        self.model_name = model_name
+        self._model = None
+        self._lock = threading.Lock()
+        self._pending_embeddings: Dict[str, Any] = {}
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        with self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT, text_hash TEXT, embedding BLOB, payload TEXT, created_at REAL, "
+                "PRIMARY KEY (namespace, text_hash))"
+            )
+            self._connection.execute(
+                "DELETE FROM entries WHERE created_at < ?", (time.time() - self.ttl_seconds,)
+            )
+
+    def _embed(self, text: str) -> Optional[Any]:
+        """Return the unit-length embedding of text, or None without sentence-transformers."""
+        if not SEMANTIC_SEARCH_AVAILABLE:
+            return None
+        import numpy as np
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        return self._model.encode(text, normalize_embeddings=True).astype(np.float32)
+
+    def get(self, namespace: str, text: str, semantic: bool = True) -> Optional[Any]:
+        """
+        Return the stored result for text (or a near-duplicate of it), or None.
+
+        Args:
+            namespace: Kind of result, including anything it depends on
+                (e.g. model and target language)
+            text: Passage to look up
+            semantic: Also accept near-duplicates, not only the exact passage
+        """
+        text_hash = sha256_text(text)
+        min_created = time.time() - self.ttl_seconds
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM entries WHERE namespace = ? AND text_hash = ? AND created_at >= ?",
+                (namespace, text_hash, min_created)
+            ).fetchone()
+        if row is not None:
+            return json.loads(row[0])
+
+        if not semantic:
+            return None
+        embedding = self._embed(text)
+        if embedding is None:
+            return None
+        self._pending_embeddings[text_hash] = embedding
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT embedding, payload FROM entries "
+                "WHERE namespace = ? AND embedding IS NOT NULL AND created_at >= ?",
+                (namespace, min_created)
+            ).fetchall()
+        if not rows:
+            return None
+
+        import numpy as np
+        matrix = np.frombuffer(b"".join(blob for blob, _ in rows), dtype=np.float32)
+        similarities = matrix.reshape(len(rows), -1) @ embedding
+        best = int(similarities.argmax())
+        if similarities[best] < self.threshold:
+            return None
+        return json.loads(rows[best][1])
+
+    def put(self, namespace: str, text: str, payload: Any, semantic: bool = True) -> None:
+        """Store the result for a passage (with its embedding when semantic)."""
+        text_hash = sha256_text(text)
+        embedding = self._pending_embeddings.pop(text_hash, None)
+        if semantic and embedding is None:
+            embedding = self._embed(text)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (
+                    namespace,
+                    text_hash,
+                    embedding.tobytes() if semantic and embedding is not None else None,
+                    json.dumps(payload, ensure_ascii=False),
+                    time.time()
+                )
+            )
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._connection.close()
+
+
+def create_semantic_cache(**kwargs) -> SemanticCache:
+    """Factory function to create a SemanticCache instance."""
+    return SemanticCache(**kwargs)
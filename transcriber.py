@@ -7,23 +7,41 @@ and intelligent handling of both single files and chunked processing.
 """
 
 import os
+import sys
 import time
+import asyncio
 import base64
+import io
 import tempfile
 import shutil
-from dataclasses import dataclass
+import threading
+import weakref
+from contextlib import ExitStack
+from dataclasses import dataclass, asdict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Union, Tuple
+from typing import List, Optional, Dict, Any, Union, Tuple, Callable, Iterable, Iterator, AsyncIterable, AsyncIterator
 import json
 import logging
 import math
+import random
+import itertools
 
 try:
     import openai
-    from openai import OpenAI
+    from openai import (
+        OpenAI,
+        RateLimitError,
+        APITimeoutError,
+        APIConnectionError,
+        InternalServerError,
+    )
     OPENAI_AVAILABLE = True
+    # Transient OpenAI failures; every other openai.APIError is permanent
+    RETRYABLE_OPENAI_ERRORS = (RateLimitError, APITimeoutError, APIConnectionError, InternalServerError)
 except ImportError:
     OPENAI_AVAILABLE = False
+    RETRYABLE_OPENAI_ERRORS = ()
 
 try:
     from pydub import AudioSegment
@@ -31,8 +49,25 @@ try:
 except ImportError:
     PYDUB_AVAILABLE = False
 
+try:
+    import soundfile as sf
+    SOUNDFILE_AVAILABLE = True
+except ImportError:
+    SOUNDFILE_AVAILABLE = False
+
+try:
+    from mutagen import File as MutagenFile
+    MUTAGEN_AVAILABLE = True
+except ImportError:
+    MUTAGEN_AVAILABLE = False
+
+try:
+    from rapidfuzz import fuzz
+    RAPIDFUZZ_AVAILABLE = True
+except ImportError:
+    RAPIDFUZZ_AVAILABLE = False
+
 from audio_metadata import AudioMetadataManager, create_metadata_manager
-from downloader import YouTubeDownloader
 
 try:
     from api_client import create_api_client, DEFAULT_TRANSCRIPTION_MODEL, VALID_TRANSCRIPTION_MODELS
@@ -42,12 +77,347 @@ except ImportError:
     DEFAULT_TRANSCRIPTION_MODEL = "gemini-2.5-flash"  # Fallback
     VALID_TRANSCRIPTION_MODELS = ["gemini-2.5-flash", "gpt-4o-transcribe", "gpt-4o-mini-transcribe"]
 
+# Audio codecs the transcription APIs accept as-is, mapped to the container
+# extension used when stream-copying them out of a video file
+STREAM_COPY_EXTENSIONS = {
+    "aac": ".m4a",
+    "mp3": ".mp3",
+    "opus": ".ogg",
+    "vorbis": ".ogg",
+    "flac": ".flac",
+}
+
+# Speech-tuned Opus encoding (matches 64kbps MP3 for speech at 24kbps)
+SPEECH_OPUS_ARGS = [
+    "-c:a", "libopus",
+    "-b:a", "24k",            # 24kbps bitrate
+    "-ac", "1",               # Mono
+    "-ar", "16000",           # 16kHz sample rate
+    "-application", "voip",   # Tune the encoder for speech
+    "-vbr", "on",
+    "-frame_duration", "60",
+]
+
+# Codecs whose packets can be split into chunks as-is (no re-encode) when the
+# audio is already mono at a speech sample rate, mapped to the chunk extension
+SEGMENT_COPY_EXTENSIONS = {
+    "mp3": ".mp3",
+    "opus": ".ogg",
+}
+
+# Lossy codecs that can simply be re-encoded at a lower bitrate,
+# mapped to the FFmpeg encoder and container extension to use
+LOSSY_REENCODERS = {
+    "mp3": ("libmp3lame", ".mp3"),
+    "aac": ("aac", ".m4a"),
+    "vorbis": ("libvorbis", ".ogg"),
+    "opus": ("libopus", ".ogg"),
+}
+
+# Frames per soundfile block in the streaming fallbacks (libsndfile's Vorbis
+# encoder crashes on multi-million-frame writes, and small blocks keep memory flat)
+SOUNDFILE_BLOCK_FRAMES = 65536
+
+# How long a caller waits before checking again while a circuit breaker probe runs
+CIRCUIT_PROBE_POLL_SECONDS = 1.0
+
+# Metadata file written by the downloader
+METADATA_FILE = "downloads/audio_metadata.json"
+
+# Transcription API limit on audio duration (~23 minutes)
+MAX_DURATION_SECONDS = 1400
+
+# Characters per piece when streaming a transcript to disk
+TRANSCRIPT_WRITE_CHUNK_CHARS = 64 * 1024
+
+# Force chunking above 12 minutes so gpt-4o-transcribe stays under its max_tokens
+SAFE_DURATION_LIMIT = 720
+
+
+def _output_limited_chunk_seconds(max_output_tokens: int) -> float:
+    """
+    Longest chunk (seconds) whose transcript fits in max_output_tokens, capped
+    at the API duration limit.
+    """
+    # Each token ≈ 0.75 words, speech runs ~3 words per second (conservative,
+    # was 2.5), and only 60% of that budget is used: 2048 tokens ≈ 5.1 minutes
+    words_per_token = 0.75
+    words_per_second = 3.0
+    return min(MAX_DURATION_SECONDS, max_output_tokens * words_per_token / words_per_second * 0.60)
+
+
+# CRITICAL: gpt-4o-transcribe has a 2048 token OUTPUT limit; the same budget is
+# applied to every model so all of them chunk alike
+DEFAULT_MAX_OUTPUT_TOKENS = 2048
+MODEL_CHUNK_LIMITS = {
+    model: _output_limited_chunk_seconds(DEFAULT_MAX_OUTPUT_TOKENS)
+    for model in VALID_TRANSCRIPTION_MODELS
+}
+
+# Shortest audio the transcription API accepts; shorter trailing segments are
+# only container padding past the probed duration
+MIN_CHUNK_SECONDS = 0.1
+
+# Minimum rapidfuzz score for text at a chunk boundary to count as repeated
+OVERLAP_MATCH_THRESHOLD = 85
+# Upper bound on the characters compared at each chunk boundary
+OVERLAP_WINDOW_CHARS = 200
+
+# HTTP status codes worth retrying (rate limits and transient server errors)
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Message fragments that mark an error without a status code as transient
+RETRYABLE_ERROR_KEYWORDS = (
+    "timeout", "rate limit", "server error", "connection",
+    "429", "500", "502", "503", "504"
+)
+
 
 class TranscriptionError(Exception):
     """Custom exception for transcription-related errors."""
     pass
 
 
+class CircuitOpenError(TranscriptionError):
+    """Raised by CircuitBreaker.call while the circuit rejects calls."""
+    
+    def __init__(self, retry_after: float):
+        super().__init__("circuit open")
+        self.retry_after = retry_after
+
+
+def count_chunks(total_duration: float, max_chunk_duration: float) -> int:
+    """
+    Return the minimum number of chunks of at most max_chunk_duration seconds.
+    
+    Floor division with a small tolerance keeps exact multiples (2400s in 600s
+    chunks) from rounding up to an extra chunk on float noise.
+    """
+    return max(1, int((total_duration + max_chunk_duration - 1e-6) // max_chunk_duration))
+
+
+def advise_sequential_read(path: Union[str, Path]) -> None:
+    """
+    Hint the kernel that a file is about to be read front to back in full, so it
+    reads ahead aggressively before FFmpeg opens it. No-op where posix_fadvise
+    is unavailable (e.g. macOS, Windows).
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def segment_time_arg(segment_time: float) -> str:
+    """
+    Format a segment muxer duration, rounded up to the millisecond so the last
+    cut never leaves a sliver of audio as an extra segment.
+    """
+    return f"{math.ceil(segment_time * 1000) / 1000:.3f}"
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_has_encoder(encoder: str) -> bool:
+    """Check (once per process) whether the installed FFmpeg provides an encoder."""
+    import subprocess
+    
+    if not shutil.which("ffmpeg"):
+        return False
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10
+        )
+    except Exception:
+        return False
+    return any(line.split()[1:2] == [encoder] for line in result.stdout.splitlines())
+
+
+def get_progress_logger() -> logging.Logger:
+    """
+    Return the logger used for user-visible progress messages.
+    
+    Messages go to stderr without decoration: INFO for progress, DEBUG for the
+    verbose-mode details such as the periodic compression percentage.
+    """
+    progress_logger = logging.getLogger(f"{__name__}.progress")
+    if not progress_logger.handlers:
+        handler = logging.StreamHandler(sys.stderr)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        progress_logger.addHandler(handler)
+        progress_logger.setLevel(logging.INFO)
+        progress_logger.propagate = False
+    return progress_logger
+
+
+class CircuitBreaker:
+    """
+    In-process circuit breaker around the upstream transcription API.
+    
+    After failure_threshold consecutive failures the circuit trips OPEN and every
+    call fails fast for reset_timeout seconds. Then a single HALF_OPEN probe is let
+    through: success closes the circuit, failure opens it again. Rejected calls
+    raise CircuitOpenError with the time after which they may try again.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+    
+    def call(
+        self,
+        fn: Callable[[], Any],
+        counts_as_failure: Optional[Callable[[Exception], bool]] = None
+    ) -> Any:
+        """
+        Run fn through the breaker.
+        
+        Args:
+            fn: The call to protect
+            counts_as_failure: Decides whether an exception from fn trips the
+                breaker (all exceptions do if None)
+        
+        Raises:
+            CircuitOpenError: If the circuit is open or a probe is in flight
+        """
+        with self._lock:
+            if self.state == self.OPEN:
+                remaining = self.reset_timeout - (time.monotonic() - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(remaining)
+                self.state = self.HALF_OPEN
+            elif self.state == self.HALF_OPEN:
+                # A probe is already in flight
+                raise CircuitOpenError(min(CIRCUIT_PROBE_POLL_SECONDS, self.reset_timeout))
+            probe = self.state == self.HALF_OPEN
+        
+        try:
+            result = fn()
+        except Exception as e:
+            if counts_as_failure is not None and not counts_as_failure(e):
+                with self._lock:
+                    if probe:
+                        # The upstream answered: let the next caller probe again
+                        self.state = self.OPEN
+                        self._opened_at = time.monotonic() - self.reset_timeout
+                raise
+            with self._lock:
+                self._failures += 1
+                if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                    self.state = self.OPEN
+                    self._opened_at = time.monotonic()
+            raise
+        
+        with self._lock:
+            self._failures = 0
+            self.state = self.CLOSED
+        return result
+
+
+# Breakers shared by every TranscriptionService in the process
+_circuit_breakers: Dict[Tuple[str, int, float], CircuitBreaker] = {}
+_circuit_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(model: str, failure_threshold: int = 5, reset_timeout: float = 30.0) -> CircuitBreaker:
+    """Return the process-wide circuit breaker for a model and configuration."""
+    key = (model, failure_threshold, reset_timeout)
+    with _circuit_breakers_lock:
+        breaker = _circuit_breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(failure_threshold, reset_timeout)
+            _circuit_breakers[key] = breaker
+        return breaker
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket limiting how often the transcription API is called.
+    
+    Refills at rate_per_sec tokens per second up to capacity; acquire() blocks
+    until a token is available. A rate of 0 disables limiting.
+    """
+    
+    def __init__(self, rate_per_sec: float, capacity: float):
+        self.rate_per_sec = rate_per_sec
+        self.capacity = max(1.0, capacity)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> float:
+        """
+        Take one token, sleeping until it is available.
+        
+        Returns:
+            The number of seconds waited
+        """
+        if self.rate_per_sec <= 0:
+            return 0.0
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity,
+                self._tokens + (now - self._updated_at) * self.rate_per_sec
+            )
+            self._updated_at = now
+            # Reserve the token now (possibly going negative) so waiters queue fairly
+            self._tokens -= 1
+            wait = -self._tokens / self.rate_per_sec if self._tokens < 0 else 0.0
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+def default_max_concurrency() -> int:
+    """
+    Return how many chunks are transcribed in parallel when the caller does not
+    say, from TRANSCRIPTION_CONCURRENCY (default 4).
+    """
+    try:
+        return max(1, int(os.getenv("TRANSCRIPTION_CONCURRENCY", "4")))
+    except ValueError:
+        return 4
+
+
+@lru_cache(maxsize=None)
+def get_rate_limiter() -> TokenBucket:
+    """
+    Return the process-wide rate limiter for transcription API calls.
+    
+    Configured by TRANSCRIPTION_RPS (requests per second, 0 disables) and
+    TRANSCRIPTION_BURST (bucket capacity, defaults to the rate).
+    """
+    try:
+        rate_per_sec = float(os.getenv("TRANSCRIPTION_RPS", "8"))
+    except ValueError:
+        rate_per_sec = 8.0
+    try:
+        capacity = float(os.getenv("TRANSCRIPTION_BURST", str(rate_per_sec)))
+    except ValueError:
+        capacity = rate_per_sec
+    return TokenBucket(rate_per_sec, capacity)
+
+
 @dataclass
 class TranscriptionSegment:
     """
@@ -77,6 +447,55 @@ class TranscriptionResult:
     file_size_mb: float = 0.0
     optimization_applied: Optional[str] = None
     error_message: Optional[str] = None
+    
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: dict) -> 'TranscriptionResult':
+        """Create from dictionary (JSON deserialization)."""
+        segments = [TranscriptionSegment(**segment) for segment in data.get("segments", [])]
+        return cls(**{**data, "segments": segments})
+    
+    def iter_text(self, chunk_chars: int = TRANSCRIPT_WRITE_CHUNK_CHARS) -> Iterator[str]:
+        """Yield the transcript in pieces of at most chunk_chars characters."""
+        for start in range(0, len(self.full_transcript), chunk_chars):
+            yield self.full_transcript[start:start + chunk_chars]
+
+
+@dataclass
+class OptimizedAudio:
+    """
+    Data class describing the audio file chosen for transcription.
+    """
+    path: Path
+    optimization: Optional[str] = None
+    chunks: Optional[Iterable[Tuple[Any, float, float]]] = None
+    size_mb: Optional[float] = None
+
+
+@dataclass
+class AudioCodecInfo:
+    """
+    Data class with the properties of an audio stream that drive compression.
+    """
+    codec_name: str
+    sample_rate: Optional[int] = None
+    channels: Optional[int] = None
+    bit_rate: Optional[int] = None
+
+
+@dataclass
+class TranscriptionPlan:
+    """
+    Data class holding the size/duration facts that drive the transcription strategy.
+    """
+    duration_s: float
+    size_mb: float
+    needs_compression: bool
+    needs_chunking: bool
+    chunk_count: int = 1
 
 
 class TranscriptionService:
@@ -93,11 +512,16 @@ class TranscriptionService:
         model: str = DEFAULT_TRANSCRIPTION_MODEL,
         max_retries: int = 3,
         base_delay: float = 1.0,
+        max_backoff: float = 30.0,
         max_file_size_mb: float = 25.0,
         chunk_duration: float = 30.0,
         chunk_overlap: float = 0.5,
+        max_concurrency: Optional[int] = None,
+        cb_failure_threshold: int = 5,
+        cb_reset_timeout: float = 30.0,
         temp_dir: Optional[Path] = None,
-        verbose: bool = False
+        verbose: bool = False,
+        http_client: Optional[Any] = None
     ):
         """
         Initialize the transcription service.
@@ -107,11 +531,17 @@ class TranscriptionService:
             model: Model to use ("gemini-2.5-flash", "gpt-4o-transcribe" or "gpt-4o-mini-transcribe")
             max_retries: Maximum number of retry attempts for failed API calls
             base_delay: Base delay for exponential backoff (seconds)
+            max_backoff: Upper bound for a single backoff sleep (seconds)
             max_file_size_mb: Maximum file size for direct processing (MB)
             chunk_duration: Duration for audio chunks when needed (seconds)
             chunk_overlap: Overlap between chunks when needed (seconds)
+            max_concurrency: Maximum number of chunks transcribed in parallel
+                (defaults to TRANSCRIPTION_CONCURRENCY, or 4)
+            cb_failure_threshold: Consecutive API failures that open the circuit breaker
+            cb_reset_timeout: Seconds the circuit stays open before a probe call
             temp_dir: Directory for temporary files
             verbose: Enable detailed logging
+            http_client: httpx.Client shared with other pipeline stages (optional)
         """
         if not OPENAI_AVAILABLE:
             raise TranscriptionError(
@@ -128,25 +558,54 @@ class TranscriptionService:
             raise TranscriptionError(f"Invalid model: {model}")
         
         self.model = model
+        self._effective_duration_limit = MODEL_CHUNK_LIMITS[model]
         self.max_retries = max_retries
         self.base_delay = base_delay
+        self.max_backoff = max_backoff
         self.max_file_size_mb = max_file_size_mb
         self.chunk_duration = chunk_duration
         self.chunk_overlap = chunk_overlap
+        if max_concurrency is None:
+            max_concurrency = default_max_concurrency()
+        self.max_concurrency = max(1, max_concurrency)
         self.verbose = verbose
         
+        # Fail fast during upstream outages (shared across services and chunks)
+        self.circuit_breaker = get_circuit_breaker(model, cb_failure_threshold, cb_reset_timeout)
+        
+        # Keep parallel chunk uploads under the provider's request rate limit
+        self.rate_limiter = get_rate_limiter()
+        
+        # Audio durations keyed by (path, mtime_ns, size)
+        self._duration_cache: Dict[Tuple[str, int, int], float] = {}
+        
+        # Lazily loaded metadata manager and memoized input resolution
+        self._metadata_lock = threading.Lock()
+        self._metadata_manager: Optional[AudioMetadataManager] = None
+        self._metadata_mtime_ns: Optional[int] = None
+        self._resolved_inputs: Dict[Tuple[str, bool, Optional[int]], Tuple[Path, str]] = {}
+        
         # Set up temporary directory
         self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.mkdtemp())
         self.temp_dir.mkdir(parents=True, exist_ok=True)
         
+        # Resolve external tools once instead of walking PATH on every call
+        self._ffmpeg_path = shutil.which("ffmpeg")
+        self._ffprobe_path = shutil.which("ffprobe")
+        if not temp_dir:
+            # Remove our own temp directory even if cleanup_temp_dir() is never called
+            weakref.finalize(self, shutil.rmtree, str(self.temp_dir), ignore_errors=True)
+        
         # Initialize API client using UnifiedAPIClient
         # Import here to avoid circular imports
         from api_client import create_api_client
         
-        self.client = create_api_client(model=model, verbose=verbose)
+        self.client = create_api_client(model=model, verbose=verbose, http_client=http_client)
         
         # Set up logging
         self.logger = logging.getLogger(__name__)
+        self.progress = get_progress_logger()
+        self.progress.setLevel(logging.DEBUG if verbose else logging.INFO)
         if verbose:
             self.logger.setLevel(logging.DEBUG)
         
@@ -169,6 +628,9 @@ class TranscriptionService:
         """
         start_time = time.time()
         
+        # Temporary files created along the way are removed however this call ends
+        cleanup = ExitStack()
+        
         try:
             # Resolve audio file path
             audio_path, audio_id = self._resolve_audio_input(audio_input)
@@ -182,88 +644,63 @@ class TranscriptionService:
                     error_message=f"Audio file not found: {audio_path}"
                 )
             
-            # Check file size and apply optimization strategy
-            file_size_mb = audio_path.stat().st_size / (1024 * 1024)
+            # Measure size and duration once and derive the strategy from them
+            plan = self._plan_transcription(audio_path)
             
             if self.verbose:
                 self.logger.info(f"Processing audio file: {audio_path}")
-                self.logger.info(f"File size: {file_size_mb:.2f} MB")
+                self.logger.info(f"File size: {plan.size_mb:.2f} MB")
+                self.logger.info(f"Audio duration: {plan.duration_s:.1f} seconds ({plan.duration_s/60:.1f} minutes)")
                 
-            # Apply optimization strategy based on file size
-            optimized_path, optimization = self._optimize_audio_file(
-                audio_path, audio_id, file_size_mb
-            )
+            # Every temporary chunk of this job lives in one directory that is
+            # removed in a single rmtree when the job ends
+            job_dir = Path(tempfile.mkdtemp(prefix=f"job_{audio_id}_", dir=self.temp_dir))
+            cleanup.callback(shutil.rmtree, job_dir, ignore_errors=True)
             
-            final_file_size_mb = optimized_path.stat().st_size / (1024 * 1024)
-            
-            # Check audio duration (API limit: 1400 seconds = ~23 minutes)
-            # But we must chunk earlier due to token output limits
-            try:
-                duration_seconds = self._get_audio_duration_efficient(optimized_path)
-                max_duration_seconds = 1400  # API limit
-                # CRITICAL: For safety, force chunking for videos >12 minutes (720 seconds)
-                # This prevents exceeding gpt-4o-transcribe max_tokens even for shorter videos
-                safe_duration_limit = 720  # 12 minutes - much more conservative
-                
-                if self.verbose:
-                    self.logger.info(f"Audio duration: {duration_seconds:.1f} seconds ({duration_seconds/60:.1f} minutes)")
-                    
-            except Exception as e:
-                if self.verbose:
-                    self.logger.warning(f"Could not check duration: {e}")
-                duration_seconds = 0
-                max_duration_seconds = 1400
-                safe_duration_limit = 720
+            # Apply optimization strategy based on file size
+            optimized = self._optimize_audio_file(audio_path, audio_id, plan, job_dir)
+            optimized_path, optimization = optimized.path, optimized.optimization
+            if optimized_path != audio_path:
+                cleanup.callback(self._cleanup_temp_file, optimized_path)
+                # Compression changes the size but not the duration (an unchanged
+                # file keeps its plan, so nothing is measured twice)
+                plan = self._plan_transcription(optimized_path, plan.duration_s, optimized.size_mb)
             
             # Choose transcription strategy (check both size AND conservative duration)
             # ALWAYS chunk if video is >12 minutes, regardless of file size
-            if (final_file_size_mb <= self.max_file_size_mb and 
-                duration_seconds <= safe_duration_limit):
+            if not plan.needs_chunking:
                 # Direct transcription (optimal path - only for short videos ≤12 min)
                 if self.verbose:
-                    self.logger.info(f"Using direct transcription: {duration_seconds/60:.1f} min ≤ {safe_duration_limit/60:.1f} min safe limit")
+                    self.logger.info(f"Using direct transcription: {plan.duration_s/60:.1f} min ≤ {SAFE_DURATION_LIMIT/60:.1f} min safe limit")
                 result = self._transcribe_direct(
                     optimized_path, audio_id, language, prompt
                 )
             else:
                 # Chunked transcription (fallback for size OR duration)
-                import math
-                
-                # Calculate chunks needed and explain to user why chunking is required
-                chunks_needed = math.ceil(duration_seconds / safe_duration_limit) if duration_seconds > safe_duration_limit else 1
-                
+                # Explain to user why chunking is required
                 reasons = []
-                if final_file_size_mb > self.max_file_size_mb:
-                    reasons.append(f"file size {final_file_size_mb:.1f}MB exceeds API limit ({self.max_file_size_mb}MB)")
-                if duration_seconds > safe_duration_limit:
-                    reasons.append(f"duration {duration_seconds/60:.1f} minutes exceeds safe limit ({safe_duration_limit/60:.1f} minutes)")
-                if duration_seconds > max_duration_seconds:
-                    reasons.append(f"duration {duration_seconds/60:.1f} minutes exceeds absolute API limit ({max_duration_seconds/60:.1f} minutes)")
+                if plan.size_mb > self.max_file_size_mb:
+                    reasons.append(f"file size {plan.size_mb:.1f}MB exceeds API limit ({self.max_file_size_mb}MB)")
+                if plan.duration_s > SAFE_DURATION_LIMIT:
+                    reasons.append(f"duration {plan.duration_s/60:.1f} minutes exceeds safe limit ({SAFE_DURATION_LIMIT/60:.1f} minutes)")
+                if plan.duration_s > MAX_DURATION_SECONDS:
+                    reasons.append(f"duration {plan.duration_s/60:.1f} minutes exceeds absolute API limit ({MAX_DURATION_SECONDS/60:.1f} minutes)")
                 
                 reason_text = " and ".join(reasons)
                 print(f"📋 Using chunking strategy: {reason_text}")
-                # Note: Actual chunk count will be determined by ultra-conservative chunking strategy
                 
                 if self.verbose:
-                    if final_file_size_mb > self.max_file_size_mb:
-                        self.logger.info(f"Using chunking: file size {final_file_size_mb:.1f}MB > {self.max_file_size_mb}MB")
-                    if duration_seconds > safe_duration_limit:
-                        self.logger.info(f"Using chunking: duration {duration_seconds:.1f}s > {safe_duration_limit}s (safe limit)")
-                    if duration_seconds > max_duration_seconds:
-                        self.logger.info(f"Using chunking: duration {duration_seconds:.1f}s > {max_duration_seconds}s (absolute limit)")
+                    self.logger.info(f"Using chunking: {reason_text}")
                 
                 result = self._transcribe_chunked(
-                    optimized_path, audio_id, language, prompt
+                    optimized_path, audio_id, language, prompt,
+                    chunks=optimized.chunks, plan=plan, job_dir=job_dir
                 )
             
             # Add processing metadata
             result.processing_time = time.time() - start_time
-            result.file_size_mb = final_file_size_mb
+            result.file_size_mb = plan.size_mb
             result.optimization_applied = optimization
-            
-            # Cleanup temporary files if different from original
-            if optimized_path != audio_path:
-                self._cleanup_temp_file(optimized_path)
                 
             return result
             
@@ -276,8 +713,92 @@ class TranscriptionService:
                 processing_time=time.time() - start_time,
                 error_message=f"Transcription failed: {str(e)}"
             )
+        finally:
+            cleanup.close()
+    
+    def _plan_transcription(
+        self,
+        audio_path: Path,
+        duration_s: Optional[float] = None,
+        size_mb: Optional[float] = None
+    ) -> TranscriptionPlan:
+        """
+        Measure an audio file once and decide how it should be transcribed.
+        
+        Args:
+            audio_path: Audio file to measure
+            duration_s: Known duration, skips probing when given
+            size_mb: Known size in MB, skips the stat call when given
+            
+        Returns:
+            TranscriptionPlan with size, duration and the resulting strategy
+        """
+        # One stat serves both the size and the duration cache key
+        file_stat = None
+        if size_mb is None or duration_s is None:
+            file_stat = os.stat(audio_path)
+        if size_mb is None:
+            size_mb = file_stat.st_size / (1024 * 1024)
+        
+        if duration_s is None:
+            try:
+                duration_s = self._get_audio_duration_efficient(audio_path, file_stat)
+            except Exception as e:
+                if self.verbose:
+                    self.logger.warning(f"Could not check duration: {e}")
+                duration_s = 0.0
+        
+        needs_chunking = size_mb > self.max_file_size_mb or duration_s > SAFE_DURATION_LIMIT
+        chunk_count = 1
+        if needs_chunking and duration_s > 0:
+            chunk_count = count_chunks(duration_s, self._get_effective_duration_limit())
+        
+        return TranscriptionPlan(
+            duration_s=duration_s,
+            size_mb=size_mb,
+            needs_compression=size_mb > self.max_file_size_mb,
+            needs_chunking=needs_chunking,
+            chunk_count=chunk_count
+        )
+    
+    def _get_metadata_manager(self) -> AudioMetadataManager:
+        """
+        Return the shared metadata manager, reloading only when the file changed.
+        """
+        try:
+            mtime_ns = os.stat(METADATA_FILE).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        
+        with self._metadata_lock:
+            if self._metadata_manager is None or self._metadata_mtime_ns != mtime_ns:
+                self._metadata_manager = create_metadata_manager(METADATA_FILE)
+                self._metadata_mtime_ns = mtime_ns
+            return self._metadata_manager
     
     def _resolve_audio_input(self, audio_input: Union[str, Path]) -> Tuple[Path, str]:
+        """
+        Resolve audio input to file path and audio ID, memoized per input.
+        
+        Returns:
+            Tuple of (audio_path, audio_id)
+        """
+        input_str = str(audio_input)
+        try:
+            mtime_ns = os.stat(input_str).st_mtime_ns
+        except OSError:
+            mtime_ns = None
+        cache_key = (input_str, isinstance(audio_input, Path), mtime_ns)
+        
+        cached = self._resolved_inputs.get(cache_key)
+        if cached and cached[0].exists():
+            return cached
+        
+        resolved = self._resolve_audio_input_uncached(audio_input)
+        self._resolved_inputs[cache_key] = resolved
+        return resolved
+    
+    def _resolve_audio_input_uncached(self, audio_input: Union[str, Path]) -> Tuple[Path, str]:
         """
         Resolve audio input to file path and audio ID.
         For video files, extracts audio first to ensure efficient processing.
@@ -293,7 +814,7 @@ class TranscriptionService:
             
             # Try to resolve as audio ID
             try:
-                metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
+                metadata_manager = self._get_metadata_manager()
                 metadata = metadata_manager.get_metadata(audio_input_str)
                 
                 if metadata:
@@ -308,18 +829,19 @@ class TranscriptionService:
         # Check if this is a video file that needs audio extraction
         video_extensions = {'.mov', '.mp4', '.avi', '.mkv', '.webm', '.m4v', '.flv', '.wmv'}
         if input_path.suffix.lower() in video_extensions:
-            print(f"🎬 Detected video file: {input_path.name}")
-            print(f"📂 Original size: {input_path.stat().st_size / (1024 * 1024):.1f}MB")
+            self.progress.info(f"🎬 Detected video file: {input_path.name}")
+            original_size_mb = self._file_size_mb(input_path)
+            self.progress.info(f"📂 Original size: {original_size_mb:.1f}MB")
             
             # Extract audio to temporary location
             extracted_audio_path = self._extract_audio_from_video(input_path, audio_id)
             if extracted_audio_path:
-                extracted_size_mb = extracted_audio_path.stat().st_size / (1024 * 1024)
-                print(f"🎵 Extracted audio: {extracted_size_mb:.1f}MB")
-                print(f"📉 Size reduction: {100 * (1 - extracted_size_mb / (input_path.stat().st_size / (1024 * 1024))):.1f}%")
+                extracted_size_mb = self._file_size_mb(extracted_audio_path)
+                self.progress.info(f"🎵 Extracted audio: {extracted_size_mb:.1f}MB")
+                self.progress.info(f"📉 Size reduction: {100 * (1 - extracted_size_mb / original_size_mb):.1f}%")
                 return extracted_audio_path, audio_id
             else:
-                print("⚠️  Audio extraction failed, processing original file")
+                self.progress.warning("⚠️  Audio extraction failed, processing original file")
                 return input_path, audio_id
         
         # Return as-is for audio files
@@ -329,21 +851,49 @@ class TranscriptionService:
         """
         Extract audio from video file using FFmpeg.
         Similar to yt-dlp's audio extraction but for local files.
+        When the audio stream is already in an API-compatible codec it is
+        stream-copied (no re-encoding); otherwise it is re-encoded to MP3.
         
         Returns:
             Path to extracted audio file or None if extraction fails
         """
         import subprocess
-        import shutil
         
         try:
             # Check if FFmpeg is available
-            if not shutil.which("ffmpeg"):
+            if not self._ffmpeg_path:
                 if self.verbose:
                     self.logger.warning("FFmpeg not found, cannot extract audio from video")
                 return None
             
-            print("🎵 Extracting audio from video file...")
+            self.progress.info("🎵 Extracting audio from video file...")
+            
+            # Stream-copy the audio track when its codec is already accepted by the API
+            codec_name = self._probe_audio_codec(video_path)
+            copy_extension = STREAM_COPY_EXTENSIONS.get(codec_name)
+            if copy_extension:
+                extracted_audio_path = self.temp_dir / f"{audio_id}_extracted{copy_extension}"
+                cmd = [
+                    self._ffmpeg_path,
+                    "-i", str(video_path),
+                    "-vn",                # No video
+                    "-c:a", "copy",       # Keep the original audio packets
+                    "-y",                 # Overwrite
+                    str(extracted_audio_path)
+                ]
+                
+                if self.verbose:
+                    self.logger.info(f"Extracting audio ({codec_name}, stream copy): {' '.join(cmd)}")
+                self.progress.info(f"🔄 Copying {codec_name} audio track without re-encoding...")
+                
+                result = subprocess.run(cmd, capture_output=True, text=True)
+                if result.returncode == 0 and extracted_audio_path.exists():
+                    self.progress.info("✅ Audio extraction completed successfully")
+                    return extracted_audio_path
+                
+                if self.verbose:
+                    self.logger.warning(f"Stream copy failed, re-encoding instead: {result.stderr}")
+                extracted_audio_path.unlink(missing_ok=True)
             
             # Create output path in temp directory
             extracted_audio_path = self.temp_dir / f"{audio_id}_extracted.mp3"
@@ -356,7 +906,7 @@ class TranscriptionService:
             # -ar 44100: standard sample rate
             # -y: overwrite output
             cmd = [
-                "ffmpeg",
+                self._ffmpeg_path,
                 "-i", str(video_path),
                 "-vn",                # No video
                 "-acodec", "mp3",     # MP3 codec
@@ -378,7 +928,7 @@ class TranscriptionService:
             )
             
             # Simple progress indicator for extraction
-            print("🔄 Extracting audio (this is much faster than compression)...")
+            self.progress.info("🔄 Extracting audio (this is much faster than compression)...")
             
             # Wait for process to complete
             stdout, stderr = process.communicate()
@@ -387,198 +937,281 @@ class TranscriptionService:
             if process.returncode != 0:
                 if self.verbose:
                     self.logger.warning(f"FFmpeg extraction failed: {stderr}")
-                print(f"❌ Audio extraction failed (return code {process.returncode})")
+                self.progress.warning(f"❌ Audio extraction failed (return code {process.returncode})")
                 return None
                 
             if not extracted_audio_path.exists():
                 if self.verbose:
                     self.logger.warning("FFmpeg completed but extracted audio file not found")
-                print("❌ Audio extraction completed but file not found")
+                self.progress.warning("❌ Audio extraction completed but file not found")
                 return None
             
-            print("✅ Audio extraction completed successfully")
+            self.progress.info("✅ Audio extraction completed successfully")
             return extracted_audio_path
             
         except Exception as e:
             if self.verbose:
                 self.logger.warning(f"Audio extraction failed: {e}")
-            print(f"❌ Audio extraction error: {e}")
+            self.progress.warning(f"❌ Audio extraction error: {e}")
+            return None
+    
+    def _probe_audio_codec(self, media_path: Path) -> Optional[str]:
+        """
+        Return the codec name of the first audio stream (via FFprobe), or None.
+        """
+        import subprocess
+        
+        if not self._ffprobe_path:
+            return None
+        
+        cmd = [
+            self._ffprobe_path,
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name",
+            "-of", "default=nw=1:nk=1",
+            str(media_path)
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        except Exception as e:
+            if self.verbose:
+                self.logger.warning(f"Codec probe failed: {e}")
+            return None
+        
+        codec_name = result.stdout.strip()
+        return codec_name if result.returncode == 0 and codec_name else None
+    
+    def _probe_codec_info(self, audio_path: Path) -> Optional[AudioCodecInfo]:
+        """
+        Return codec, sample rate, channels and bitrate of the first audio stream
+        (via FFprobe), or None.
+        """
+        import subprocess
+        
+        if not self._ffprobe_path:
+            return None
+        
+        cmd = [
+            self._ffprobe_path,
+            "-v", "error",
+            "-select_streams", "a:0",
+            "-show_entries", "stream=codec_name,sample_rate,channels,bit_rate",
+            "-of", "default=nw=1",
+            str(audio_path)
+        ]
+        
+        try:
+            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        except Exception as e:
+            if self.verbose:
+                self.logger.warning(f"Codec probe failed: {e}")
+            return None
+        
+        if result.returncode != 0:
+            return None
+        
+        fields = dict(
+            line.split("=", 1) for line in result.stdout.splitlines() if "=" in line
+        )
+        if not fields.get("codec_name"):
             return None
+        
+        def to_int(value: Optional[str]) -> Optional[int]:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return None
+        
+        return AudioCodecInfo(
+            codec_name=fields["codec_name"],
+            sample_rate=to_int(fields.get("sample_rate")),
+            channels=to_int(fields.get("channels")),
+            bit_rate=to_int(fields.get("bit_rate"))
+        )
+    
+    def _speech_encoding(self) -> Tuple[List[str], str, str]:
+        """
+        Return the re-encoding used for speech: 24kbps mono 16kHz Opus in OGG,
+        or mono/22kHz/64kbps MP3 when FFmpeg was built without libopus.
+        
+        Returns:
+            (FFmpeg codec arguments, output extension, description for the user)
+        """
+        if ffmpeg_has_encoder("libopus"):
+            return SPEECH_OPUS_ARGS, ".ogg", "Opus, mono, 16kHz, 24kbps bitrate"
+        
+        return (
+            [
+                "-ac", "1",           # Mono
+                "-ar", "22050",       # 22kHz sample rate
+                "-ab", "64k",         # 64kbps bitrate
+            ],
+            ".mp3",
+            "mono, 22kHz, 64kbps bitrate"
+        )
+    
+    def _select_compression(
+        self,
+        audio_path: Path,
+        codec_info: Optional[AudioCodecInfo]
+    ) -> Tuple[List[str], str, str]:
+        """
+        Choose the cheapest FFmpeg encoding that shrinks this audio.
+        
+        Lossy audio is re-encoded at 48kbps with its sample rate and channels
+        untouched. Everything else (lossless, unknown codec or an already low
+        bitrate) gets the speech encoding from _speech_encoding.
+        
+        Returns:
+            (FFmpeg codec arguments, output extension, description for the user)
+        """
+        if codec_info:
+            codec_name = codec_info.codec_name
+            reencoder = LOSSY_REENCODERS.get(codec_name)
+            if reencoder and (codec_info.bit_rate is None or codec_info.bit_rate > 48000):
+                encoder, extension = reencoder
+                return (
+                    ["-c:a", encoder, "-b:a", "48k"],
+                    extension,
+                    f"{codec_name} re-encoded at 48kbps bitrate"
+                )
+        
+        return self._speech_encoding()
     
     def _optimize_audio_file(
         self, 
         audio_path: Path, 
         audio_id: str, 
-        file_size_mb: float
-    ) -> Tuple[Path, Optional[str]]:
+        plan: TranscriptionPlan,
+        job_dir: Path
+    ) -> OptimizedAudio:
         """
         Apply size optimization strategy to audio file.
+        Pre-split chunks are written to job_dir.
         
         Returns:
-            Tuple of (optimized_path, optimization_description)
+            OptimizedAudio with the path, optimization description and, when
+            compression and splitting were fused, the pre-split chunks
         """
-        if file_size_mb <= self.max_file_size_mb:
-            return audio_path, None
+        if not plan.needs_compression:
+            return OptimizedAudio(audio_path, size_mb=plan.size_mb)
+        
+        file_size_mb = plan.size_mb
             
         # Show clear user feedback about optimization process
-        print(f"📊 File size {file_size_mb:.1f}MB exceeds limit ({self.max_file_size_mb}MB)")
-        print("🔄 Applying optimization strategy...")
+        self.progress.info(f"📊 File size {file_size_mb:.1f}MB exceeds limit ({self.max_file_size_mb}MB)")
+        self.progress.info("🔄 Applying optimization strategy...")
         
         if self.verbose:
             self.logger.info(f"File size {file_size_mb:.2f}MB exceeds limit. Applying optimization...")
         
         # Strategy 1: Check if chunking will solve the size problem without compression
-        try:
-            duration_seconds = self._get_audio_duration_efficient(audio_path)
-            safe_duration_limit = 720  # 12 minutes
-            
-            if duration_seconds > safe_duration_limit:
-                # We'll need chunking anyway, so calculate if chunks will be small enough
-                import math
-                chunks_needed = math.ceil(duration_seconds / safe_duration_limit)
-                estimated_chunk_size_mb = file_size_mb / chunks_needed
-                
-                if estimated_chunk_size_mb <= self.max_file_size_mb:
-                    print(f"🎯 Smart optimization: Skipping compression - chunking strategy will handle file size")
-                    if self.verbose:
-                        self.logger.info(f"Skipping compression - chunking will create manageable chunk sizes (~{estimated_chunk_size_mb:.1f}MB each)")
-                    return audio_path, "chunking_optimized"
-                else:
-                    print(f"🎯 Strategy 1: Even with chunking ({chunks_needed} chunks), estimated chunk size {estimated_chunk_size_mb:.1f}MB > {self.max_file_size_mb}MB")
-                    print("🗜️  Strategy 2: Compression needed before chunking")
+        if plan.duration_s > SAFE_DURATION_LIMIT:
+            # We'll need chunking anyway, so calculate if chunks will be small enough
+            chunks_needed = plan.chunk_count
+            estimated_chunk_size_mb = file_size_mb / chunks_needed
+            
+            if estimated_chunk_size_mb <= self.max_file_size_mb:
+                self.progress.info(f"🎯 Smart optimization: Skipping compression - chunking strategy will handle file size")
+                if self.verbose:
+                    self.logger.info(f"Skipping compression - chunking will create manageable chunk sizes (~{estimated_chunk_size_mb:.1f}MB each)")
+                return OptimizedAudio(audio_path, "chunking_optimized", size_mb=file_size_mb)
             else:
-                print("🗜️  Strategy 1: File needs compression for direct transcription")
-        except Exception as e:
-            if self.verbose:
-                self.logger.warning(f"Duration check failed, proceeding with compression: {e}")
-            print("🗜️  Strategy 1: Compressing audio for API upload")
+                self.progress.info(f"🎯 Strategy 1: Even with chunking ({chunks_needed} chunks), estimated chunk size {estimated_chunk_size_mb:.1f}MB > {self.max_file_size_mb}MB")
+                self.progress.info("🗜️  Strategy 2: Compressing and splitting in a single FFmpeg pass")
+                chunks = self._compress_and_segment(audio_path, plan.duration_s, chunks_needed, job_dir)
+                if chunks:
+                    return OptimizedAudio(audio_path, "compression_segmented", chunks)
+                self.progress.info("🗜️  Strategy 2: Compression needed before chunking")
+        elif plan.duration_s > 0:
+            self.progress.info("🗜️  Strategy 1: File needs compression for direct transcription")
+        else:
+            self.progress.info("🗜️  Strategy 1: Compressing audio for API upload")
         
         # Strategy 2: Try compression
-        compressed_path = self._try_compression(audio_path)
+        compressed_path = self._try_compression(audio_path, original_size_mb=file_size_mb)
         if compressed_path:
-            compressed_size_mb = compressed_path.stat().st_size / (1024 * 1024)
+            compressed_size_mb = self._file_size_mb(compressed_path)
             if compressed_size_mb <= self.max_file_size_mb:
-                print(f"✅ Compression successful! New size: {compressed_size_mb:.1f}MB")
+                self.progress.info(f"✅ Compression successful! New size: {compressed_size_mb:.1f}MB")
                 if self.verbose:
                     self.logger.info(f"Compression successful: {compressed_size_mb:.2f}MB")
-                return compressed_path, "compression"
+                return OptimizedAudio(compressed_path, "compression", size_mb=compressed_size_mb)
             else:
-                print(f"⚠️  Compressed file still too large: {compressed_size_mb:.1f}MB")
+                self.progress.warning(f"⚠️  Compressed file still too large: {compressed_size_mb:.1f}MB")
         else:
-            print("⚠️  Compression failed")
+            self.progress.warning("⚠️  Compression failed")
         
         # Strategy 3: Will need chunking (return original or compressed)
-        print("🧩 Final strategy: Using chunking for multiple API calls")
+        self.progress.info("🧩 Final strategy: Using chunking for multiple API calls")
         if self.verbose:
             self.logger.info("Optimization failed, will use chunking strategy")
-        return audio_path, "chunking_required"
+        return OptimizedAudio(audio_path, "chunking_required", size_mb=file_size_mb)
     
-    def _try_redownload_medium_quality(
-        self, 
-        audio_id: str, 
-        original_path: Path
+    def _try_compression(
+        self,
+        audio_path: Path,
+        replace_original: bool = False,
+        original_size_mb: Optional[float] = None
     ) -> Optional[Path]:
         """
-        Try to re-download audio in medium quality if it's from YouTube.
+        Try to compress audio file using FFmpeg directly (efficient, low memory).
+        Applies: mono, reduced sample rate, low bitrate.
+        
+        The encoding depends on the source codec (see _select_compression).
+        
+        The compressed file is written next to audio_path (same filesystem) and
+        the original is left untouched, so the returned temporary file is owned
+        by the caller. With replace_original=True the compressed file atomically
+        replaces audio_path instead (renamed if the encoding changes the extension)
+        and that path is returned.
+        Pass original_size_mb when the caller already measured the file.
         """
+        import subprocess
+        import time
+        
         try:
-            # Check if this is a YouTube-downloaded file with metadata
-            metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
-            metadata = metadata_manager.get_metadata(audio_id)
+            # Show initial compression info
+            if original_size_mb is None:
+                original_size_mb = self._file_size_mb(audio_path)
             
-            if not metadata or not hasattr(metadata, 'original_url'):
-                return None
-                
-            if self.verbose:
-                self.logger.info("Attempting re-download in medium quality...")
-            
-            # Set up downloader for medium quality
-            downloader = YouTubeDownloader(
-                output_directory=original_path.parent,
-                audio_format="mp3",
-                audio_quality="medium",
-                metadata_file=str(metadata_manager.metadata_file)
-            )
+            # Check if FFmpeg is available
+            if not self._ffmpeg_path:
+                if self.verbose:
+                    self.logger.warning("FFmpeg not found, falling back to PyDub compression")
+                self.progress.warning("⚠️  FFmpeg not found - using PyDub fallback (slower)")
+                return self._try_compression_pydub_fallback(audio_path, original_size_mb, replace_original)
             
-            # Download in medium quality
-            result = downloader.download_audio(metadata.original_url)
-            
-            if result.success and result.output_path:
-                # Rename the new file to maintain the original audio_id
-                new_file_path = Path(result.output_path)
-                
-                # Remove original file
-                if original_path.exists():
-                    original_path.unlink()
-                
-                # Rename new file to original name (maintain audio_id)
-                final_path = original_path  # Keep original path/name
-                new_file_path.rename(final_path)
-                
-                # Update the ORIGINAL metadata with new quality info
-                metadata.audio_quality = "medium"
-                metadata.file_size = final_path.stat().st_size
-                
-                # Remove the NEW metadata entry (we don't want duplicate)
-                if result.audio_id != audio_id:
-                    metadata_manager.metadata.pop(result.audio_id, None)
-                
-                # Save updated metadata
-                metadata_manager.save_metadata()
-                
-                if self.verbose:
-                    self.logger.info(f"Re-download completed and renamed to: {final_path}")
-                    
-                return final_path  # Return original path with optimized content
-            
-        except Exception as e:
-            if self.verbose:
-                self.logger.warning(f"Re-download failed: {e}")
-        
-        return None
-    
-    def _try_compression(self, audio_path: Path) -> Optional[Path]:
-        """
-        Try to compress audio file using FFmpeg directly (efficient, low memory).
-        Applies: mono, reduced sample rate, low bitrate.
-        """
-        import subprocess
-        import shutil
-        import time
-        import threading
-        
-        try:
-            # Show initial compression info
-            original_size_mb = audio_path.stat().st_size / (1024 * 1024)
-            print(f"🗜️  Starting audio compression: {original_size_mb:.1f}MB → target ~64kbps")
-            print(f"⚙️  Compression settings: mono, 22kHz, 64kbps bitrate")
+            codec_args, output_suffix, settings = self._select_compression(
+                audio_path, self._probe_codec_info(audio_path)
+            )
+            self.progress.info(f"🗜️  Starting audio compression: {original_size_mb:.1f}MB")
+            self.progress.info(f"⚙️  Compression settings: {settings}")
             
             if self.verbose:
                 self.logger.info("Attempting audio compression using FFmpeg...")
-            
-            # Check if FFmpeg is available
-            if not shutil.which("ffmpeg"):
-                if self.verbose:
-                    self.logger.warning("FFmpeg not found, falling back to PyDub compression")
-                print("⚠️  FFmpeg not found - using PyDub fallback (slower)")
-                return self._try_compression_pydub_fallback(audio_path)
                 
-            # Create temp compressed file
-            temp_compressed_path = self.temp_dir / f"compressed_{audio_path.name}"
+            # Create temp compressed file on the same filesystem as the source
+            with tempfile.NamedTemporaryFile(
+                dir=audio_path.parent,
+                prefix="compressed_",
+                suffix=output_suffix,
+                delete=False
+            ) as temp_file:
+                temp_compressed_path = Path(temp_file.name)
             
             # FFmpeg command for efficient compression
             # -i: input file
-            # -ac 1: mono (1 channel)
-            # -ar 22050: sample rate 22kHz
-            # -ab 64k: bitrate 64kbps  
+            # codec_args: encoder/bitrate chosen for the source codec
             # -y: overwrite output
             # -progress pipe:1: show progress information
             cmd = [
-                "ffmpeg",
+                self._ffmpeg_path,
                 "-i", str(audio_path),
-                "-ac", "1",           # Mono
-                "-ar", "22050",       # 22kHz sample rate
-                "-ab", "64k",         # 64kbps bitrate
+                "-vn",                # No video/cover art
+                *codec_args,
                 "-progress", "pipe:1", # Progress output
                 "-v", "warning",      # Only warnings and errors
                 "-y",                 # Overwrite
@@ -586,7 +1219,7 @@ class TranscriptionService:
             ]
             
             # Get audio duration for progress calculation
-            print("🔄 Compressing audio file...")
+            self.progress.info("🔄 Compressing audio file...")
             start_time = time.time()
             
             # Get total duration first
@@ -597,93 +1230,91 @@ class TranscriptionService:
             except:
                 duration_seconds = None
             
-            # Start compression process
-            process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                bufsize=1,
-                universal_newlines=True
-            )
-            
-            # Monitor FFmpeg progress in real-time
-            def monitor_ffmpeg_progress():
+            advise_sequential_read(audio_path)
+            
+            # Start compression process; stderr goes to a temp file so the
+            # progress pipe can be read on this thread without deadlocking
+            with tempfile.TemporaryFile(mode='w+') as stderr_file:
+                process = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    text=True,
+                    bufsize=1
+                )
+                
+                # Monitor FFmpeg progress in real-time
                 current_time = 0
                 last_update = time.time()
+                show_progress = self.progress.isEnabledFor(logging.DEBUG)
                 
-                for line in iter(process.stdout.readline, ''):
-                    if not line:
-                        break
-                    
+                for line in process.stdout:
                     line = line.strip()
                     
                     # Parse out_time_us (microseconds) for current position
-                    if line.startswith('out_time_us='):
-                        try:
-                            microseconds = int(line.split('=')[1])
-                            current_time = microseconds / 1_000_000  # Convert to seconds
-                            
-                            # Update progress every 2 seconds to avoid spam
-                            now = time.time()
-                            if now - last_update >= 2.0:
-                                if duration_seconds and duration_seconds > 0:
-                                    progress_percent = min(100, (current_time / duration_seconds) * 100)
-                                    elapsed = now - start_time
-                                    
-                                    # Estimate remaining time
-                                    if progress_percent > 5:  # Avoid division by very small numbers
-                                        eta_seconds = (elapsed / (progress_percent / 100)) - elapsed
-                                        eta_str = f" (ETA: {eta_seconds:.0f}s)" if eta_seconds > 0 else ""
-                                    else:
-                                        eta_str = ""
-                                    
-                                    print(f"\r🗜️  Compressing: {progress_percent:.1f}% ({current_time:.0f}s/{duration_seconds:.0f}s){eta_str}", end="", flush=True)
-                                else:
-                                    # No duration info, just show time processed
-                                    print(f"\r🗜️  Compressing: {current_time:.0f}s processed", end="", flush=True)
-                                
-                                last_update = now
-                        except (ValueError, IndexError):
-                            pass
-            
-            # Start progress monitoring in separate thread
-            progress_thread = threading.Thread(target=monitor_ffmpeg_progress)
-            progress_thread.daemon = True
-            progress_thread.start()
-            
-            # Wait for process to complete
-            stderr_output = []
-            for line in iter(process.stderr.readline, ''):
-                if line.strip():
-                    stderr_output.append(line.strip())
-            
-            process.wait()  # Wait for process to finish
-            progress_thread.join(timeout=1)  # Wait for progress thread to finish
-            
-            print("\r" + " " * 80 + "\r", end="")  # Clear progress line
+                    if not show_progress or not line.startswith('out_time_us='):
+                        continue
+                    try:
+                        microseconds = int(line.split('=')[1])
+                    except (ValueError, IndexError):
+                        continue
+                    current_time = microseconds / 1_000_000  # Convert to seconds
+                    
+                    # Update progress every 2 seconds to avoid spam
+                    now = time.time()
+                    if now - last_update < 2.0:
+                        continue
+                    
+                    if duration_seconds and duration_seconds > 0:
+                        progress_percent = min(100, (current_time / duration_seconds) * 100)
+                        elapsed = now - start_time
+                        
+                        # Estimate remaining time
+                        if progress_percent > 5:  # Avoid division by very small numbers
+                            eta_seconds = (elapsed / (progress_percent / 100)) - elapsed
+                            eta_str = f" (ETA: {eta_seconds:.0f}s)" if eta_seconds > 0 else ""
+                        else:
+                            eta_str = ""
+                        
+                        self.progress.debug(f"🗜️  Compressing: {progress_percent:.1f}% ({current_time:.0f}s/{duration_seconds:.0f}s){eta_str}")
+                    else:
+                        # No duration info, just show time processed
+                        self.progress.debug(f"🗜️  Compressing: {current_time:.0f}s processed")
+                    
+                    last_update = now
+                
+                process.wait()  # Wait for process to finish
+                
+                stderr_file.seek(0)
+                stderr_output = [line.strip() for line in stderr_file if line.strip()]
             
             elapsed_time = time.time() - start_time
             
             # Check if compression was successful
             if process.returncode != 0:
-                print(f"❌ FFmpeg compression failed (return code {process.returncode})")
+                self.progress.warning(f"❌ FFmpeg compression failed (return code {process.returncode})")
                 if stderr_output and self.verbose:
                     self.logger.warning(f"FFmpeg error: {' '.join(stderr_output)}")
+                temp_compressed_path.unlink(missing_ok=True)
                 return None
                 
-            if not temp_compressed_path.exists():
-                print("❌ Compression completed but output file not found")
+            try:
+                compressed_size_mb = self._file_size_mb(temp_compressed_path)
+            except FileNotFoundError:
+                compressed_size_mb = 0.0
+            
+            if compressed_size_mb == 0:
+                temp_compressed_path.unlink(missing_ok=True)
+                self.progress.warning("❌ Compression completed but output file not found")
                 if self.verbose:
                     self.logger.warning("FFmpeg completed but output file not found")
                 return None
             
             # Show compression results
-            compressed_size_mb = temp_compressed_path.stat().st_size / (1024 * 1024)
             compression_ratio = (1 - compressed_size_mb / original_size_mb) * 100
             
-            print(f"✅ Compression completed in {elapsed_time:.1f}s")
-            print(f"📊 Size reduction: {original_size_mb:.1f}MB → {compressed_size_mb:.1f}MB ({compression_ratio:.1f}% smaller)")
+            self.progress.info(f"✅ Compression completed in {elapsed_time:.1f}s")
+            self.progress.info(f"📊 Size reduction: {original_size_mb:.1f}MB → {compressed_size_mb:.1f}MB ({compression_ratio:.1f}% smaller)")
             
             if self.verbose:
                 self.logger.info(
@@ -691,250 +1322,535 @@ class TranscriptionService:
                     f"({compression_ratio:.1f}% reduction) in {elapsed_time:.1f}s"
                 )
             
-            # Replace original file with compressed version (maintain same path/name)
-            audio_path.unlink()  # Remove original
-            temp_compressed_path.rename(audio_path)  # Rename compressed to original name
+            if replace_original:
+                # Atomic same-filesystem swap (maintain same path/name)
+                final_path = audio_path.with_suffix(output_suffix)
+                os.replace(temp_compressed_path, final_path)
+                if final_path != audio_path:
+                    audio_path.unlink(missing_ok=True)
+                return final_path
             
-            return audio_path  # Return original path with compressed content
+            return temp_compressed_path
             
         except Exception as e:
-            print(f"❌ FFmpeg compression error: {e}")
+            if 'temp_compressed_path' in locals():
+                temp_compressed_path.unlink(missing_ok=True)
+            self.progress.warning(f"❌ FFmpeg compression error: {e}")
             if self.verbose:
                 self.logger.warning(f"FFmpeg compression failed: {e}")
-            print("🔄 Trying PyDub fallback compression...")
+            self.progress.info("🔄 Trying PyDub fallback compression...")
             # Try PyDub fallback
-            return self._try_compression_pydub_fallback(audio_path)
+            return self._try_compression_pydub_fallback(audio_path, original_size_mb, replace_original)
         
-    def _try_compression_pydub_fallback(self, audio_path: Path) -> Optional[Path]:
+    def _try_compression_pydub_fallback(
+        self,
+        audio_path: Path,
+        original_size_mb: Optional[float] = None,
+        replace_original: bool = False
+    ) -> Optional[Path]:
         """
         Fallback compression using PyDub (higher memory usage).
         Only used when FFmpeg is not available.
+        
+        Like _try_compression, writes a sibling temporary file and leaves the
+        original untouched unless replace_original=True.
         """
         import time
         
+        temp_compressed_path = None
         try:
             # Show initial compression info
-            original_size_mb = audio_path.stat().st_size / (1024 * 1024)
-            print(f"🗜️  PyDub compression fallback: {original_size_mb:.1f}MB (higher memory usage)")
-            print(f"⚙️  Settings: mono, 22kHz, 64kbps - loading file into memory...")
-            
-            if self.verbose:
-                self.logger.info("Using PyDub fallback compression (higher memory usage)...")
-            
+            if original_size_mb is None:
+                original_size_mb = self._file_size_mb(audio_path)
             start_time = time.time()
             
-            # Load audio (this loads entire file into memory)
-            print("📂 Loading audio file into memory...")
-            audio = AudioSegment.from_file(audio_path)
-            
-            # Apply compression: mono, reduced bitrate
-            print("🔄 Applying compression (mono, 22kHz)...")
-            compressed_audio = audio.set_channels(1).set_frame_rate(22050)
-            
-            # Save compressed version to temp location first
-            print("💾 Exporting compressed audio...")
-            temp_compressed_path = self.temp_dir / f"compressed_{audio_path.name}"
-            compressed_audio.export(
-                temp_compressed_path,
-                format="mp3",
-                bitrate="64k"
-            )
+            # Stream formats libsndfile can read instead of loading them whole
+            if SOUNDFILE_AVAILABLE:
+                temp_compressed_path = self._compress_with_soundfile(audio_path)
+            
+            if temp_compressed_path is None:
+                self.progress.info(f"🗜️  PyDub compression fallback: {original_size_mb:.1f}MB (higher memory usage)")
+                self.progress.info(f"⚙️  Settings: mono, 22kHz, 64kbps - loading file into memory...")
+                
+                if self.verbose:
+                    self.logger.info("Using PyDub fallback compression (higher memory usage)...")
+                
+                # Load audio (this loads entire file into memory)
+                self.progress.info("📂 Loading audio file into memory...")
+                audio = AudioSegment.from_file(audio_path)
+                
+                # Apply compression: mono, reduced bitrate
+                self.progress.info("🔄 Applying compression (mono, 22kHz)...")
+                compressed_audio = audio.set_channels(1).set_frame_rate(22050)
+                
+                # Save compressed version next to the original (same filesystem)
+                self.progress.info("💾 Exporting compressed audio...")
+                with tempfile.NamedTemporaryFile(
+                    dir=audio_path.parent,
+                    prefix="compressed_",
+                    suffix=".mp3",
+                    delete=False
+                ) as temp_file:
+                    temp_compressed_path = Path(temp_file.name)
+                compressed_audio.export(
+                    temp_compressed_path,
+                    format="mp3",
+                    bitrate="64k"
+                )
             
             elapsed_time = time.time() - start_time
             
             # Show compression results
-            compressed_size_mb = temp_compressed_path.stat().st_size / (1024 * 1024)
+            compressed_size_mb = self._file_size_mb(temp_compressed_path)
             compression_ratio = (1 - compressed_size_mb / original_size_mb) * 100
             
-            print(f"✅ PyDub compression completed in {elapsed_time:.1f}s")
-            print(f"📊 Size reduction: {original_size_mb:.1f}MB → {compressed_size_mb:.1f}MB ({compression_ratio:.1f}% smaller)")
+            self.progress.info(f"✅ Fallback compression completed in {elapsed_time:.1f}s")
+            self.progress.info(f"📊 Size reduction: {original_size_mb:.1f}MB → {compressed_size_mb:.1f}MB ({compression_ratio:.1f}% smaller)")
             
             if self.verbose:
                 self.logger.info(
-                    f"PyDub compression: {original_size_mb:.2f}MB → {compressed_size_mb:.2f}MB "
+                    f"Fallback compression: {original_size_mb:.2f}MB → {compressed_size_mb:.2f}MB "
                     f"({compression_ratio:.1f}% reduction) in {elapsed_time:.1f}s"
                 )
             
-            # Replace original file with compressed version (maintain same path/name)
-            audio_path.unlink()  # Remove original
-            temp_compressed_path.rename(audio_path)  # Rename compressed to original name
+            if replace_original:
+                # Atomic same-filesystem swap (os.replace removes the original)
+                final_path = audio_path.with_suffix(temp_compressed_path.suffix)
+                os.replace(temp_compressed_path, final_path)
+                if final_path != audio_path:
+                    audio_path.unlink(missing_ok=True)
+                return final_path
             
-            return audio_path  # Return original path with compressed content
+            return temp_compressed_path
             
         except Exception as e:
+            if temp_compressed_path is not None:
+                temp_compressed_path.unlink(missing_ok=True)
             if self.verbose:
                 self.logger.warning(f"PyDub compression failed: {e}")
         
         return None
     
-    def _get_audio_duration_efficient(self, audio_path: Path) -> float:
+    def _compress_with_soundfile(self, audio_path: Path) -> Optional[Path]:
+        """
+        Downmix to mono Ogg Vorbis next to the original, one block at a time.
+        
+        Returns:
+            Path to the compressed file, or None if libsndfile cannot read the file
+        """
+        self.progress.info("🗜️  Streaming compression fallback: mono Ogg Vorbis")
+        
+        with tempfile.NamedTemporaryFile(
+            dir=audio_path.parent,
+            prefix="compressed_",
+            suffix=".ogg",
+            delete=False
+        ) as temp_file:
+            temp_compressed_path = Path(temp_file.name)
+        
+        try:
+            with sf.SoundFile(str(audio_path)) as source, sf.SoundFile(
+                str(temp_compressed_path), "w",
+                samplerate=source.samplerate, channels=1,
+                format="OGG", subtype="VORBIS"
+            ) as target:
+                for block in source.blocks(blocksize=SOUNDFILE_BLOCK_FRAMES, dtype="float32"):
+                    target.write(block.mean(axis=1) if block.ndim > 1 else block)
+        except Exception as e:
+            temp_compressed_path.unlink(missing_ok=True)
+            if self.verbose:
+                self.logger.warning(f"soundfile compression failed, using PyDub: {e}")
+            return None
+        
+        return temp_compressed_path
+    
+    def _get_audio_duration_efficient(
+        self,
+        audio_path: Path,
+        file_stat: Optional[os.stat_result] = None,
+        probe: Optional[Any] = None
+    ) -> float:
         """
         Get audio duration using FFprobe (no memory loading).
         Much more efficient than loading entire file with PyDub.
+        Results are cached per (path, mtime, size) so repeated lookups skip the probe;
+        pass file_stat when the caller has already stat'ed the file, and probe when
+        it has already started FFprobe with _start_duration_probe.
+        """
+        if file_stat is None:
+            file_stat = os.stat(audio_path)
+        cache_key = (str(audio_path), file_stat.st_mtime_ns, file_stat.st_size)
+        cached = self._duration_cache.get(cache_key)
+        if cached is not None:
+            if probe is not None:
+                probe.kill()
+                probe.wait()
+            return cached
+        
+        duration = self._probe_audio_duration(audio_path, probe)
+        self._duration_cache[cache_key] = duration
+        return duration
+    
+    def _start_duration_probe(self, audio_path: Path) -> Optional[Any]:
+        """
+        Start FFprobe reading the container duration without waiting for it, so
+        the caller can do other setup while it runs.
+        
+        Returns:
+            The running subprocess.Popen, or None if FFprobe is unavailable
         """
         import subprocess
-        import shutil
+        
+        if not self._ffprobe_path:
+            return None
+        
+        # Use FFprobe to read only the container duration
+        cmd = [
+            self._ffprobe_path,
+            "-v", "error",
+            "-show_entries", "format=duration",
+            "-of", "default=nw=1:nk=1",
+            str(audio_path)
+        ]
         
         try:
-            # Check if FFprobe is available (comes with FFmpeg)
-            if not shutil.which("ffprobe"):
-                if self.verbose:
-                    self.logger.warning("FFprobe not found, falling back to PyDub")
-                # Fallback to PyDub (will load into memory)
-                audio = AudioSegment.from_file(audio_path)
-                return len(audio) / 1000.0
-                
-            # Use FFprobe to get duration efficiently
-            cmd = [
-                "ffprobe",
-                "-v", "quiet",
-                "-show_entries", "format=duration",
-                "-of", "csv=p=0",
-                str(audio_path)
-            ]
-            
-            result = subprocess.run(
+            return subprocess.Popen(
                 cmd,
-                capture_output=True,
-                text=True,
-                timeout=10  # Timeout to prevent hanging
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True
             )
-            
-            if result.returncode == 0 and result.stdout.strip():
-                duration = float(result.stdout.strip())
+        except OSError as e:
+            if self.verbose:
+                self.logger.warning(f"Could not start FFprobe: {e}")
+            return None
+    
+    def _probe_audio_duration(self, audio_path: Path, probe: Optional[Any] = None) -> float:
+        """
+        Read the duration from the container header via FFprobe, collecting the
+        result of an already started probe when one is given.
+        """
+        if probe is None:
+            probe = self._start_duration_probe(audio_path)
+        
+        # Check if FFprobe is available (comes with FFmpeg)
+        if probe is None:
+            if self.verbose:
+                self.logger.warning("FFprobe not found, reading duration without it")
+            return self._duration_without_ffprobe(audio_path)
+        
+        try:
+            try:
+                stdout, _ = probe.communicate(timeout=10)  # Timeout to prevent hanging
+            except Exception:
+                probe.kill()
+                probe.wait()
+                raise
+            
+            if probe.returncode == 0 and stdout.strip():
+                duration = float(stdout.strip())
                 return duration
             else:
                 if self.verbose:
-                    self.logger.warning(f"FFprobe failed, falling back to PyDub")
-                # Fallback to PyDub
-                audio = AudioSegment.from_file(audio_path)
-                return len(audio) / 1000.0
+                    self.logger.warning("FFprobe failed, reading duration without it")
+                return self._duration_without_ffprobe(audio_path)
                 
         except Exception as e:
             if self.verbose:
-                self.logger.warning(f"Duration check failed: {e}, falling back to PyDub")
-            # Fallback to PyDub
-            audio = AudioSegment.from_file(audio_path)
-            return len(audio) / 1000.0
+                self.logger.warning(f"Duration check failed: {e}, reading duration without FFprobe")
+            return self._duration_without_ffprobe(audio_path)
     
-    def _create_intelligent_chunks_ffmpeg(self, audio_path: Path, total_duration: float, effective_duration_limit: float) -> List[Tuple[Any, float, float]]:
+    def _duration_without_ffprobe(self, audio_path: Path) -> float:
         """
-        Create audio chunks using FFmpeg directly (streaming, no memory loading).
-        Uses MINIMAL chunking strategy - only creates as many chunks as necessary.
+        Read the duration from the file header via mutagen or soundfile, decoding
+        the whole file with PyDub only when neither can parse it.
+        """
+        if MUTAGEN_AVAILABLE:
+            try:
+                audio_info = MutagenFile(audio_path)
+                if audio_info is not None and audio_info.info:
+                    return float(audio_info.info.length)
+            except Exception:
+                pass
+        
+        if SOUNDFILE_AVAILABLE:
+            try:
+                return float(sf.info(str(audio_path)).duration)
+            except Exception:
+                pass
+        
+        # Last resort: PyDub loads the entire file into memory
+        audio = AudioSegment.from_file(audio_path)
+        return len(audio) / 1000.0
+    
+    def _get_effective_duration_limit(self) -> float:
+        """
+        Maximum chunk duration (seconds) that keeps the model's output within limits
+        (looked up once per service in MODEL_CHUNK_LIMITS).
+        """
+        return self._effective_duration_limit
+    
+    def _compress_and_segment(
+        self,
+        audio_path: Path,
+        total_duration: float,
+        chunks_needed: int,
+        segment_dir: Path
+    ) -> Optional[Iterator[Tuple[Path, float, float]]]:
+        """
+        Compress and split audio into chunks with a single FFmpeg invocation.
+        Applies the speech encoding from _speech_encoding, then uses the segment
+        muxer so the audio is decoded and encoded only once.
+        
+        Chunks are streamed: FFmpeg reports each segment on stdout as soon as it is
+        closed, so chunk 0 can be uploaded while later chunks are still encoding.
+        They are written to segment_dir, which the caller removes.
+        
+        Returns:
+            Iterator of (chunk_path, start_time, end_time) or None if FFmpeg fails
+            before producing the first chunk
         """
         import subprocess
-        import shutil
-        import math
         
-        chunks = []
+        if not self._ffmpeg_path or total_duration <= 0:
+            return None
+        
+        segment_time = total_duration / chunks_needed
+        codec_args, segment_suffix, _ = self._speech_encoding()
+        segment_pattern = segment_dir / f"chunk_%03d{segment_suffix}"
+        
+        cmd = [
+            self._ffmpeg_path,
+            "-i", str(audio_path),
+            "-vn",                              # No video
+            *codec_args,
+            "-f", "segment",                    # Split while encoding
+            "-segment_time", segment_time_arg(segment_time),
+            "-reset_timestamps", "1",           # Each chunk starts at 0
+            "-segment_list", "pipe:1",          # Report each finished segment...
+            "-segment_list_type", "csv",        # ...as "name,start,end" on stdout
+            "-v", "warning",                    # Only warnings and errors
+            "-y",                               # Overwrite
+            str(segment_pattern)
+        ]
+        
+        if self.verbose:
+            self.logger.info(f"Compressing and segmenting: {' '.join(cmd)}")
+        print(f"🎯 Strategy: {chunks_needed} chunks of ~{segment_time/60:.1f} minutes each")
+        
+        advise_sequential_read(audio_path)
+        try:
+            stderr_file = tempfile.TemporaryFile()
+            process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True
+            )
+        except Exception as e:
+            if self.verbose:
+                self.logger.warning(f"FFmpeg segmenting failed: {e}")
+            return None
+        
+        segments = self._iter_finished_segments(process, stderr_file, segment_dir)
+        
+        # Wait for the first chunk so a failing FFmpeg can still fall back to compression
+        try:
+            first_chunk = next(segments, None)
+        except TranscriptionError:
+            return None
+        if first_chunk is None:
+            return None
         
+        return itertools.chain([first_chunk], segments)
+    
+    def _iter_finished_segments(
+        self,
+        process: Any,
+        stderr_file: Any,
+        segment_dir: Path
+    ) -> Iterator[Tuple[Path, float, float]]:
+        """
+        Yield (chunk_path, start_time, end_time) as the segment muxer closes each file.
+        
+        Raises:
+            TranscriptionError: If FFmpeg exits with an error, so a run that stops
+                partway is not mistaken for the end of the audio
+        """
+        try:
+            for line in process.stdout:
+                name, start, end = line.strip().rsplit(",", 2)
+                chunk_path = segment_dir / name
+                start_time, end_time = float(start), float(end)
+                if end_time - start_time < MIN_CHUNK_SECONDS:
+                    continue
+                yield chunk_path, start_time, end_time
+            
+            process.stdout.close()
+            if process.wait() != 0:
+                stderr_file.seek(0)
+                stderr_output = stderr_file.read().decode("utf-8", errors="replace")
+                if self.verbose:
+                    self.logger.warning(f"FFmpeg segmenting failed: {stderr_output}")
+                raise TranscriptionError(f"FFmpeg segmenting failed (return code {process.returncode})")
+        finally:
+            process.stdout.close()
+            process.wait()
+            stderr_file.close()
+    
+    async def _create_intelligent_chunks_ffmpeg(self, audio_path: Path, total_duration: float, effective_duration_limit: float, segment_dir: Path) -> AsyncIterator[Tuple[Any, float, float]]:
+        """
+        Create audio chunks using FFmpeg directly (streaming, no memory loading).
+        Uses MINIMAL chunking strategy - only creates as many chunks as necessary.
+        A single FFmpeg segment muxer pass (an asyncio subprocess) decodes the input
+        once and reports each chunk as soon as it is closed, so chunks are yielded
+        in order while later ones are still being written. Chunk files are written
+        to segment_dir and left for the caller to remove.
+        """
         # Calculate MINIMUM chunks needed based on API limits
         max_duration_per_chunk = effective_duration_limit  # Use the effective limit
-        chunks_needed = math.ceil(total_duration / max_duration_per_chunk)
+        chunks_needed = count_chunks(total_duration, max_duration_per_chunk)
         
         # Calculate optimal chunk duration (divide total time evenly)
         optimal_chunk_duration = total_duration / chunks_needed
         
-        # Use minimal overlap only if chunks are very close to limit
-        chunk_overlap = 0.5 if optimal_chunk_duration > 1350 else 0.0
-        
         if self.verbose:
             self.logger.info(f"Optimized chunking: {chunks_needed} chunks of ~{optimal_chunk_duration/60:.1f} minutes each")
         print(f"🎯 Strategy: {chunks_needed} chunks of ~{optimal_chunk_duration/60:.1f} minutes each")
         
-        chunk_duration = optimal_chunk_duration
+        if not self._ffmpeg_path:
+            # Fallback to PyDub (will use more memory)
+            if self.verbose:
+                self.logger.warning("FFmpeg not available, using PyDub fallback")
+            for chunk in self._create_intelligent_chunks_pydub_fallback(audio_path, total_duration, segment_dir):
+                yield chunk
+            return
+        
+        # Already-compressed mono speech audio (e.g. our own compression output)
+        # is split by copying packets instead of being re-encoded. Opus always
+        # reports 48kHz, so its sample rate is not checked
+        codec_info = self._probe_codec_info(audio_path)
+        if (codec_info and codec_info.codec_name in SEGMENT_COPY_EXTENSIONS
+                and codec_info.channels == 1
+                and (codec_info.codec_name == "opus"
+                     or 0 < (codec_info.sample_rate or 0) <= 22050)):
+            codec_args = ["-c:a", "copy"]
+            chunk_extension = SEGMENT_COPY_EXTENSIONS[codec_info.codec_name]
+            if self.verbose:
+                self.logger.info(f"Chunking {codec_info.codec_name} audio by stream copy")
+        else:
+            codec_args = [
+                "-ac", "1",                     # Mono
+                "-ar", "22050",                 # 22kHz
+                "-ab", "128k",                  # 128kbps
+            ]
+            chunk_extension = ".mp3"
         
-        # Calculate chunk positions
-        current_pos = 0.0
-        chunk_index = 0
+        # One pass over the input: the segment muxer starts a new file every
+        # optimal_chunk_duration seconds and prints "name,start,end" for each
+        cmd = [
+            self._ffmpeg_path,
+            "-i", str(audio_path),
+            "-vn",                              # No video
+            *codec_args,
+            "-f", "segment",                    # Split while encoding
+            "-segment_time", segment_time_arg(optimal_chunk_duration),
+            "-reset_timestamps", "1",           # Each chunk starts at 0
+            "-segment_list", "pipe:1",          # Report each finished segment...
+            "-segment_list_type", "csv",        # ...as "name,start,end" on stdout
+            "-y",                               # Overwrite
+            str(segment_dir / f"chunk_%03d{chunk_extension}")
+        ]
         
-        while current_pos < total_duration:
-            start_time = current_pos
-            end_time = min(current_pos + chunk_duration, total_duration)
-            actual_duration = end_time - start_time
-            
-            # Skip very short chunks at the end
-            if actual_duration < 1.0:
-                break
+        advise_sequential_read(audio_path)
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        try:
+            async for line in process.stdout:
+                name, start, end = line.decode().strip().rsplit(",", 2)
+                chunk_path = segment_dir / name
+                start_time, end_time = float(start), float(end)
+                
+                # Skip padding-only leftovers at the end
+                if end_time - start_time < MIN_CHUNK_SECONDS:
+                    continue
                 
-            # Create chunk using FFmpeg (efficient streaming)
-            chunk_path = self.temp_dir / f"chunk_{chunk_index:03d}.mp3"
-            
-            try:
-                if shutil.which("ffmpeg"):
-                    # Use FFmpeg for efficient chunk extraction
-                    cmd = [
-                        "ffmpeg",
-                        "-i", str(audio_path),
-                        "-ss", str(start_time),          # Start time
-                        "-t", str(actual_duration),      # Duration
-                        "-ac", "1",                      # Mono
-                        "-ar", "22050",                  # 22kHz
-                        "-ab", "128k",                   # 128kbps
-                        "-avoid_negative_ts", "make_zero",  # Reset timestamps
-                        "-reset_timestamps", "1",        # Reset timestamps to start from 0
-                        "-y",                            # Overwrite
-                        str(chunk_path)
-                    ]
-                    
-                    result = subprocess.run(
-                        cmd,
-                        text=True,
-                        stdout=subprocess.DEVNULL,
-                        stderr=subprocess.DEVNULL
-                    )
-                    
-                    if result.returncode == 0 and chunk_path.exists():
-                        # Create a fake AudioSegment-like object for compatibility
-                        class FFmpegChunk:
-                            def __init__(self, path):
-                                self.path = path
-                            def export(self, path, **kwargs):
-                                # Files are already in the right format
-                                if path != self.path:
-                                    shutil.copy2(self.path, path)
-                        
-                        chunk_audio = FFmpegChunk(chunk_path)
-                        chunks.append((chunk_audio, start_time, end_time))
-                        
-                        if self.verbose:
-                            self.logger.info(f"Created chunk {chunk_index}: {start_time:.1f}s-{end_time:.1f}s ({actual_duration:.1f}s)")
-                    else:
-                        if self.verbose:
-                            self.logger.warning(f"FFmpeg chunk creation failed for chunk {chunk_index}")
-                        break
-                else:
-                    # Fallback to PyDub (will use more memory)
-                    if self.verbose:
-                        self.logger.warning("FFmpeg not available, using PyDub fallback")
-                    return self._create_intelligent_chunks_pydub_fallback(audio_path, total_duration)
-                    
-            except Exception as e:
                 if self.verbose:
-                    self.logger.error(f"Error creating chunk {chunk_index}: {e}")
-                break
-            
-            # Move to next chunk position - FIXED: ensure we don't skip audio at the end
-            chunk_index += 1
-            if chunk_index >= chunks_needed:
-                # We've created all the chunks we calculated we need
-                break
-            
-            # For intermediate chunks, advance by full duration minus overlap
-            # For the last chunk, we'll process all remaining audio
-            if chunk_index < chunks_needed - 1:
-                current_pos += chunk_duration - chunk_overlap
-            else:
-                # Last chunk: start from where previous ended and go to the end
-                current_pos = start_time + chunk_duration - chunk_overlap
+                    self.logger.info(f"Created chunk {name}: {start_time:.1f}s-{end_time:.1f}s ({end_time - start_time:.1f}s)")
+                
+                yield chunk_path, start_time, end_time
+            
+            # A mid-stream failure would otherwise look like a shorter file
+            if await process.wait() != 0:
+                raise TranscriptionError(f"FFmpeg chunk creation failed (return code {process.returncode})")
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+    
+    def _create_chunks_soundfile(self, audio_path: Path, chunk_dir: Path) -> Optional[List[Tuple[Path, float, float]]]:
+        """
+        Split audio into mono Ogg Vorbis chunk files, streaming one block at a time.
+        Uses the same chunk duration and overlap as the PyDub fallback.
+        
+        Returns:
+            List of (chunk_path, start_time, end_time), or None if libsndfile
+            cannot read the file
+        """
+        chunks = []
+        
+        try:
+            with sf.SoundFile(str(audio_path)) as source:
+                sample_rate = source.samplerate
+                total_frames = source.frames
+                chunk_frames = int(self.chunk_duration * sample_rate)
+                step_frames = chunk_frames - int(self.chunk_overlap * sample_rate)
+                
+                start_frame = 0
+                while start_frame < total_frames:
+                    frames = min(chunk_frames, total_frames - start_frame)
+                    chunk_path = chunk_dir / f"chunk_{len(chunks):03d}.ogg"
+                    source.seek(start_frame)
+                    with sf.SoundFile(
+                        str(chunk_path), "w",
+                        samplerate=sample_rate, channels=1,
+                        format="OGG", subtype="VORBIS"
+                    ) as target:
+                        for block in source.blocks(blocksize=SOUNDFILE_BLOCK_FRAMES, frames=frames, dtype="float32"):
+                            target.write(block.mean(axis=1) if block.ndim > 1 else block)
+                    
+                    chunks.append((
+                        chunk_path,
+                        start_frame / sample_rate,
+                        (start_frame + frames) / sample_rate
+                    ))
+                    start_frame += step_frames
+        except Exception as e:
+            if self.verbose:
+                self.logger.warning(f"soundfile chunking failed, using PyDub: {e}")
+            for chunk_path, _, _ in chunks:
+                chunk_path.unlink(missing_ok=True)
+            return None
         
         return chunks
     
-    def _create_intelligent_chunks_pydub_fallback(self, audio_path: Path, total_duration: float) -> List[Tuple[Any, float, float]]:
+    def _create_intelligent_chunks_pydub_fallback(self, audio_path: Path, total_duration: float, chunk_dir: Path) -> List[Tuple[Any, float, float]]:
         """
         Fallback chunking using PyDub (higher memory usage).
-        Only used when FFmpeg is not available.
+        Only used when FFmpeg is not available. Formats libsndfile can read are
+        streamed block by block through soundfile instead.
         """
+        if SOUNDFILE_AVAILABLE:
+            chunks = self._create_chunks_soundfile(audio_path, chunk_dir)
+            if chunks is not None:
+                return chunks
+        
         if self.verbose:
             self.logger.warning("Using PyDub fallback for chunking (high memory usage)")
             
@@ -967,10 +1883,12 @@ class TranscriptionService:
         audio_id: str,
         language: Optional[str],
         prompt: Optional[str],
-        show_progress: bool = True
+        show_progress: bool = True,
+        audio_data: Optional[bytes] = None
     ) -> TranscriptionResult:
         """
         Direct transcription for files <= 25MB (optimal path).
+        If audio_data is given it is uploaded instead of reading audio_path.
         """
         start_time = time.time()  # Track processing time
         
@@ -978,13 +1896,17 @@ class TranscriptionService:
             self.logger.info("Using direct transcription strategy")
         
         try:
+            if audio_data is not None:
+                file_size_mb = len(audio_data) / (1024 * 1024)
+            else:
+                file_size_mb = self._file_size_mb(audio_path)
+            
             # Show user that we're sending to API (only if show_progress is True)
             if show_progress:
-                file_size_mb = audio_path.stat().st_size / (1024 * 1024)
                 print(f"📤 Sending {file_size_mb:.1f}MB file to transcription API...")
             
             # Make API call with retry logic
-            response = self._make_api_call_with_retry(audio_path, language, prompt)
+            response = self._make_api_call_with_retry(audio_path, language, prompt, audio_data)
             
             # Parse response
             if response:
@@ -1009,7 +1931,7 @@ class TranscriptionService:
                         processing_time=time.time() - start_time,
                         total_chunks=1,
                         failed_chunks=0,
-                        file_size_mb=audio_path.stat().st_size / (1024 * 1024)
+                        file_size_mb=file_size_mb
                     )
             else:
                 return TranscriptionResult(
@@ -1034,101 +1956,75 @@ class TranscriptionService:
         audio_path: Path,
         audio_id: str,
         language: Optional[str],
-        prompt: Optional[str]
+        prompt: Optional[str],
+        chunks: Optional[Union[Iterable[Tuple[Any, float, float]], AsyncIterable[Tuple[Any, float, float]]]] = None,
+        plan: Optional[TranscriptionPlan] = None,
+        job_dir: Optional[Path] = None
     ) -> TranscriptionResult:
         """
         Chunked transcription for files > 25MB (fallback strategy).
+        
+        If chunks is given (already split during optimization, possibly still being
+        produced), splitting is skipped.
+        If plan is given, its measured duration is reused instead of probing again.
+        Chunk files go to job_dir; without one, a directory is created for this
+        call and removed (with every chunk in it) when it returns.
         """
         if self.verbose:
             self.logger.info("Using chunked transcription strategy")
         
+        # Without a measured plan, FFprobe reads the duration while the job is set up
+        probe = None
+        if plan is None or plan.duration_s <= 0:
+            probe = self._start_duration_probe(audio_path)
+        
+        owns_job_dir = job_dir is None
+        if owns_job_dir:
+            job_dir = Path(tempfile.mkdtemp(prefix=f"job_{audio_id}_", dir=self.temp_dir))
+        
         try:
-            # Get audio duration efficiently without loading entire file
-            total_duration = self._get_audio_duration_efficient(audio_path)
-            
             # Calculate optimal chunking strategy
-            # CRITICAL: gpt-4o-transcribe has a 2048 token OUTPUT limit
-            # Each token ≈ 0.75 words, so max ~1536 words per chunk
-            # Audio ratio: ~2-3 words per second, so max ~8-10 minutes per chunk
-            max_output_tokens = 2048
-            words_per_token = 0.75
-            words_per_second = 3.0  # More conservative estimate (was 2.5)
-            max_words_per_chunk = max_output_tokens * words_per_token  # ~1536 words
-            max_duration_per_chunk_tokens = max_words_per_chunk / words_per_second  # ~512 seconds ≈ 8.5 minutes
-            
-            # Be even MORE conservative - use only 60% of the calculated limit
-            conservative_limit = max_duration_per_chunk_tokens * 0.60  # ~5.1 minutes per chunk
-            
-            # Use the more restrictive limit between API file size (25MB) and token output (5.1 min)
-            api_duration_limit = 1400  # 23.3 minutes (25MB limit)
-            effective_duration_limit = min(api_duration_limit, conservative_limit)
+            effective_duration_limit = self._get_effective_duration_limit()
+            
+            # Get audio duration efficiently without loading entire file
+            if probe is None and plan is not None and plan.duration_s > 0:
+                total_duration = plan.duration_s
+            else:
+                total_duration = self._get_audio_duration_efficient(audio_path, probe=probe)
             
             print(f"🎯 Ultra-conservative chunking: max {effective_duration_limit/60:.1f} minutes per chunk")
             
-            chunks_needed = math.ceil(total_duration / effective_duration_limit)
+            # Create chunks using FFmpeg directly (no memory loading); they are
+            # transcribed while the remaining chunks are still being extracted
+            if chunks is None:
+                chunks = self._create_intelligent_chunks_ffmpeg(audio_path, total_duration, effective_duration_limit, job_dir)
             
-            # Create chunks using FFmpeg directly (no memory loading)
-            chunks = self._create_intelligent_chunks_ffmpeg(audio_path, total_duration, effective_duration_limit)
+            # Streamed chunks are still being produced, so only the plan knows their count
+            if isinstance(chunks, list):
+                expected_chunks = len(chunks)
+            elif plan is not None:
+                expected_chunks = plan.chunk_count
+            else:
+                expected_chunks = count_chunks(total_duration, effective_duration_limit)
             
             # Clear user feedback about chunking process
-            print(f"🧩 Creating {chunks_needed} chunks for processing")
+            print(f"🧩 Creating {expected_chunks} chunks for processing")
             print(f"⏱️  Total duration: {total_duration/60:.1f} minutes")
-            optimal_chunk_duration = total_duration / chunks_needed
             
             if self.verbose:
-                self.logger.info(f"Created {len(chunks)} chunks for processing")
-            
-            segments = []
-            failed_chunks = 0
-            
-            # Process each chunk
-            for i, (chunk_audio, start_time, end_time) in enumerate(chunks):
-                # Show progress to user
-                print(f"🔄 Processing chunk {i+1}/{len(chunks)} ({start_time/60:.1f}m-{end_time/60:.1f}m)...")
-                try:
-                    # Handle different chunk types
-                    if hasattr(chunk_audio, 'path'):
-                        # FFmpeg chunk - file already exists
-                        chunk_path = Path(chunk_audio.path)
-                    else:
-                        # PyDub chunk - need to export
-                        chunk_path = self.temp_dir / f"chunk_{i:03d}.mp3"
-                        chunk_audio.export(chunk_path, format="mp3", bitrate="128k")
-                    
-                    # Transcribe this chunk
-                    chunk_result = self._transcribe_direct(chunk_path, None, language, prompt)
-                    chunk_path.unlink(missing_ok=True)
-                    
-                    if chunk_result.success and chunk_result.segments:
-                        # Adjust timing for chunk position
-                        segment = chunk_result.segments[0]
-                        segment.start_time = start_time
-                        segment.end_time = end_time
-                        segments.append(segment)
-                        print(f"   ✅ Transcribed {len(segment.text)} characters")
-                        
-                        if self.verbose:
-                            chunk_text_preview = segment.text[:100] + "..." if len(segment.text) > 100 else segment.text
-                            self.logger.info(f"Chunk {i} transcribed: {len(segment.text)} chars - '{chunk_text_preview}'")
-                    else:
-                        failed_chunks += 1
-                        print(f"   ❌ Failed: {chunk_result.error_message}")
-                        if self.verbose:
-                            self.logger.warning(f"Chunk {i} failed: {chunk_result.error_message}")
-                    
-                    # Cleanup chunk file (but keep debug copy)
-                    chunk_path.unlink(missing_ok=True)
-                    
-                except Exception as e:
-                    failed_chunks += 1
-                    print("❌")  # Failure feedback for this chunk
-                    if self.verbose:
-                        self.logger.error(f"Chunk {i} processing error: {e}")
-                    else:
-                        print(f"   ❌ Error: {e}")
+                self.logger.info(f"Created {expected_chunks} chunks for processing")
+            
+            # Process chunks concurrently (bounded by max_concurrency)
+            chunk_segments = asyncio.run(
+                self._transcribe_chunks_async(chunks, language, prompt, expected_chunks)
+            )
+            # Chunks the splitter never produced count as failed
+            total_chunks = max(expected_chunks, len(chunk_segments))
+            segments = [segment for segment in chunk_segments if segment is not None]
+            failed_chunks = total_chunks - len(segments)
             
             # Show final chunking summary
-            print(f"\n📋 Chunking summary: {len(segments)} successful chunks out of {len(chunks)} total")
+            print(f"\n📋 Chunking summary: {len(segments)} successful chunks out of {total_chunks} total")
             if failed_chunks > 0:
                 print(f"⚠️  {failed_chunks} chunks failed")
             
@@ -1148,7 +2044,7 @@ class TranscriptionService:
                 segments=segments,
                 language=language,
                 model_used=self.model,
-                total_chunks=len(chunks),
+                total_chunks=total_chunks,
                 failed_chunks=failed_chunks
             )
             
@@ -1160,9 +2056,129 @@ class TranscriptionService:
                 segments=[],
                 error_message=f"Chunked transcription failed: {str(e)}"
             )
+        finally:
+            if owns_job_dir:
+                shutil.rmtree(job_dir, ignore_errors=True)
     
 
     
+    async def _transcribe_chunks_async(
+        self,
+        chunks: Union[Iterable[Tuple[Any, float, float]], AsyncIterable[Tuple[Any, float, float]]],
+        language: Optional[str],
+        prompt: Optional[str],
+        expected_chunks: int = 0
+    ) -> List[Optional[TranscriptionSegment]]:
+        """
+        Transcribe chunks in parallel, at most max_concurrency at a time.
+        
+        Chunks are pulled from the iterable (on a background thread for a blocking
+        iterable, on the event loop for an async one) and queued for the workers, so a lazily produced iterable (e.g. FFmpeg still segmenting)
+        overlaps production with upload. The queue is bounded, so production never
+        runs more than a couple of chunks ahead of the uploads.
+        
+        Returns:
+            One segment per chunk, in chunk order (None for failed chunks)
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+        results: Dict[int, Optional[TranscriptionSegment]] = {}
+        
+        def produce():
+            try:
+                for item in enumerate(chunks):
+                    asyncio.run_coroutine_threadsafe(queue.put(item), loop).result()
+            finally:
+                asyncio.run_coroutine_threadsafe(queue.put(None), loop).result()
+        
+        async def produce_async():
+            try:
+                i = 0
+                async for chunk in chunks:
+                    await queue.put((i, chunk))
+                    i += 1
+            finally:
+                await queue.put(None)
+        
+        async def worker():
+            while True:
+                item = await queue.get()
+                if item is None:
+                    # Leave the end marker for the other workers
+                    queue.put_nowait(None)
+                    return
+                i, chunk = item
+                results[i] = await asyncio.to_thread(
+                    self._transcribe_chunk, i, max(expected_chunks, i + 1), chunk, language, prompt
+                )
+        
+        producer = produce_async() if hasattr(chunks, '__aiter__') else asyncio.to_thread(produce)
+        
+        await asyncio.gather(
+            producer,
+            *(worker() for _ in range(self.max_concurrency))
+        )
+        return [results[i] for i in sorted(results)]
+    
+    def _transcribe_chunk(
+        self,
+        i: int,
+        total_chunks: int,
+        chunk: Tuple[Any, float, float],
+        language: Optional[str],
+        prompt: Optional[str]
+    ) -> Optional[TranscriptionSegment]:
+        """
+        Transcribe a single chunk and return its segment (None on failure).
+        Chunk files are left in place; the job directory is removed as a whole.
+        PyDub chunks are encoded in memory and uploaded without touching disk.
+        """
+        chunk_audio, start_time, end_time = chunk
+        
+        # Show progress to user
+        print(f"🔄 Processing chunk {i+1}/{total_chunks} ({start_time/60:.1f}m-{end_time/60:.1f}m)...")
+        try:
+            # Handle different chunk types
+            audio_data = None
+            if isinstance(chunk_audio, Path):
+                # FFmpeg or soundfile chunk - file already exists
+                chunk_path = chunk_audio
+            else:
+                # PyDub chunk - encode into memory; the path only names the upload
+                chunk_path = Path(f"chunk_{i:03d}.mp3")
+                buffer = io.BytesIO()
+                chunk_audio.export(buffer, format="mp3", bitrate="128k")
+                audio_data = buffer.getvalue()
+            
+            # Transcribe this chunk
+            chunk_result = self._transcribe_direct(
+                chunk_path, None, language, prompt, show_progress=False, audio_data=audio_data
+            )
+            
+            if chunk_result.success and chunk_result.segments:
+                # Adjust timing for chunk position
+                segment = chunk_result.segments[0]
+                segment.start_time = start_time
+                segment.end_time = end_time
+                print(f"   ✅ Chunk {i+1}: transcribed {len(segment.text)} characters")
+                
+                if self.verbose:
+                    chunk_text_preview = segment.text[:100] + "..." if len(segment.text) > 100 else segment.text
+                    self.logger.info(f"Chunk {i} transcribed: {len(segment.text)} chars - '{chunk_text_preview}'")
+                return segment
+            
+            print(f"   ❌ Chunk {i+1} failed: {chunk_result.error_message}")
+            if self.verbose:
+                self.logger.warning(f"Chunk {i} failed: {chunk_result.error_message}")
+                
+        except Exception as e:
+            if self.verbose:
+                self.logger.error(f"Chunk {i} processing error: {e}")
+            else:
+                print(f"   ❌ Chunk {i+1} error: {e}")
+        
+        return None
+    
     def _assemble_transcript_from_segments(self, segments: List[TranscriptionSegment]) -> str:
         """
         Assemble final transcript from segments, handling overlaps intelligently.
@@ -1177,13 +2193,27 @@ class TranscriptionService:
         sorted_segments = sorted(segments, key=lambda s: s.start_time)
         
         # Debug: show each segment info
-        for i, segment in enumerate(sorted_segments):
-            preview = segment.text[:100] + "..." if len(segment.text) > 100 else segment.text
-            print(f"   Segment {i+1}: {segment.start_time:.1f}s-{segment.end_time:.1f}s, {len(segment.text)} chars")
-            print(f"      Preview: '{preview}'")
+        if self.verbose and sorted_segments:
+            segment_lines = []
+            for i, segment in enumerate(sorted_segments):
+                preview = segment.text[:100] + "..." if len(segment.text) > 100 else segment.text
+                segment_lines.append(f"   Segment {i+1}: {segment.start_time:.1f}s-{segment.end_time:.1f}s, {len(segment.text)} chars")
+                segment_lines.append(f"      Preview: '{preview}'")
+            print("\n".join(segment_lines))
         
-        # Simple concatenation for now - could be enhanced with overlap detection
-        transcript_parts = [segment.text.strip() for segment in sorted_segments if segment.text.strip()]
+        # Concatenate, dropping words repeated where chunks overlap in time
+        transcript_parts = []
+        previous = None
+        for segment in sorted_segments:
+            text = segment.text.strip()
+            if not text:
+                continue
+            if previous is not None and RAPIDFUZZ_AVAILABLE and segment.start_time < previous.end_time:
+                text = self._trim_overlap(transcript_parts[-1], text, previous, segment)
+                if not text:
+                    continue
+            transcript_parts.append(text)
+            previous = segment
         
         print(f"📝 Final transcript parts: {len(transcript_parts)} non-empty segments")
         
@@ -1192,55 +2222,156 @@ class TranscriptionService:
         
         return full_text
     
+    def _trim_overlap(
+        self,
+        previous_text: str,
+        text: str,
+        previous: TranscriptionSegment,
+        segment: TranscriptionSegment
+    ) -> str:
+        """
+        Remove the start of text that repeats the end of previous_text.
+        
+        The compared window is sized from the time overlap and the previous
+        segment's speaking rate; rapidfuzz aligns it against the start of text and
+        a close match is cut off.
+        """
+        overlap_s = previous.end_time - segment.start_time
+        previous_duration = previous.end_time - previous.start_time
+        if overlap_s <= 0 or previous_duration <= 0:
+            return text
+        
+        chars_per_second = len(previous_text) / previous_duration
+        window = min(OVERLAP_WINDOW_CHARS, max(8, int(overlap_s * chars_per_second * 1.5)))
+        
+        tail = previous_text[-window:]
+        alignment = fuzz.partial_ratio_alignment(tail, text[:window * 2])
+        if alignment.score < OVERLAP_MATCH_THRESHOLD or alignment.dest_start > window // 2:
+            return text
+        
+        if self.verbose:
+            self.logger.info(f"Dropped {alignment.dest_end} repeated characters at {segment.start_time:.1f}s")
+        return text[alignment.dest_end:].lstrip(" ,.;:")
+    
     def _make_api_call_with_retry(
         self, 
         audio_file_path: Path, 
         language: Optional[str],
-        prompt: Optional[str]
+        prompt: Optional[str],
+        audio_data: Optional[bytes] = None
     ) -> Optional[Any]:
         """
-        Make API call with exponential backoff retry logic.
+        Make API call with full-jitter exponential backoff retry logic.
+        In-memory audio_data is uploaded from a fresh buffer on every attempt.
         """
-        for attempt in range(self.max_retries + 1):
+        # An open circuit (tripped by any chunk) is waited out rather than failing
+        # this chunk, for at most as long as the breaker could stay open across
+        # all of this call's attempts
+        circuit_deadline = time.monotonic() + self.circuit_breaker.reset_timeout * (self.max_retries + 1)
+        attempt = 0
+        while attempt <= self.max_retries:
             try:
                 if self.verbose and attempt > 0:
                     self.logger.info(f"Retry attempt {attempt}")
                 
-                # Make API call using UnifiedAPIClient
-                response = self.client.audio_transcription(
-                    file_path=str(audio_file_path),
-                    model=self.model,
-                    language=language,
-                    prompt=prompt,
-                    response_format="json",
-                    temperature=0.0
+                waited = self.rate_limiter.acquire()
+                if self.verbose and waited > 0:
+                    self.logger.info(f"Rate limited: waited {waited:.2f} seconds")
+                
+                # Make API call using UnifiedAPIClient; only transient errors trip
+                # the breaker. Permanent client errors (400/401/404) are about the
+                # request, and a 429 that says when to come back is throttling
+                response = self.circuit_breaker.call(
+                    lambda: self.client.audio_transcription(
+                        file_path=str(audio_file_path),
+                        model=self.model,
+                        language=language,
+                        prompt=prompt,
+                        response_format="json",
+                        temperature=0.0,
+                        file_obj=io.BytesIO(audio_data) if audio_data is not None else None
+                    ),
+                    counts_as_failure=lambda error: (
+                        self._is_retryable_error(error) and self._get_retry_after(error) is None
+                    )
                 )
                 return response
                 
+            except CircuitOpenError as e:
+                remaining = circuit_deadline - time.monotonic()
+                if remaining <= 0:
+                    if self.verbose:
+                        self.logger.error("API call failed: circuit still open")
+                    raise TranscriptionError("API call failed: circuit open")
+                delay = min(e.retry_after, remaining)
+                if self.verbose:
+                    self.logger.info(f"Circuit open: waiting {delay:.1f} seconds")
+                time.sleep(delay)
             except Exception as e:
-                error_msg = str(e).lower()
-                
-                # Check if this is a retryable error
-                is_retryable = any(keyword in error_msg for keyword in [
-                    'timeout', 'rate limit', '5', 'server error', 'connection'
-                ])
-                
-                if attempt < self.max_retries and is_retryable:
-                    delay = self.base_delay * (2 ** attempt)  # Exponential backoff
+                if attempt < self.max_retries and self._is_retryable_error(e):
                     if self.verbose:
                         self.logger.warning(f"API call failed (attempt {attempt + 1}): {e}")
-                        self.logger.info(f"Retrying in {delay} seconds...")
-                    time.sleep(delay)
+                    delay = self._sleep_backoff(attempt, self._get_retry_after(e))
+                    if self.verbose:
+                        self.logger.info(f"Backed off {delay:.1f} seconds before retrying")
+                    attempt += 1
                 else:
                     if self.verbose:
                         self.logger.error(f"API call failed after {attempt + 1} attempts: {e}")
                     raise TranscriptionError(f"API call failed: {e}")
-            finally:
-                # File handling is managed by UnifiedAPIClient
-                pass
         
         return None
     
+    def _is_retryable_error(self, error: Exception) -> bool:
+        """
+        Decide whether a failed API call is worth retrying.
+        
+        OpenAI errors are classified by exception type (rate limit, timeout,
+        connection and 5xx errors are transient, everything else such as 400/401/404
+        is permanent). Other providers wrap their errors, so they fall back to the
+        HTTP status code of the error or its cause, then to the message.
+        """
+        if isinstance(error, RETRYABLE_OPENAI_ERRORS):
+            return True
+        if OPENAI_AVAILABLE and isinstance(error, openai.APIError):
+            return False
+        
+        for candidate in (error, error.__cause__):
+            status_code = getattr(candidate, 'status_code', None) or getattr(candidate, 'code', None)
+            if isinstance(status_code, int):
+                return status_code in RETRYABLE_STATUS_CODES
+        
+        error_msg = str(error).lower()
+        return any(keyword in error_msg for keyword in RETRYABLE_ERROR_KEYWORDS)
+    
+    def _sleep_backoff(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Sleep using capped full-jitter backoff, honoring Retry-After when given.
+        
+        Returns:
+            The number of seconds slept
+        """
+        delay = random.uniform(0, min(self.max_backoff, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            delay = max(retry_after, delay)
+        time.sleep(delay)
+        return delay
+    
+    def _get_retry_after(self, error: Exception) -> Optional[float]:
+        """Extract the Retry-After header (in seconds) from an API error, if present."""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+        try:
+            return float(headers.get('retry-after'))
+        except (TypeError, ValueError):
+            return None
+    
+    def _file_size_mb(self, file_path: Path) -> float:
+        """Return a file's size in MB with a single stat call."""
+        return os.stat(file_path).st_size / (1024 * 1024)
+    
     def _cleanup_temp_file(self, file_path: Path):
         """Clean up temporary file."""
         try:
@@ -1250,6 +2381,17 @@ class TranscriptionService:
             if self.verbose:
                 self.logger.warning(f"Failed to cleanup temp file {file_path}: {e}")
     
+    def close(self):
+        """
+        Release the API client's pooled connections.
+        
+        The service keeps its HTTP connections open between calls, so reuse one
+        instance for many transcriptions and close it when done.
+        """
+        close_client = getattr(self.client, 'close', None)
+        if close_client:
+            close_client()
+    
     def cleanup_temp_dir(self):
         """Clean up temporary directory and all contents."""
         try:
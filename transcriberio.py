@@ -7,29 +7,81 @@ This module implements the main CLI using Click framework.
 """
 
 import os
+import re
 import sys
 import time
-import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 import click
 from dotenv import load_dotenv
 
 from downloader import YouTubeDownloader, DownloadResult, DownloadError
 from audio_metadata import create_metadata_manager
-from transcriber import create_transcription_service, TranscriptionError
-from entity_detector import create_entity_detector
-from entity_reviewer import create_entity_reviewer
+from transcriber import create_transcription_service, TranscriptionError, TranscriptionResult, METADATA_FILE
+from entity_detector import create_entity_detector, Entity, EntityDetectionResult
+from entity_reviewer import create_entity_reviewer, extract_transcript_body, save_entities_file
 from translator_normalizer import create_translator_normalizer
-from api_client import DEFAULT_TRANSCRIPTION_MODEL, DEFAULT_TEXT_MODEL, VALID_TRANSCRIPTION_MODELS
+from api_client import create_http_client, DEFAULT_TRANSCRIPTION_MODEL, DEFAULT_TEXT_MODEL, VALID_TRANSCRIPTION_MODELS
 from channel_manager import ChannelManager, is_channel_url
+from result_cache import create_result_cache, create_semantic_cache, sha256_file, sha256_text
+
+# Temporary files left in the working directory (debug_*.mp3, debug_*.txt, *.tmp),
+# matched in a single directory scan
+TEMP_FILE_PATTERN = re.compile(r'^(?:debug_.*\.(?:mp3|txt)|[^.].*\.tmp)$')
+
+# Parallel deletions during cleanup (overlaps unlink latency on network filesystems)
+CLEANUP_WORKERS = 8
+
+# Emoji and description of final output files, by name marker (first match wins:
+# reprocessed translations also contain "_translated_")
+OUTPUT_FILE_LABELS = (
+    ("_transcript.txt", "📝", "Original Transcription"),
+    ("_reprocessed.txt", "💡", "Reprocessed Translation (Enhanced)"),
+    ("_translated_", "🌍", "Initial Translation"),
+)
+
+# Width reserved for statistics that are only known once the transcript is written
+STAT_FIELD_WIDTH = 20
+
+# Write buffer for transcript files: header and text reach the disk in few write calls
+TRANSCRIPT_BUFFER_SIZE = 1024 * 1024
 
 # Load environment variables from .env.local automatically
 load_dotenv('.env.local')
 
 
+def _iter_files(directory: str, pattern: Optional[re.Pattern] = None) -> Iterator[str]:
+    """Yield paths of regular files in directory, optionally only names matching pattern."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and (pattern is None or pattern.match(entry.name)):
+                    yield entry.path
+    except FileNotFoundError:
+        return
+
+
+def _safe_unlink(file_path: str) -> bool:
+    """Delete a file, returning whether it was removed."""
+    try:
+        os.unlink(file_path)
+        return True
+    except Exception:
+        return False
+
+
+def _remove_files(file_paths: Iterable[str]) -> int:
+    """Delete files concurrently and return how many were removed."""
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        return sum(executor.map(_safe_unlink, file_paths))
+
+
 def cleanup_previous_run() -> None:
     """
     Clean up only temporary files from previous runs, preserving user outputs.
@@ -42,33 +94,9 @@ def cleanup_previous_run() -> None:
     - All files in output/ directory (final transcripts and translations)
     """
     try:
-        removed_count = 0
-        
-        # Clean downloads directory - these are all temporary
-        downloads_dir = Path("downloads")
-        if downloads_dir.exists():
-            for file_path in downloads_dir.iterdir():
-                if file_path.is_file():
-                    try:
-                        file_path.unlink()
-                        removed_count += 1
-                    except Exception:
-                        pass
-        
-        # Clean any debug files in root directory
-        temp_patterns = [
-            "debug_*.mp3",
-            "debug_*.txt",
-            "*.tmp"
-        ]
-        
-        for pattern in temp_patterns:
-            for file_path in Path(".").glob(pattern):
-                try:
-                    file_path.unlink()
-                    removed_count += 1
-                except Exception:
-                    pass
+        # Clean downloads directory - these are all temporary - and any
+        # debug files in root directory
+        removed_count = _remove_files([*_iter_files("downloads"), *_iter_files(".", TEMP_FILE_PATTERN)])
                     
         if removed_count > 0:
             click.echo(f"🧹 Cleaned up {removed_count} temporary files")
@@ -86,34 +114,14 @@ def cleanup_final_run(audio_id: str, keep_files: list) -> None:
         keep_files: List of file paths to preserve
     """
     try:
-        files_to_remove = []
-        
         # Clean downloads directory - remove all audio files and metadata
-        downloads_dir = Path("downloads")
-        if downloads_dir.exists():
-            for file_path in downloads_dir.iterdir():
-                if file_path.is_file():
-                    files_to_remove.append(file_path)
+        files_to_remove = [*_iter_files("downloads")]
         
         # Clean any debug files in root directory
-        temp_patterns = [
-            "debug_*.mp3",
-            "debug_*.txt", 
-            "*.tmp"
-        ]
-        
-        for pattern in temp_patterns:
-            for file_path in Path(".").glob(pattern):
-                files_to_remove.append(file_path)
+        files_to_remove.extend(_iter_files(".", TEMP_FILE_PATTERN))
         
         # Remove identified files
-        removed_count = 0
-        for file_path in files_to_remove:
-            try:
-                file_path.unlink()
-                removed_count += 1
-            except Exception:
-                pass
+        removed_count = _remove_files(files_to_remove)
                 
         if removed_count > 0:
             click.echo(f"🧹 Cleaned up {removed_count} temporary files")
@@ -141,48 +149,46 @@ def display_final_results(keep_files: list) -> None:
     click.echo("-" * 40)
     
     for file_path in keep_files:
-        if file_path.exists():
-            # Create clickable file URL
-            absolute_path = file_path.resolve()
-            file_url = f"file://{absolute_path}"
-            file_size = file_path.stat().st_size
-            
-            # Format file size
-            if file_size < 1024:
-                size_str = f"{file_size} B"
-            elif file_size < 1024 * 1024:
-                size_str = f"{file_size / 1024:.1f} KB"
-            else:
-                size_str = f"{file_size / (1024 * 1024):.1f} MB"
-            
-            # Determine file type emoji and description
-            if "_transcript.txt" in file_path.name:
-                emoji = "📝"
-                description = "Original Transcription"
-            elif "_reprocessed.txt" in file_path.name:
-                emoji = "💡"
-                description = "Reprocessed Translation (Enhanced)"
-            elif "_translated_" in file_path.name:
-                emoji = "🌍"
-                description = "Initial Translation"
-            else:
-                emoji = "📄"
-                description = "Output File"
-            
-            click.echo(f"{emoji} {description}: {size_str}")
-            click.echo(f"   {click.style(file_url, fg='blue', underline=True)}")
-            click.echo(f"   📁 {file_path.name}")
-            click.echo()
+        # One stat both checks existence and gives the size
+        try:
+            file_size = os.stat(file_path).st_size
+        except FileNotFoundError:
+            continue
+        
+        # Create clickable file URL
+        file_url = f"file://{os.path.abspath(file_path)}"
+        
+        # Format file size
+        if file_size < 1024:
+            size_str = f"{file_size} B"
+        elif file_size < 1024 * 1024:
+            size_str = f"{file_size / 1024:.1f} KB"
+        else:
+            size_str = f"{file_size / (1024 * 1024):.1f} MB"
+        
+        # Determine file type emoji and description
+        emoji, description = next(
+            (label for marker, *label in OUTPUT_FILE_LABELS if marker in file_path.name),
+            ("📄", "Output File")
+        )
+        
+        click.echo(f"{emoji} {description}: {size_str}")
+        click.echo(f"   {click.style(file_url, fg='blue', underline=True)}")
+        click.echo(f"   📁 {file_path.name}")
+        click.echo()
     
     click.echo("💡 Tip: Click or Cmd+Click the blue links above to open files directly!")
     click.echo("📁 Files are saved in the 'output' directory")
     click.echo("\n" + "="*60)
 
 
+@lru_cache(maxsize=1)
 def ensure_output_directory() -> Path:
     """
     Ensure the output directory exists and return its path.
     
+    Memoized: the directory is created once per process (cleanup never removes it).
+    
     Returns:
         Path object for the output directory
     """
@@ -205,6 +211,156 @@ def get_output_path(filename: str) -> Path:
     return output_dir / filename
 
 
+@lru_cache(maxsize=4)
+def _load_metadata_manager(metadata_file: str, mtime_ns: Optional[int]):
+    return create_metadata_manager(metadata_file)
+
+
+def _get_metadata_manager(metadata_file: str = METADATA_FILE):
+    """
+    Return a shared metadata manager for metadata_file.
+    
+    The parsed file is reused across calls until its modification time
+    changes (e.g. after a download added an entry), then parsed again.
+    """
+    try:
+        mtime_ns = os.stat(metadata_file).st_mtime_ns
+    except OSError:
+        mtime_ns = None
+    return _load_metadata_manager(metadata_file, mtime_ns)
+
+
+def _cache_key(content_hash: str, *parts: str) -> str:
+    """Build a cache key from a content hash and the settings that change the result."""
+    return "_".join([content_hash, *(part.replace("/", "_") for part in parts)])
+
+
+def _count_words_and_spaces(piece: str) -> Tuple[int, int]:
+    """Return (words, spaces) of a text piece (words split on any Unicode whitespace)."""
+    return len(piece.split()), piece.count(' ')
+
+
+def _write_counted(file_handle, pieces: Iterable[str]) -> Tuple[int, int, int]:
+    """
+    Write text pieces to a file in one pass.
+    
+    Returns:
+        (words, characters, characters without spaces) of the written text
+    """
+    words = chars = spaces = 0
+    in_word = False
+    for piece in pieces:
+        if not piece:
+            continue
+        file_handle.write(piece)
+        piece_words, piece_spaces = _count_words_and_spaces(piece)
+        words += piece_words
+        # A word split across two pieces was counted once in each
+        if in_word and not piece[0].isspace():
+            words -= 1
+        in_word = not piece[-1].isspace()
+        chars += len(piece)
+        spaces += piece_spaces
+    return words, chars, chars - spaces
+
+
+def _reserve_stat(file_handle, label: str) -> int:
+    """Write a label followed by a blank field and return the field position."""
+    file_handle.write(label)
+    position = file_handle.tell()
+    file_handle.write(" " * STAT_FIELD_WIDTH + "\n")
+    return position
+
+
+def _write_transcript_file(
+    output_path: Path,
+    trans_result: TranscriptionResult,
+    video_metadata,
+    generated_at: str
+) -> int:
+    """
+    Save a transcript with its metadata header and return its word count.
+    
+    The statistics are counted while the text is written and filled into
+    fields reserved in the header. The file is written under a temporary
+    name and renamed into place, so readers never see a partial transcript.
+    """
+    header = [
+        "="*80 + "\n",
+        "🎥 YOUTUBE VIDEO TRANSCRIPTION\n",
+        "="*80 + "\n\n",
+    ]
+    
+    if video_metadata:
+        header += [
+            "📺 VIDEO INFORMATION:\n",
+            "-" * 40 + "\n",
+            f"Title: {video_metadata.title}\n",
+            f"URL: {video_metadata.original_url}\n",
+            f"Uploader: {video_metadata.uploader}\n",
+            f"Duration: {video_metadata.duration}\n",
+        ]
+        if video_metadata.formatted_upload_date:
+            header.append(f"Upload Date: {video_metadata.formatted_upload_date}\n")
+        if video_metadata.view_count:
+            header.append(f"Views: {video_metadata.view_count:,}\n")
+        header += [
+            f"Audio Format: {video_metadata.audio_format.upper()}\n",
+            f"Audio Quality: {video_metadata.audio_quality.title()}\n",
+            f"Downloaded: {video_metadata.download_date}\n",
+            "\n",
+        ]
+    
+    header += [
+        "🤖 TRANSCRIPTION INFORMATION:\n",
+        "-" * 40 + "\n",
+        f"Audio ID: {trans_result.audio_id}\n",
+        f"Model: {trans_result.model_used}\n",
+        f"Processing Time: {trans_result.processing_time:.2f} seconds\n",
+        f"File Size: {trans_result.file_size_mb:.2f} MB\n",
+    ]
+    if trans_result.optimization_applied:
+        header.append(f"Optimization: {trans_result.optimization_applied.replace('_', ' ').title()}\n")
+    header += [
+        f"Generated: {generated_at}\n",
+        "\n",
+        "📊 TRANSCRIPT STATISTICS:\n",
+        "-" * 40 + "\n",
+    ]
+    
+    tmp_path = output_path.with_name(output_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=TRANSCRIPT_BUFFER_SIZE) as f:
+            # Write header with metadata in one call
+            f.writelines(header)
+            
+            words_field = _reserve_stat(f, "Total Words: ")
+            chars_field = _reserve_stat(f, "Total Characters: ")
+            no_space_field = _reserve_stat(f, "Characters (no spaces): ")
+            
+            total_minutes = video_metadata.duration_seconds / 60.0 if video_metadata else 0
+            wpm_field = _reserve_stat(f, "Words per Minute: ") if total_minutes > 0 else None
+            
+            f.writelines(["\n", "="*80 + "\n", "📝 TRANSCRIPT CONTENT:\n", "="*80 + "\n\n"])
+            word_count, char_count, no_space_count = _write_counted(f, trans_result.iter_text())
+            f.writelines(["\n\n", "="*80 + "\n", "End of Transcript\n", "="*80 + "\n"])
+            
+            for field, value in (
+                (words_field, f"{word_count:,}"),
+                (chars_field, f"{char_count:,}"),
+                (no_space_field, f"{no_space_count:,}"),
+                (wpm_field, f"{word_count / total_minutes:.1f}" if wpm_field is not None else None),
+            ):
+                if field is not None:
+                    f.seek(field)
+                    f.write(value.ljust(STAT_FIELD_WIDTH))
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return word_count
+
+
 def validate_output_directory(ctx, param, value: Optional[str]) -> Path:
     """
     Validate and create output directory if it doesn't exist.
@@ -240,7 +396,25 @@ def validate_output_directory(ctx, param, value: Optional[str]) -> Path:
         )
 
 
-def run_full_pipeline(url: str, verbose: bool = False) -> bool:
+# Pipeline messages waiting to be written to stdout in one call
+_pending_output = []
+
+
+def _echo(message: str = "", fg: Optional[str] = None, flush: bool = False) -> None:
+    """Queue a pipeline message, styled now and written at the next flush."""
+    _pending_output.append((click.style(message, fg=fg) if fg else message) + "\n")
+    if flush:
+        _flush_output()
+
+
+def _flush_output() -> None:
+    """Write queued pipeline messages (before anything else prints or prompts)."""
+    if _pending_output:
+        click.echo("".join(_pending_output), nl=False)
+        _pending_output.clear()
+
+
+def run_full_pipeline(url: str, verbose: bool = False, use_cache: bool = True) -> bool:
     """
     Run the complete transcription pipeline for a YouTube URL.
     
@@ -251,225 +425,197 @@ def run_full_pipeline(url: str, verbose: bool = False) -> bool:
     4. Interactive entity review
     5. Translate and normalize to Portuguese (Brazil)
     
+    Each step needs the previous step's output, so independent work is overlapped
+    instead: the API clients are set up while the audio downloads, and the
+    transcript file is written while entities are being detected.
+    
     Args:
         url: YouTube URL to process
         verbose: Enable verbose output
+        use_cache: Reuse cached transcripts, entities and translations
+            (--no-cache recomputes everything)
         
     Returns:
         True if successful, False otherwise
     """
+    http_client = None
     try:
         # Detect channel URL and delegate to channel flow
         if is_channel_url(url):
-            click.echo("📺 Detected channel URL. Starting channel processing flow...")
+            _echo("📺 Detected channel URL. Starting channel processing flow...", flush=True)
             manager = ChannelManager(base_dir="./downloads")
             # For this first version, process sequentially without translation/entities
             manager.process(url=url, max_videos=None, verbose=verbose)
-            click.echo("✅ Channel flow completed (resumable state saved under downloads/channels)")
+            _echo("✅ Channel flow completed (resumable state saved under downloads/channels)")
             return True
-        click.echo("🚀 Starting complete transcription pipeline")
-        click.echo("=" * 60)
-        
-        # Step 0: Clean up previous runs
-        cleanup_previous_run()
+        _echo("🚀 Starting complete transcription pipeline")
+        _echo("=" * 60)
         
-        # Step 1: Download
-        click.echo("\n📥 Step 1: Downloading audio from YouTube...")
+        # One timestamp for the transcript file, also when review rewrites it
+        generated_at = time.strftime('%Y-%m-%d %H:%M:%S')
         
-        # Create temporary downloader just for validation and video info
-        temp_downloader = YouTubeDownloader(
+        # One downloader for validation, video info and the download itself.
+        # Long videos are not downloaded at lower quality: the transcriber
+        # compresses and splits them in one streaming FFmpeg pass
+        downloader = YouTubeDownloader(
             output_directory="./downloads",
             audio_format="mp3",
-            audio_quality="best",  # temporary, will be changed
+            audio_quality="best",
             verbose=False
         )
         
-        # Validate URL
-        if not temp_downloader.validate_url(url):
-            click.echo(click.style("❌ Invalid YouTube URL", fg="red"))
+        # Validate URL (pattern check only, no network)
+        if not downloader.validate_url(url):
+            _echo("❌ Invalid YouTube URL", fg="red")
             return False
         
-        # Get video info
-        video_info = temp_downloader.get_video_info(url)
-        if video_info:
-            click.echo(f"📺 Title: {video_info.title}")
-            click.echo(f"⏱️  Duration: {video_info.duration}")
-            click.echo(f"👤 Uploader: {video_info.uploader}")
-        
-        # Smart download quality selection based on duration
-        download_quality = "best"  # default
-        if video_info and video_info.duration:
-            try:
-                # Parse duration to determine if we should use medium quality
-                duration_parts = video_info.duration.split(':')
-                if len(duration_parts) == 2:  # MM:SS
-                    total_minutes = int(duration_parts[0]) + int(duration_parts[1]) / 60
-                elif len(duration_parts) == 3:  # HH:MM:SS
-                    total_minutes = int(duration_parts[0]) * 60 + int(duration_parts[1]) + int(duration_parts[2]) / 60
-                else:
-                    total_minutes = 0
-                
-                # If video > 12 minutes, download in medium quality to avoid re-download later
-                if total_minutes > 12:
-                    download_quality = "medium"
-                    click.echo(f"📊 Video duration {total_minutes:.1f} minutes > 12 min - using medium quality to optimize processing")
-                
-            except (ValueError, IndexError):
-                # If parsing fails, use default quality
-                pass
-        
-        # Initialize downloader with smart quality selection
-        downloader = YouTubeDownloader(
-            output_directory="./downloads",
-            audio_format="mp3",
-            audio_quality=download_quality,  # Use smart quality selection
-            verbose=False
-        )
+        # One background worker runs the network-bound stage that nothing on
+        # this thread depends on yet
+        background = ThreadPoolExecutor(max_workers=1)
         
-        # Download
-        result = downloader.download_audio(url)
-        if not result.success:
-            click.echo(click.style("❌ Download failed", fg="red"))
-            return False
+        # Fetch video info (a yt-dlp round-trip) while the previous run is cleaned up
+        info_future = background.submit(downloader.get_video_info, url)
         
-        audio_id = result.audio_id
-        click.echo(f"✅ Downloaded: {audio_id}")
+        # Step 0: Clean up previous runs
+        _flush_output()
+        cleanup_previous_run()
+        # The cleanup removed the downloads metadata file the downloader loaded
+        downloader.metadata_manager.load_metadata()
         
-        # Step 2: Transcribe with entities and translation
-        click.echo("\n🎯 Step 2: Transcribing audio...")
+        # Step 1: Download
+        _echo("\n📥 Step 1: Downloading audio from YouTube...", flush=True)
         
-        # Load environment variables
-        try:
-            from dotenv import load_dotenv
-            load_dotenv('.env.local')
-        except ImportError:
-            pass  # dotenv is optional
+        # Get video info (flushed above: show progress before any blocking wait)
+        video_info = info_future.result()
+        if video_info:
+            _echo(f"📺 Title: {video_info.title}")
+            _echo(f"⏱️  Duration: {video_info.duration}")
+            _echo(f"👤 Uploader: {video_info.uploader}")
         
-        # Get API keys
+        # Get API keys before downloading, so a missing key fails fast
         api_key = os.getenv("OPENAI_API_KEY")
         openrouter_key = os.getenv("OPENROUTER_API_KEY")
         
         if not api_key:
-            click.echo(click.style("❌ OPENAI_API_KEY not found in environment", fg="red"))
+            _echo("❌ OPENAI_API_KEY not found in environment", fg="red")
+            background.shutdown()
             return False
             
         if not openrouter_key:
-            click.echo(click.style("❌ OPENROUTER_API_KEY not found in environment", fg="red"))
+            _echo("❌ OPENROUTER_API_KEY not found in environment", fg="red")
+            background.shutdown()
             return False
         
-        # Create transcription service
+        # Download in the background while the API clients are created
+        # (flush first: yt-dlp prints its own progress)
+        _flush_output()
+        download_future = background.submit(downloader.download_audio, url, video_info)
+        
+        # One connection pool for every stage, so later stages reuse the
+        # connections (and TLS sessions) opened by earlier ones
+        http_client = create_http_client()
         transcription_service = create_transcription_service(
             api_key=api_key,
             model=DEFAULT_TRANSCRIPTION_MODEL,
-            verbose=verbose
+            verbose=verbose,
+            http_client=http_client
+        )
+        # Passage-level cache shared by entity detection and translation
+        semantic_cache = create_semantic_cache() if use_cache else None
+        entity_detector = create_entity_detector(
+            verbose=verbose,
+            semantic_cache=semantic_cache,
+            http_client=http_client
         )
         
-        # Transcribe
-        trans_result = transcription_service.transcribe_audio(audio_id)
-        if not trans_result.success:
-            click.echo(click.style("❌ Transcription failed", fg="red"))
+        _flush_output()
+        result = download_future.result()
+        if not result.success:
+            _echo("❌ Download failed", fg="red")
+            background.shutdown()
             return False
         
-        click.echo(f"✅ Transcribed in {trans_result.processing_time:.1f}s")
+        audio_id = result.audio_id
+        _echo(f"✅ Downloaded: {audio_id}")
+        
+        # Step 2: Transcribe with entities and translation
+        _echo("\n🎯 Step 2: Transcribing audio...")
+        
+        # Identical audio (e.g. a re-run on the same URL) reuses its transcript
+        transcript_cache = create_result_cache("transcripts")
+        transcript_key = None
+        trans_result = None
+        if result.output_path and Path(result.output_path).exists():
+            transcript_key = _cache_key(sha256_file(result.output_path), DEFAULT_TRANSCRIPTION_MODEL)
+            cached = transcript_cache.get(transcript_key) if use_cache else None
+            if cached is not None:
+                trans_result = TranscriptionResult.from_dict(cached)
+                trans_result.audio_id = audio_id
+                _echo("♻️  Using cached transcription (same audio)")
+        
+        if trans_result is None:
+            # Transcribe
+            _flush_output()
+            trans_result = transcription_service.transcribe_audio(audio_id)
+            if not trans_result.success:
+                _echo("❌ Transcription failed", fg="red")
+                background.shutdown()
+                return False
+            
+            _echo(f"✅ Transcribed in {trans_result.processing_time:.1f}s")
+            # A transcript with failed chunks has gaps: retry it next run instead of caching
+            if transcript_key and not trans_result.failed_chunks:
+                transcript_cache.put(transcript_key, trans_result.to_dict())
+        
+        # Step 3 only needs the transcript text: start detecting entities now and
+        # write the transcript file while the API calls run
+        entity_cache = create_result_cache("entities")
+        entity_key = _cache_key(sha256_text(trans_result.full_transcript), entity_detector.model)
+        entity_result = None
+        entity_future = None
+        if len(trans_result.full_transcript) > 0:
+            cached = entity_cache.get(entity_key) if use_cache else None
+            if cached is not None:
+                entity_result = EntityDetectionResult(
+                    **{**cached, "entities": [Entity(**entity) for entity in cached["entities"]]}
+                )
+            else:
+                # Flush first: the detector prints its own progress in verbose mode
+                _flush_output()
+                entity_future = background.submit(entity_detector.detect_entities, trans_result.full_transcript)
+        background.shutdown(wait=False)
         
         # Save transcript
         output_path = get_output_path(f"{audio_id}_transcript.txt")
         
-        # Get metadata for rich output
-        metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
-        video_metadata = metadata_manager.get_metadata(audio_id)
+        # Get metadata for rich output (the downloader already holds it in memory)
+        video_metadata = downloader.metadata_manager.get_metadata(audio_id)
         
         # Save transcript with metadata
-        word_count = len(trans_result.full_transcript.split())
-        char_count = len(trans_result.full_transcript)
-        
-        with open(output_path, 'w', encoding='utf-8') as f:
-            # Write header with metadata
-            f.write("="*80 + "\n")
-            f.write("🎥 YOUTUBE VIDEO TRANSCRIPTION\n")
-            f.write("="*80 + "\n\n")
-            
-            if video_metadata:
-                f.write("📺 VIDEO INFORMATION:\n")
-                f.write("-" * 40 + "\n")
-                f.write(f"Title: {video_metadata.title}\n")
-                f.write(f"URL: {video_metadata.original_url}\n")
-                f.write(f"Uploader: {video_metadata.uploader}\n")
-                f.write(f"Duration: {video_metadata.duration}\n")
-                if video_metadata.upload_date:
-                    try:
-                        upload_date = datetime.strptime(video_metadata.upload_date, '%Y%m%d').strftime('%B %d, %Y')
-                        f.write(f"Upload Date: {upload_date}\n")
-                    except:
-                        f.write(f"Upload Date: {video_metadata.upload_date}\n")
-                if video_metadata.view_count:
-                    f.write(f"Views: {video_metadata.view_count:,}\n")
-                f.write(f"Audio Format: {video_metadata.audio_format.upper()}\n")
-                f.write(f"Audio Quality: {video_metadata.audio_quality.title()}\n")
-                f.write(f"Downloaded: {video_metadata.download_date}\n")
-                f.write("\n")
-            
-            f.write("🤖 TRANSCRIPTION INFORMATION:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Audio ID: {trans_result.audio_id}\n")
-            f.write(f"Model: {trans_result.model_used}\n")
-            f.write(f"Processing Time: {trans_result.processing_time:.2f} seconds\n")
-            f.write(f"File Size: {trans_result.file_size_mb:.2f} MB\n")
-            if trans_result.optimization_applied:
-                f.write(f"Optimization: {trans_result.optimization_applied.replace('_', ' ').title()}\n")
-            f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-            f.write("\n")
-            
-            f.write("📊 TRANSCRIPT STATISTICS:\n")
-            f.write("-" * 40 + "\n")
-            f.write(f"Total Words: {word_count:,}\n")
-            f.write(f"Total Characters: {char_count:,}\n")
-            f.write(f"Characters (no spaces): {len(trans_result.full_transcript.replace(' ', '')):,}\n")
-            
-            if video_metadata and video_metadata.duration:
-                try:
-                    duration_parts = video_metadata.duration.split(':')
-                    if len(duration_parts) == 2:
-                        total_minutes = int(duration_parts[0]) + int(duration_parts[1]) / 60
-                    elif len(duration_parts) == 3:
-                        total_minutes = int(duration_parts[0]) * 60 + int(duration_parts[1]) + int(duration_parts[2]) / 60
-                    else:
-                        total_minutes = 0
-                    
-                    if total_minutes > 0:
-                        words_per_minute = word_count / total_minutes
-                        f.write(f"Words per Minute: {words_per_minute:.1f}\n")
-                except:
-                    pass
-            f.write("\n")
-            
-            f.write("="*80 + "\n")
-            f.write("📝 TRANSCRIPT CONTENT:\n")
-            f.write("="*80 + "\n\n")
-            f.write(trans_result.full_transcript)
-            f.write("\n\n")
-            f.write("="*80 + "\n")
-            f.write("End of Transcript\n")
-            f.write("="*80 + "\n")
-        
-        click.echo(f"💾 Transcript saved to: {output_path}")
-        
-        # Step 3: Entity detection
-        click.echo("\n🔍 Step 3: Detecting entities...")
-        
-        if len(trans_result.full_transcript) == 0:
-            click.echo(click.style("⚠️  Entity detection skipped - empty transcript", fg="yellow"))
+        transcript_word_count = _write_transcript_file(output_path, trans_result, video_metadata, generated_at)
+        
+        _echo(f"💾 Transcript saved to: {output_path}")
+        
+        # Step 3: Entity detection (flushed before waiting for the detector)
+        _echo("\n🔍 Step 3: Detecting entities...", flush=True)
+        
+        if entity_future is None and entity_result is None:
+            _echo("⚠️  Entity detection skipped - empty transcript", fg="yellow")
         else:
-            entity_detector = create_entity_detector(verbose=verbose)
-            entity_result = entity_detector.detect_entities(trans_result.full_transcript)
+            if entity_future is not None:
+                entity_result = entity_future.result()
+                if not entity_result.error_message:
+                    entity_cache.put(entity_key, asdict(entity_result))
+            else:
+                _echo("♻️  Using cached entities (same transcript)")
             
             if entity_result.error_message:
-                click.echo(click.style(f"⚠️  Entity detection failed: {entity_result.error_message}", fg="yellow"))
+                _echo(f"⚠️  Entity detection failed: {entity_result.error_message}", fg="yellow")
                 if verbose:
-                    click.echo(f"📊 Transcript length: {len(trans_result.full_transcript)} chars")
-                    click.echo(f"📝 Transcript preview: {trans_result.full_transcript[:200]}...")
+                    _echo(f"📊 Transcript length: {len(trans_result.full_transcript)} chars")
+                    _echo(f"📝 Transcript preview: {trans_result.full_transcript[:200]}...")
             else:
-                click.echo(f"✅ Detected {entity_result.unique_entity_count} unique entities")
+                _echo(f"✅ Detected {entity_result.unique_entity_count} unique entities")
                 
                 # Save entities
                 entities_path = get_output_path(f"{audio_id}_transcript_entities.json")
@@ -479,51 +625,48 @@ def run_full_pipeline(url: str, verbose: bool = False) -> bool:
                     "unique_entities": entity_result.unique_entity_count,
                     "processing_time": entity_result.processing_time,
                     "model_used": entity_result.model_used,
-                    "entities_by_type": {
-                        entity_type: [
-                            {
-                                "text": entity.name,
-                                "start": 0,
-                                "end": 0,
-                                "confidence": None
-                            }
-                            for entity in entities
-                        ]
-                        for entity_type, entities in _group_entities_by_type(entity_result.entities).items()
-                    }
+                    "entities_by_type": _entities_json_by_type(entity_result.entities)
                 }
                 
-                with open(entities_path, 'w', encoding='utf-8') as f:
-                    json.dump(entities_data, f, indent=2, ensure_ascii=False)
+                save_entities_file(entities_path, entities_data)
                 
                 # Step 4: Entity review
-                click.echo("\n📝 Step 4: Interactive entity review...")
+                _echo("\n📝 Step 4: Interactive entity review...", flush=True)
                 try:
                     entity_reviewer = create_entity_reviewer(verbose=verbose)
                     review_result = entity_reviewer.review_entities(
                         entities_file=entities_path,
                         transcript_file=output_path,
-                        skip_review=False
+                        skip_review=False,
+                        transcript_text=trans_result.full_transcript
                     )
                     
                     if review_result.success and review_result.transcript_updated:
-                        click.echo(f"✅ Made {review_result.replacements_made} entity replacements")
+                        # Rewrite the transcript only when the review changed it
+                        trans_result.full_transcript = review_result.updated_transcript
+                        transcript_word_count = _write_transcript_file(output_path, trans_result, video_metadata, generated_at)
+                        _echo(f"✅ Made {review_result.replacements_made} entity replacements")
                     
                 except ImportError:
-                    click.echo(click.style("⚠️  Skipping review (inquirer not installed)", fg="yellow"))
+                    _echo("⚠️  Skipping review (inquirer not installed)", fg="yellow")
         
         # Step 5: Translation
-        click.echo("\n🌍 Step 5: Translation and normalization...")
+        _echo("\n🌍 Step 5: Translation and normalization...", flush=True)
         translated_file = None
         reprocessed_file = None
         try:
             translator = create_translator_normalizer(
-                verbose=verbose
+                verbose=verbose,
+                result_cache=create_result_cache("translations") if use_cache else None,
+                semantic_cache=semantic_cache,
+                http_client=http_client
             )
             
             translation_result = translator.translate_transcript(
                 transcript_file=output_path,
-                skip_translation=False
+                skip_translation=False,
+                transcript_text=trans_result.full_transcript,
+                word_count=transcript_word_count
             )
             
             if translation_result.success:
@@ -531,17 +674,17 @@ def run_full_pipeline(url: str, verbose: bool = False) -> bool:
                 translated_file = get_output_path(f"{audio_id}_translated_{translation_result.target_language}.txt")
                 success, reprocessed_file = translator.save_translated_transcript(translation_result, translated_file, output_path)
                 if success:
-                    click.echo(f"✅ Translated to {translation_result.target_language}")
+                    _echo(f"✅ Translated to {translation_result.target_language}")
                     if reprocessed_file:
-                        click.echo(f"📄 Initial translation: {translated_file}")
-                        click.echo(f"📄 Reprocessed translation: {reprocessed_file}")
+                        _echo(f"📄 Initial translation: {translated_file}")
+                        _echo(f"📄 Reprocessed translation: {reprocessed_file}")
                     else:
-                        click.echo(f"📄 Final file: {translated_file}")
+                        _echo(f"📄 Final file: {translated_file}")
             else:
-                click.echo(click.style("⚠️  Translation failed", fg="yellow"))
+                _echo("⚠️  Translation failed", fg="yellow")
                 
         except Exception as e:
-            click.echo(click.style(f"⚠️  Translation error: {e}", fg="yellow"))
+            _echo(f"⚠️  Translation error: {e}", fg="yellow")
         
         # Collect files to keep (only the essential outputs)
         keep_files = []
@@ -559,7 +702,7 @@ def run_full_pipeline(url: str, verbose: bool = False) -> bool:
             keep_files.append(reprocessed_file)
         
         # Step 6: Final cleanup and results display
-        click.echo("\n🧹 Step 6: Cleaning up temporary files...")
+        _echo("\n🧹 Step 6: Cleaning up temporary files...", flush=True)
         cleanup_final_run(audio_id, keep_files)
         
         # Cleanup transcription service temp files
@@ -574,21 +717,32 @@ def run_full_pipeline(url: str, verbose: bool = False) -> bool:
         return True
         
     except Exception as e:
-        click.echo(click.style(f"\n❌ Pipeline error: {e}", fg="red"))
+        _echo(f"\n❌ Pipeline error: {e}", fg="red")
         if verbose:
             import traceback
-            click.echo(traceback.format_exc())
+            _echo(traceback.format_exc())
         return False
+    finally:
+        _flush_output()
+        if http_client is not None:
+            http_client.close()
 
 
 def _group_entities_by_type(entities):
-    """Helper function to group entities by type."""
-    grouped = {}
-    for entity in entities:
-        if entity.type not in grouped:
-            grouped[entity.type] = []
-        grouped[entity.type].append(entity)
-    return grouped
+    """Helper function to group entities by type (types in sorted order)."""
+    ordered = sorted(entities, key=attrgetter("type"))
+    return {entity_type: [*group] for entity_type, group in groupby(ordered, key=attrgetter("type"))}
+
+
+def _entities_json_by_type(entities):
+    """Build the entities_by_type section of the entities JSON file."""
+    return {
+        entity_type: [
+            {"text": entity.name, "start": 0, "end": 0, "confidence": None}
+            for entity in group
+        ]
+        for entity_type, group in _group_entities_by_type(entities).items()
+    }
 
 
 @click.group(invoke_without_command=True)
@@ -795,7 +949,7 @@ def list() -> None:
     """
     try:
         # Load metadata from default location
-        metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
+        metadata_manager = _get_metadata_manager()
         
         summary = metadata_manager.get_summary_table()
         click.echo(summary)
@@ -826,7 +980,7 @@ def info(audio_id: str) -> None:
     """
     try:
         # Load metadata from default location
-        metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
+        metadata_manager = _get_metadata_manager()
         
         detailed_info = metadata_manager.get_detailed_info(audio_id)
         click.echo(detailed_info)
@@ -906,6 +1060,12 @@ def info(audio_id: str) -> None:
     is_flag=True,
     help="Skip translation step (used with --translate to use original text)"
 )
+@click.option(
+    "--parallel-chunks",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of chunks transcribed in parallel for long audio (default: TRANSCRIPTION_CONCURRENCY or 4)"
+)
 def transcribe(
     audio_input: str,
     model: str,
@@ -917,7 +1077,8 @@ def transcribe(
     detect_entities: bool,
     review_entities: bool,
     translate: bool,
-    skip_translation: bool
+    skip_translation: bool,
+    parallel_chunks: Optional[int]
 ) -> None:
     """
     Transcribe audio using OpenAI's gpt-4o-transcribe models.
@@ -927,10 +1088,11 @@ def transcribe(
     - A file path (e.g., audio.mp3)
     
     The system automatically optimizes file size and chunking strategy:
-    1. Videos >12 minutes: Auto-download in medium quality 
-    2. Files ≤25MB AND ≤12 minutes: Direct transcription (fastest)
-    3. Files >25MB: Audio compression 
-    4. Still >25MB OR >12 minutes: Intelligent chunking with minimal overlap
+    1. Files ≤25MB AND ≤12 minutes: Direct transcription (fastest)
+    2. Files >25MB: Audio compression 
+    3. Still >25MB OR >12 minutes: Intelligent chunking with minimal overlap
+       (compressed and split in one FFmpeg pass, each chunk transcribed as
+       soon as it is written)
     
     Optional processing pipeline:
     - --detect-entities: Detect named entities (people, places, etc.)
@@ -970,7 +1132,8 @@ def transcribe(
         transcription_service = create_transcription_service(
             api_key=api_key_to_use,
             model=model,
-            verbose=verbose
+            verbose=verbose,
+            max_concurrency=parallel_chunks
         )
         
         # Perform transcription
@@ -984,32 +1147,29 @@ def transcribe(
         )
         
         if result.success:
-            # Display success information
-            click.echo(click.style("✅ Transcription completed successfully!", fg="green"))
-            click.echo(f"🆔 Audio ID: {result.audio_id}")
-            click.echo(f"🤖 Model: {result.model_used}")
-            click.echo(f"⏱️  Processing time: {result.processing_time:.2f} seconds")
-            click.echo(f"📊 File size: {result.file_size_mb:.2f} MB")
+            # Display success information and the transcript in one write
+            summary = [
+                click.style("✅ Transcription completed successfully!", fg="green"),
+                f"🆔 Audio ID: {result.audio_id}",
+                f"🤖 Model: {result.model_used}",
+                f"⏱️  Processing time: {result.processing_time:.2f} seconds",
+                f"📊 File size: {result.file_size_mb:.2f} MB",
+            ]
             
             if result.optimization_applied:
-                click.echo(f"⚡ Optimization: {result.optimization_applied}")
+                summary.append(f"⚡ Optimization: {result.optimization_applied}")
             
             if result.total_chunks > 1:
-                click.echo(f"🧩 Chunks processed: {result.total_chunks}")
+                summary.append(f"🧩 Chunks processed: {result.total_chunks}")
                 if result.failed_chunks > 0:
-                    click.echo(
-                        click.style(f"⚠️  Failed chunks: {result.failed_chunks}", fg="yellow")
-                    )
+                    summary.append(click.style(f"⚠️  Failed chunks: {result.failed_chunks}", fg="yellow"))
             
             if result.language:
-                click.echo(f"🌐 Detected language: {result.language}")
+                summary.append(f"🌐 Detected language: {result.language}")
             
             # Display transcript
-            click.echo("\n" + "="*50)
-            click.echo("📝 TRANSCRIPT:")
-            click.echo("="*50)
-            click.echo(result.full_transcript)
-            click.echo("="*50)
+            summary += ["\n" + "="*50, "📝 TRANSCRIPT:", "="*50, result.full_transcript, "="*50]
+            click.echo("\n".join(summary))
             
             # Save to file in output directory
             if output:
@@ -1017,103 +1177,98 @@ def transcribe(
             else:
                 output_path = get_output_path(f"{result.audio_id}_transcript.txt")
             
+            # Text handed to the translator; None means read it back from output_path
+            transcript_text = result.full_transcript
+            transcript_word_count = None
+            
             try:
                 # Get video metadata for rich header information
-                metadata_manager = create_metadata_manager("downloads/audio_metadata.json")
+                metadata_manager = _get_metadata_manager()
                 video_metadata = metadata_manager.get_metadata(result.audio_id)
                 
                 # Calculate word and character statistics
-                word_count = len(result.full_transcript.split())
+                word_count, space_count = _count_words_and_spaces(result.full_transcript)
+                transcript_word_count = word_count
                 char_count = len(result.full_transcript)
-                char_count_no_spaces = len(result.full_transcript.replace(' ', ''))
+                char_count_no_spaces = char_count - space_count
                 
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write("="*80 + "\n")
-                    f.write("🎥 YOUTUBE VIDEO TRANSCRIPTION\n")
-                    f.write("="*80 + "\n\n")
-                    
-                    # Video Information Section
-                    if video_metadata:
-                        f.write("📺 VIDEO INFORMATION:\n")
-                        f.write("-" * 40 + "\n")
-                        f.write(f"Title: {video_metadata.title}\n")
-                        f.write(f"URL: {video_metadata.original_url}\n")
-                        f.write(f"Uploader: {video_metadata.uploader}\n")
-                        f.write(f"Duration: {video_metadata.duration}\n")
-                        if video_metadata.upload_date:
-                            # Format upload date nicely
-                            try:
-                                upload_date = datetime.strptime(video_metadata.upload_date, '%Y%m%d').strftime('%B %d, %Y')
-                                f.write(f"Upload Date: {upload_date}\n")
-                            except:
-                                f.write(f"Upload Date: {video_metadata.upload_date}\n")
-                        if video_metadata.view_count:
-                            f.write(f"Views: {video_metadata.view_count:,}\n")
-                        f.write(f"Audio Format: {video_metadata.audio_format.upper()}\n")
-                        f.write(f"Audio Quality: {video_metadata.audio_quality.title()}\n")
-                        f.write(f"Downloaded: {video_metadata.download_date}\n")
-                        f.write("\n")
-                    
-                    # Transcription Information Section
-                    f.write("🤖 TRANSCRIPTION INFORMATION:\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"Audio ID: {result.audio_id}\n")
-                    f.write(f"Model: {result.model_used}\n")
-                    f.write(f"Processing Time: {result.processing_time:.2f} seconds\n")
-                    f.write(f"File Size: {result.file_size_mb:.2f} MB\n")
-                    if result.optimization_applied:
-                        f.write(f"Optimization: {result.optimization_applied.replace('_', ' ').title()}\n")
-                    if result.total_chunks > 1:
-                        f.write(f"Chunks Processed: {result.total_chunks}\n")
-                        if result.failed_chunks > 0:
-                            f.write(f"Failed Chunks: {result.failed_chunks}\n")
-                    if result.language:
-                        f.write(f"Detected Language: {result.language}\n")
-                    f.write(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-                    f.write("\n")
-                    
-                    # Statistics Section
-                    f.write("📊 TRANSCRIPT STATISTICS:\n")
-                    f.write("-" * 40 + "\n")
-                    f.write(f"Total Words: {word_count:,}\n")
-                    f.write(f"Total Characters: {char_count:,}\n")
-                    f.write(f"Characters (no spaces): {char_count_no_spaces:,}\n")
-                    if video_metadata and video_metadata.duration:
-                        # Calculate words per minute if duration is available
-                        try:
-                            # Parse duration string (e.g., "33:29" or "1:23:45")
-                            duration_parts = video_metadata.duration.split(':')
-                            if len(duration_parts) == 2:  # MM:SS
-                                total_minutes = int(duration_parts[0]) + int(duration_parts[1]) / 60
-                            elif len(duration_parts) == 3:  # HH:MM:SS
-                                total_minutes = int(duration_parts[0]) * 60 + int(duration_parts[1]) + int(duration_parts[2]) / 60
-                            else:
-                                total_minutes = 0
-                            
-                            if total_minutes > 0:
-                                words_per_minute = word_count / total_minutes
-                                f.write(f"Words per Minute: {words_per_minute:.1f}\n")
-                        except:
-                            pass
-                    f.write("\n")
-                    
-                    # Transcript Content
-                    f.write("="*80 + "\n")
-                    f.write("📝 TRANSCRIPT CONTENT:\n")
-                    f.write("="*80 + "\n\n")
-                    f.write(result.full_transcript)
-                    f.write("\n\n")
-                    f.write("="*80 + "\n")
-                    f.write("End of Transcript\n")
-                    f.write("="*80 + "\n")
+                # Assemble the whole file and write it in one call
+                parts: List[str] = []
+                parts.append("="*80 + "\n")
+                parts.append("🎥 YOUTUBE VIDEO TRANSCRIPTION\n")
+                parts.append("="*80 + "\n\n")
+                
+                # Video Information Section
+                if video_metadata:
+                    parts.append("📺 VIDEO INFORMATION:\n")
+                    parts.append("-" * 40 + "\n")
+                    parts.append(f"Title: {video_metadata.title}\n")
+                    parts.append(f"URL: {video_metadata.original_url}\n")
+                    parts.append(f"Uploader: {video_metadata.uploader}\n")
+                    parts.append(f"Duration: {video_metadata.duration}\n")
+                    if video_metadata.formatted_upload_date:
+                        parts.append(f"Upload Date: {video_metadata.formatted_upload_date}\n")
+                    if video_metadata.view_count:
+                        parts.append(f"Views: {video_metadata.view_count:,}\n")
+                    parts.append(f"Audio Format: {video_metadata.audio_format.upper()}\n")
+                    parts.append(f"Audio Quality: {video_metadata.audio_quality.title()}\n")
+                    parts.append(f"Downloaded: {video_metadata.download_date}\n")
+                    parts.append("\n")
+                
+                # Transcription Information Section
+                parts.append("🤖 TRANSCRIPTION INFORMATION:\n")
+                parts.append("-" * 40 + "\n")
+                parts.append(f"Audio ID: {result.audio_id}\n")
+                parts.append(f"Model: {result.model_used}\n")
+                parts.append(f"Processing Time: {result.processing_time:.2f} seconds\n")
+                parts.append(f"File Size: {result.file_size_mb:.2f} MB\n")
+                if result.optimization_applied:
+                    parts.append(f"Optimization: {result.optimization_applied.replace('_', ' ').title()}\n")
+                if result.total_chunks > 1:
+                    parts.append(f"Chunks Processed: {result.total_chunks}\n")
+                    if result.failed_chunks > 0:
+                        parts.append(f"Failed Chunks: {result.failed_chunks}\n")
+                if result.language:
+                    parts.append(f"Detected Language: {result.language}\n")
+                parts.append(f"Generated: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
+                parts.append("\n")
+                
+                # Statistics Section
+                parts.append("📊 TRANSCRIPT STATISTICS:\n")
+                parts.append("-" * 40 + "\n")
+                parts.append(f"Total Words: {word_count:,}\n")
+                parts.append(f"Total Characters: {char_count:,}\n")
+                parts.append(f"Characters (no spaces): {char_count_no_spaces:,}\n")
+                if video_metadata and video_metadata.duration_seconds:
+                    # Calculate words per minute if duration is available
+                    words_per_minute = word_count / (video_metadata.duration_seconds / 60.0)
+                    parts.append(f"Words per Minute: {words_per_minute:.1f}\n")
+                parts.append("\n")
+                
+                # Transcript Content
+                parts.append("="*80 + "\n")
+                parts.append("📝 TRANSCRIPT CONTENT:\n")
+                parts.append("="*80 + "\n\n")
+                parts.append(result.full_transcript)
+                parts.append("\n\n")
+                parts.append("="*80 + "\n")
+                parts.append("End of Transcript\n")
+                parts.append("="*80 + "\n")
+                
+                with open(output_path, 'w', encoding='utf-8', buffering=TRANSCRIPT_BUFFER_SIZE) as f:
+                    f.writelines(parts)
                 
                 click.echo(f"\n💾 Transcript saved to: {output_path}")
                 
                 # Show segment information if verbose and multiple segments
                 if verbose and len(result.segments) > 1:
-                    click.echo(f"\n🧩 Segment details:")
-                    for i, segment in enumerate(result.segments):
-                        click.echo(f"  {i+1}. {segment.start_time:.1f}s-{segment.end_time:.1f}s: {segment.text[:50]}...")
+                    click.echo("\n".join([
+                        "\n🧩 Segment details:",
+                        *(
+                            f"  {i+1}. {segment.start_time:.1f}s-{segment.end_time:.1f}s: {segment.text[:50]}..."
+                            for i, segment in enumerate(result.segments)
+                        )
+                    ]))
                 
                 # Entity detection if requested (either explicit or via review)
                 if detect_entities or review_entities:
@@ -1138,22 +1293,10 @@ def transcribe(
                                 "unique_entities": entity_result.unique_entity_count,
                                 "processing_time": entity_result.processing_time,
                                 "model_used": entity_result.model_used,
-                                "entities_by_type": {
-                                    entity_type: [
-                                        {
-                                            "text": entity.name,
-                                            "start": 0,
-                                            "end": 0,
-                                            "confidence": None
-                                        }
-                                        for entity in entities
-                                    ]
-                                    for entity_type, entities in _group_entities_by_type(entity_result.entities).items()
-                                }
+                                "entities_by_type": _entities_json_by_type(entity_result.entities)
                             }
                             
-                            with open(entities_path, 'w', encoding='utf-8') as f:
-                                json.dump(entities_data, f, indent=2, ensure_ascii=False)
+                            save_entities_file(entities_path, entities_data)
                             
                             click.echo(f"💾 Entities saved to: {entities_path}")
                             
@@ -1170,6 +1313,9 @@ def transcribe(
                                     
                                     if review_result.success:
                                         if review_result.transcript_updated:
+                                            # The reviewed file now holds the corrected text
+                                            transcript_text = None
+                                            transcript_word_count = None
                                             click.echo(f"🔄 Transcript updated with {review_result.replacements_made} entity replacements")
                                         else:
                                             click.echo("📝 Entity review completed, no changes made")
@@ -1215,7 +1361,9 @@ def transcribe(
                     # Perform translation
                     translation_result = translator.translate_transcript(
                         transcript_file=output_path,
-                        skip_translation=skip_translation
+                        skip_translation=skip_translation,
+                        transcript_text=transcript_text,
+                        word_count=transcript_word_count
                     )
                     
                     if translation_result.success:
@@ -1357,7 +1505,7 @@ def entities(
         
         input_path = Path(input_file)
         
-        if input_path.exists() and input_path.is_file():
+        if input_path.is_file():
             # Input is a file path
             click.echo(f"📄 Reading transcript from: {input_path}")
             with open(input_path, 'r', encoding='utf-8') as f:
@@ -1369,32 +1517,21 @@ def entities(
             possible_transcript_output = Path(f"output/{input_file}_transcript.txt")
             possible_transcript_current = Path(f"{input_file}_transcript.txt")
             
+            # Open the first candidate that exists (no separate existence probe)
             transcript_file = None
-            if possible_transcript_output.exists():
-                transcript_file = possible_transcript_output
-            elif possible_transcript_current.exists():
-                transcript_file = possible_transcript_current
+            for candidate in (possible_transcript_output, possible_transcript_current):
+                try:
+                    with open(candidate, 'r', encoding='utf-8') as f:
+                        content = f.read()
+                except FileNotFoundError:
+                    continue
+                transcript_file = candidate
+                break
             
             if transcript_file:
                 click.echo(f"📄 Found transcript file: {transcript_file}")
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                    # Extract just the transcript content (after the last === line)
-                    lines = content.split('\n')
-                    transcript_start = -1
-                    for i, line in enumerate(lines):
-                        if '📝 TRANSCRIPT CONTENT:' in line:
-                            transcript_start = i + 2  # Skip the === line after
-                            break
-                    
-                    if transcript_start > 0:
-                        transcript_content = '\n'.join(lines[transcript_start:])
-                        # Remove ending markers
-                        if 'End of Transcript' in transcript_content:
-                            transcript_content = transcript_content.split('End of Transcript')[0]
-                        transcript_content = transcript_content.strip()
-                    else:
-                        transcript_content = content
+                # Extract just the transcript content (after the last === line)
+                transcript_content = extract_transcript_body(content)
                 audio_id = input_file
             else:
                 click.echo(
@@ -1444,22 +1581,10 @@ def entities(
                 "processing_time": entity_result.processing_time,
                 "model_used": entity_result.model_used,
                 "generated": time.strftime('%Y-%m-%d %H:%M:%S'),
-                "entities_by_type": {
-                    entity_type: [
-                        {
-                            "text": entity.name,
-                            "start": 0,
-                            "end": 0,
-                            "confidence": None
-                        }
-                        for entity in entities
-                    ]
-                    for entity_type, entities in _group_entities_by_type(entity_result.entities).items()
-                }
+                "entities_by_type": _entities_json_by_type(entity_result.entities)
             }
             
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(entities_data, f, indent=2, ensure_ascii=False)
+            save_entities_file(output_path, entities_data)
             
             click.echo(f"\n💾 Entities saved to: {output_path}")
             
@@ -1835,10 +1960,13 @@ if __name__ == "__main__":
             )
             sys.exit(0)
     
-    # Check if called with just a URL
-    if len(sys.argv) == 2 and (sys.argv[1].startswith('http') or 'youtube.com' in sys.argv[1] or 'youtu.be' in sys.argv[1]):
+    # Check if called with just a URL (optionally with --no-cache, which only
+    # exists for this direct pipeline; click rejects it everywhere else)
+    pipeline_args = [arg for arg in sys.argv[1:] if arg != '--no-cache']
+    use_cache = len(pipeline_args) == len(sys.argv) - 1
+    if len(pipeline_args) == 1 and (pipeline_args[0].startswith('http') or 'youtube.com' in pipeline_args[0] or 'youtu.be' in pipeline_args[0]):
         # Run full pipeline directly
-        success = run_full_pipeline(sys.argv[1], verbose=False)
+        success = run_full_pipeline(pipeline_args[0], verbose=False, use_cache=use_cache)
         sys.exit(0 if success else 1)
     else:
         # Normal CLI mode
@@ -5,20 +5,21 @@ This module provides functionality for translating and idiomatically normalizing
 transcripts using GPT-4.1 with intelligent chunking and regional language variants.
 """
 
+import importlib.util
 import os
 import time
 import json
 import math
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, asdict
 
-try:
-    import inquirer
-    INQUIRER_AVAILABLE = True
-except ImportError:
-    INQUIRER_AVAILABLE = False
+from result_cache import ResultCache, SemanticCache, sha256_text
+
+# inquirer is only needed for interactive prompts: check for it here and
+# import it where it is used, so non-interactive runs skip its import cost
+INQUIRER_AVAILABLE = importlib.util.find_spec("inquirer") is not None
 
 try:
     from api_client import create_api_client, DEFAULT_TEXT_MODEL
@@ -65,6 +66,7 @@ class TranslationResult:
     error_message: Optional[str] = None
     initial_translation: Optional[str] = None  # Store initial translation before reprocessing
     reprocessed: bool = False  # Flag to indicate if text was reprocessed
+    failed_chunks: int = 0  # Chunks left untranslated or unreprocessed
 
 
 class TranslatorNormalizer:
@@ -81,7 +83,10 @@ class TranslatorNormalizer:
         model: str = DEFAULT_TEXT_MODEL,
         max_retries: int = 3,
         verbose: bool = False,
-        provider: Optional[str] = None
+        provider: Optional[str] = None,
+        result_cache: Optional[ResultCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        http_client: Optional[Any] = None
     ):
         """
         Initialize the translator.
@@ -91,6 +96,11 @@ class TranslatorNormalizer:
             model: Model to use (gpt-4.1 recommended for context size)
             max_retries: Maximum number of retry attempts
             verbose: Enable detailed logging
+            result_cache: Cache of finished translations keyed by transcript
+                hash, target language and model (no caching if None)
+            semantic_cache: Passage cache reused for individual chunks
+                (exact matches only, per target language and model)
+            http_client: httpx.Client shared with other pipeline stages (optional)
         """
         if not API_CLIENT_AVAILABLE:
             raise ImportError(
@@ -106,6 +116,8 @@ class TranslatorNormalizer:
         self.max_retries = max_retries
         self.verbose = verbose
         self.provider = provider
+        self.result_cache = result_cache
+        self.semantic_cache = semantic_cache
         
         # GPT-4.1 context limits
         self.max_input_tokens = 1000000  # 1M tokens context window
@@ -117,7 +129,8 @@ class TranslatorNormalizer:
             provider=provider,
             model=model,
             api_key=api_key,
-            verbose=verbose
+            verbose=verbose,
+            http_client=http_client
         )
         
         # Define supported languages with regional variants
@@ -147,7 +160,9 @@ class TranslatorNormalizer:
     def translate_transcript(
         self, 
         transcript_file: Path,
-        skip_translation: bool = False
+        skip_translation: bool = False,
+        transcript_text: Optional[str] = None,
+        word_count: Optional[int] = None
     ) -> TranslationResult:
         """
         Translate and normalize a transcript file.
@@ -155,6 +170,8 @@ class TranslatorNormalizer:
         Args:
             transcript_file: Path to transcript file
             skip_translation: If True, skip translation and use original
+            transcript_text: Transcript already in memory (the file is not read)
+            word_count: Word count of transcript_text, if the caller already has it
             
         Returns:
             TranslationResult with translation details
@@ -163,7 +180,10 @@ class TranslatorNormalizer:
         
         try:
             # Load transcript content
-            original_text = self._load_transcript_content(transcript_file)
+            if transcript_text is not None:
+                original_text = transcript_text.strip()
+            else:
+                original_text = self._load_transcript_content(transcript_file)
             if not original_text:
                 return TranslationResult(
                     success=False,
@@ -178,10 +198,14 @@ class TranslatorNormalizer:
                     error_message="Could not load transcript content"
                 )
             
+            # Count the source words once (or reuse the caller's count of the same text)
+            if word_count is None or transcript_text is None:
+                word_count = len(original_text.split())
+            
             print(f"\n🌍 Translation and Normalization")
             print(f"📄 Source: {transcript_file.name}")
             print(f"📊 Text length: {len(original_text)} characters")
-            print(f"📝 Word count: {len(original_text.split())} words")
+            print(f"📝 Word count: {word_count} words")
             
             if skip_translation:
                 print("⏭️  Skipping translation - using original text")
@@ -193,8 +217,8 @@ class TranslatorNormalizer:
                     chunks_processed=0,
                     total_chunks=0,
                     processing_time=time.time() - start_time,
-                    word_count_original=len(original_text.split()),
-                    word_count_translated=len(original_text.split())
+                    word_count_original=word_count,
+                    word_count_translated=word_count
                 )
             
             # Language selection
@@ -209,11 +233,20 @@ class TranslatorNormalizer:
                     chunks_processed=0,
                     total_chunks=0,
                     processing_time=time.time() - start_time,
-                    word_count_original=len(original_text.split()),
+                    word_count_original=word_count,
                     word_count_translated=0,
                     error_message="Translation cancelled by user"
                 )
             
+            # Same transcript, language and model: reuse the finished translation
+            cache_key = None
+            if self.result_cache is not None:
+                cache_key = f"{sha256_text(original_text)}_{target_language}_{self.model.replace('/', '_')}"
+                cached = self.result_cache.get(cache_key)
+                if cached is not None:
+                    print(f"♻️  Using cached {target_language} translation")
+                    return TranslationResult(**cached)
+            
             # Test API connectivity with gpt-4.1
             if self.verbose:
                 print(f"🔍 Testing API connectivity with gpt-4.1...")
@@ -237,7 +270,7 @@ class TranslatorNormalizer:
                     chunks_processed=0,
                     total_chunks=0,
                     processing_time=time.time() - start_time,
-                    word_count_original=len(original_text.split()),
+                    word_count_original=word_count,
                     word_count_translated=0,
                     error_message=f"gpt-4.1 connectivity failed: {e}"
                 )
@@ -248,13 +281,31 @@ class TranslatorNormalizer:
             
             # Translate chunks
             translated_chunks = []
+            failed_chunks = 0
             for i, chunk in enumerate(chunks):
                 print(f"🔄 Translating chunk {i+1}/{len(chunks)}...")
                 
                 if self.verbose:
                     print(f"   📝 Chunk text preview: {chunk.text[:100]}...")
                 
-                translated_text = self._translate_chunk(chunk.text, target_language)
+                # A near-duplicate passage would need its own translation, so
+                # chunks are only reused when the source text is identical
+                chunk_namespace = f"translation:{target_language}:{self.model}"
+                cached_chunk = (
+                    self.semantic_cache.get(chunk_namespace, chunk.text, semantic=False)
+                    if self.semantic_cache is not None else None
+                )
+                if cached_chunk is not None:
+                    translated_text = cached_chunk["text"]
+                    if self.verbose:
+                        print(f"   💾 Chunk {i+1} reused from cache")
+                else:
+                    translated_text = self._translate_chunk(chunk.text, target_language)
+                    # Only real translations are cached, never the original-text fallback
+                    if translated_text and self.semantic_cache is not None:
+                        self.semantic_cache.put(
+                            chunk_namespace, chunk.text, {"text": translated_text}, semantic=False
+                        )
                 
                 if self.verbose:
                     print(f"   🔙 Returned from _translate_chunk")
@@ -266,6 +317,7 @@ class TranslatorNormalizer:
                 else:
                     print(f"   ⚠️  Chunk {i+1} failed, using original")
                     translated_chunks.append(chunk.text)
+                    failed_chunks += 1
             
             # Reconstruct final text
             final_translated_text = self._reconstruct_text(translated_chunks)
@@ -279,7 +331,7 @@ class TranslatorNormalizer:
                 chunks_processed=len(translated_chunks),
                 total_chunks=len(chunks),
                 processing_time=time.time() - start_time,
-                word_count_original=len(original_text.split()),
+                word_count_original=word_count,
                 word_count_translated=len(final_translated_text.split()),
                 model_used=self.model
             )
@@ -294,7 +346,7 @@ class TranslatorNormalizer:
             total_processing_time = initial_translation_result.processing_time + reprocessing_result.processing_time
             
             # Return the reprocessed result with combined metadata
-            return TranslationResult(
+            final_result = TranslationResult(
                 success=True,
                 target_language=target_language,
                 original_text=original_text,
@@ -302,12 +354,17 @@ class TranslatorNormalizer:
                 chunks_processed=len(translated_chunks),
                 total_chunks=len(chunks),
                 processing_time=total_processing_time,
-                word_count_original=len(original_text.split()),
+                word_count_original=word_count,
                 word_count_translated=len(reprocessing_result.translated_text.split()),
                 model_used=self.model,
                 initial_translation=final_translated_text,  # Store the initial translation
-                reprocessed=True
+                reprocessed=True,
+                failed_chunks=failed_chunks + reprocessing_result.failed_chunks
             )
+            # Results with untranslated or unreprocessed (fallback) chunks are retried next run
+            if cache_key is not None and not final_result.failed_chunks:
+                self.result_cache.put(cache_key, asdict(final_result))
+            return final_result
             
         except Exception as e:
             return TranslationResult(
@@ -334,15 +391,14 @@ class TranslatorNormalizer:
             transcript_start = -1
             
             for i, line in enumerate(lines):
-                if '📝 TRANSCRIPT CONTENT:' in line:
+                if line.startswith('📝 TRANSCRIPT CONTENT:'):
                     transcript_start = i + 2  # Skip the === line
                     break
             
             if transcript_start > 0:
                 transcript_content = '\n'.join(lines[transcript_start:])
                 # Remove ending markers
-                if 'End of Transcript' in transcript_content:
-                    transcript_content = transcript_content.split('End of Transcript')[0]
+                transcript_content = transcript_content.split('\nEnd of Transcript', 1)[0]
                 return transcript_content.strip()
             
             # Fallback: use entire content
@@ -372,6 +428,8 @@ class TranslatorNormalizer:
     
     def _select_target_language(self) -> str:
         """Interactive language selection with navigation."""
+        import inquirer
+        
         print(f"\n🌍 Language Selection")
         print(f"Choose target language for translation and normalization:")
         
@@ -476,14 +534,14 @@ class TranslatorNormalizer:
         # It's not perfect but works reasonably well for this use case
         return re.split(r'(?<!\w\.\w.)(?<![A-Z][a-z]\.)(?<=\.|\?|\!)\s', text)
 
-    def _translate_chunk(self, chunk_text: str, target_language: str) -> str:
-        """Translates a single chunk of text using the specified language."""
+    def _translate_chunk(self, chunk_text: str, target_language: str) -> Optional[str]:
+        """Translates a single chunk of text using the specified language (None if it failed)."""
         
         lang_info = next((l for l in self.languages if l.code == target_language), None)
         if not lang_info:
             if self.verbose:
                 print(f"   ⚠️ Unknown language '{target_language}', using original text.")
-            return chunk_text
+            return None
         
         if self.verbose:
             print(f"   🌍 Target: {lang_info.display_name()}")
@@ -577,24 +635,27 @@ TRANSLATED TEXT:"""
                 if self.verbose:
                     print(f"   ⚠️  Translation attempt {attempt + 1} failed: {e}")
                 if attempt == self.max_retries - 1:
-                    return chunk_text  # Return original on final failure
+                    return None  # Caller falls back to the original text
                 time.sleep(2 ** attempt)  # Exponential backoff
         
-        return chunk_text
+        return None
     
     def _reconstruct_text(self, translated_chunks: List[str]) -> str:
         """Reconstruct final text from translated chunks."""
         # Join chunks with single space instead of line breaks for continuous text
         return " ".join(chunk.strip() for chunk in translated_chunks if chunk.strip())
 
-    def _reprocess_chunk(self, chunk_text: str, target_language: str) -> str:
-        """Reprocesses a translated chunk to make it more natural and less literal."""
+    def _reprocess_chunk(self, chunk_text: str, target_language: str) -> Optional[str]:
+        """
+        Reprocesses a translated chunk to make it more natural and less literal.
+        Returns None if the chunk could not be reprocessed.
+        """
         
         lang_info = next((l for l in self.languages if l.code == target_language), None)
         if not lang_info:
             if self.verbose:
                 print(f"   ⚠️ Unknown language '{target_language}', using original text.")
-            return chunk_text
+            return None
         
         if self.verbose:
             print(f"   🔄 Reprocessing for: {lang_info.display_name()}")
@@ -684,10 +745,10 @@ IMPROVED TEXT:"""
                 if self.verbose:
                     print(f"   ⚠️  Reprocessing attempt {attempt + 1} failed: {e}")
                 if attempt == self.max_retries - 1:
-                    return chunk_text  # Return original on final failure
+                    return None
                 time.sleep(2 ** attempt)  # Exponential backoff
         
-        return chunk_text
+        return None
 
     def reprocess_translation(self, translated_text: str, target_language: str) -> TranslationResult:
         """
@@ -716,6 +777,7 @@ IMPROVED TEXT:"""
             print(f"🧩 Created {len(chunks)} chunks for reprocessing")
         
         reprocessed_chunks = []
+        failed_chunks = 0
         
         for i, chunk in enumerate(chunks, 1):
             if self.verbose:
@@ -728,9 +790,15 @@ IMPROVED TEXT:"""
             
             if self.verbose:
                 print(f"   🔙 Returned from _reprocess_chunk")
-                print(f"   ✅ Chunk {i} completed ({len(reprocessed_chunk)} chars)")
             
-            reprocessed_chunks.append(reprocessed_chunk)
+            if reprocessed_chunk:
+                reprocessed_chunks.append(reprocessed_chunk)
+                if self.verbose:
+                    print(f"   ✅ Chunk {i} completed ({len(reprocessed_chunk)} chars)")
+            else:
+                print(f"   ⚠️  Chunk {i} reprocessing failed, keeping translation")
+                reprocessed_chunks.append(chunk.text)
+                failed_chunks += 1
         
         # Reconstruct final text
         final_text = self._reconstruct_text(reprocessed_chunks)
@@ -750,7 +818,8 @@ IMPROVED TEXT:"""
             word_count_translated=word_count_reprocessed,
             chunks_processed=len(reprocessed_chunks),
             total_chunks=len(chunks),
-            original_text=translated_text  # Store the original translated text
+            original_text=translated_text,  # Store the original translated text
+            failed_chunks=failed_chunks
         )
         
         if self.verbose:
@@ -778,8 +847,7 @@ IMPROVED TEXT:"""
             # If this is a reprocessed result, save the initial translation first
             if result.reprocessed and result.initial_translation:
                 # Save initial translation
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    self._write_translation_file(f, result, result.initial_translation, original_transcript_file, is_initial=True)
+                self._write_translation_atomic(output_file, result, result.initial_translation, original_transcript_file, is_initial=True)
                 
                 # Create reprocessed filename
                 file_stem = output_file.stem
@@ -787,8 +855,7 @@ IMPROVED TEXT:"""
                 reprocessed_file = output_file.parent / f"{file_stem}_reprocessed{file_suffix}"
                 
                 # Save reprocessed translation
-                with open(reprocessed_file, 'w', encoding='utf-8') as f:
-                    self._write_translation_file(f, result, result.translated_text, original_transcript_file, is_initial=False)
+                self._write_translation_atomic(reprocessed_file, result, result.translated_text, original_transcript_file, is_initial=False)
                 
                 if self.verbose:
                     print(f"📄 Initial translation saved: {output_file}")
@@ -796,8 +863,7 @@ IMPROVED TEXT:"""
                 
             else:
                 # Save regular translation
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    self._write_translation_file(f, result, result.translated_text, original_transcript_file, is_initial=False)
+                self._write_translation_atomic(output_file, result, result.translated_text, original_transcript_file, is_initial=False)
                 
                 if self.verbose:
                     print(f"📄 Translation saved: {output_file}")
@@ -809,6 +875,24 @@ IMPROVED TEXT:"""
                 print(f"Error saving translated transcript: {e}")
             return False, None
 
+    def _write_translation_atomic(
+        self,
+        output_file: Path,
+        result: TranslationResult,
+        content: str,
+        original_transcript_file: Optional[Path],
+        is_initial: bool
+    ) -> None:
+        """Write a translation file under a temporary name and rename it into place."""
+        tmp_file = output_file.with_name(output_file.name + '.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                self._write_translation_file(f, result, content, original_transcript_file, is_initial)
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+
     def _write_translation_file(
         self, 
         file_handle, 
@@ -882,7 +966,10 @@ def create_translator_normalizer(
     api_key: Optional[str] = None,
     model: str = DEFAULT_TEXT_MODEL,
     verbose: bool = False,
-    provider: Optional[str] = None
+    provider: Optional[str] = None,
+    result_cache: Optional[ResultCache] = None,
+    semantic_cache: Optional[SemanticCache] = None,
+    http_client: Optional[Any] = None
 ) -> TranslatorNormalizer:
     """
     Factory function to create a TranslatorNormalizer instance.
@@ -892,6 +979,9 @@ def create_translator_normalizer(
         model: Model to use for translation
         verbose: Enable verbose logging
         provider: API provider (automatically detected from model if not specified)
+        result_cache: Cache of finished translations (optional)
+        semantic_cache: Cache of translated chunks (optional)
+        http_client: Shared HTTP connection pool (optional)
         
     Returns:
         Configured TranslatorNormalizer instance
@@ -900,5 +990,8 @@ def create_translator_normalizer(
         api_key=api_key,
         model=model,
         verbose=verbose,
-        provider=provider
+        provider=provider,
+        result_cache=result_cache,
+        semantic_cache=semantic_cache,
+        http_client=http_client
     ) 
\ No newline at end of file